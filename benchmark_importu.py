@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark czasu importu modułów obliczeniowych z porównaniem do wzorca.
+
+Generator, silniki przepływu i formaty plików mają się importować z samym
+NumPy - matplotlib i networkx są ładowane dopiero przy rysowaniu lub
+konwersji do grafu networkx. Każdy pomiar to import modułu w świeżym
+interpreterze (bez pamięci podręcznej modułów), a wynikiem jest mediana
+z kilku powtórzeń i lista załadowanych ciężkich pakietów.
+
+Regresją jest załadowanie któregoś z ZAKAZANYCH pakietów przy imporcie
+modułu rdzenia albo - z opcją --baseline - czas importu ponad tolerancję
+względem wzorca. Regresje kończą program kodem 1.
+
+Użycie:
+    python benchmark_importu.py --zapisz-baseline wzorzec_importu.json
+    python benchmark_importu.py --baseline wzorzec_importu.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+MODULY_RDZENIA = (
+    'siec_csr',
+    'zadanie1_siec_przeplywowa',
+    'zadanie2_ford_fulkerson',
+    'format_binarny',
+    'format_dimacs',
+    'magazyn_sieci',
+    'weryfikacja',
+    'przeplyw_warstwowy',
+    'uklad_warstwowy',
+    'drzewo_gomory_hu',
+    'wsadowe',
+)
+ZAKAZANE = ('matplotlib', 'networkx')
+POWTORZENIA = 5
+
+# Kod wykonywany w świeżym interpreterze: czas samego importu (bez startu Pythona)
+_POMIAR = """
+import json, sys, time
+start = time.perf_counter()
+import {modul}
+czas = time.perf_counter() - start
+print(json.dumps({{'czas': czas, 'ciezkie': sorted(p for p in {zakazane!r} if p in sys.modules)}}))
+"""
+
+
+def zmierz_import(modul: str, powtorzenia: int = POWTORZENIA) -> Dict:
+    """
+    Mierzy import modułu w świeżych interpreterach.
+    
+    Returns:
+        Słownik: id (nazwa modułu), czas_importu (mediana w sekundach),
+        czasy (wszystkie powtórzenia) i ciezkie (załadowane pakiety z ZAKAZANE)
+    """
+    katalog = os.path.dirname(os.path.abspath(__file__))
+    srodowisko = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (katalog, os.environ.get('PYTHONPATH')))))
+    czasy, ciezkie = [], set()
+    for _ in range(powtorzenia):
+        wynik = subprocess.run([sys.executable, '-c', _POMIAR.format(modul=modul, zakazane=ZAKAZANE)],
+                               capture_output=True, text=True, cwd=katalog, env=srodowisko, check=True)
+        pomiar = json.loads(wynik.stdout.splitlines()[-1])
+        czasy.append(pomiar['czas'])
+        ciezkie.update(pomiar['ciezkie'])
+    return {'id': modul, 'czas_importu': statistics.median(czasy), 'czasy': czasy, 'ciezkie': sorted(ciezkie)}
+
+
+def uruchom(moduly: Iterable[str] = MODULY_RDZENIA, powtorzenia: int = POWTORZENIA) -> List[Dict]:
+    """Mierzy import każdego modułu (sekwencyjnie, żeby pomiary sobie nie przeszkadzały)."""
+    return [zmierz_import(modul, powtorzenia) for modul in moduly]
+
+
+def porownaj_z_baseline(wyniki: List[Dict], baseline: Optional[List[Dict]] = None, tolerancja: float = 0.5,
+                        min_roznica: float = 0.05) -> List[str]:
+    """
+    Zwraca opisy regresji (pusta lista - brak).
+    
+    Załadowanie pakietu z ZAKAZANE jest regresją zawsze. Czas importu jest
+    regresją dopiero po przekroczeniu tolerancji względnej i minimalnej
+    różnicy bezwzględnej (w sekundach) względem wzorca; moduły nieobecne we
+    wzorcu są pomijane.
+    """
+    wzorce = {rekord['id']: rekord for rekord in baseline or []}
+    regresje = []
+    for rekord in wyniki:
+        id_ = rekord['id']
+        if rekord['ciezkie']:
+            regresje.append(f"{id_}: import ładuje {', '.join(rekord['ciezkie'])}")
+        wzorzec = wzorce.get(id_)
+        if wzorzec is None:
+            continue
+        czas, czas_wzorca = rekord['czas_importu'], wzorzec['czas_importu']
+        if czas > czas_wzorca * (1 + tolerancja) and czas - czas_wzorca > min_roznica:
+            regresje.append(f"{id_}: import {czas * 1000:.0f} ms (wzorzec {czas_wzorca * 1000:.0f} ms)")
+    return regresje
+
+
+def _metadane() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platforma': platform.platform(),
+        'procesor': platform.processor() or platform.machine(),
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def main(argv=None):
+    """Wiersz poleceń: mierzy importy i porównuje je ze wzorcem."""
+    parser = argparse.ArgumentParser(description="Benchmark czasu importu modułów obliczeniowych")
+    parser.add_argument('--moduly', nargs='*', default=None,
+                        help="moduły do zmierzenia (domyślnie MODULY_RDZENIA)")
+    parser.add_argument('--powtorzenia', type=int, default=POWTORZENIA)
+    parser.add_argument('-o', '--wyjscie', default=None, help="plik JSON z wynikami")
+    parser.add_argument('--baseline', default=None, help="plik wzorca do porównania")
+    parser.add_argument('--zapisz-baseline', default=None, help="zapisz wyniki jako nowy wzorzec")
+    parser.add_argument('--tolerancja', type=float, default=0.5)
+    args = parser.parse_args(argv)
+    
+    wyniki = []
+    for modul in args.moduly or MODULY_RDZENIA:
+        rekord = zmierz_import(modul, args.powtorzenia)
+        wyniki.append(rekord)
+        ciezkie = f"  ładuje: {', '.join(rekord['ciezkie'])}" if rekord['ciezkie'] else ''
+        print(f"{modul:<28} {rekord['czas_importu'] * 1000:8.1f} ms{ciezkie}", flush=True)
+        
+    dane = {'meta': _metadane(), 'wyniki': wyniki}
+    for sciezka in (args.wyjscie, args.zapisz_baseline):
+        if sciezka:
+            with open(sciezka, 'w', encoding='utf-8') as plik:
+                json.dump(dane, plik, ensure_ascii=False, indent=1)
+                
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as plik:
+            baseline = json.load(plik)['wyniki']
+    bledy = porownaj_z_baseline(wyniki, baseline, args.tolerancja)
+    
+    if bledy:
+        print(f"\nREGRESJE ({len(bledy)}):")
+        for opis in bledy:
+            print(f"  {opis}")
+        return 1
+    print(f"\nBrak regresji ({len(wyniki)} modułów)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
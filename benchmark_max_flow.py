@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Benchmark silników maksymalnego przepływu z porównaniem do zapisanego wzorca.
+
+Każdy przypadek (silnik, N, zakres przepustowości, ziarno) jest liczony we
+własnym, świeżym procesie, więc pomiar pamięci szczytowej nie zależy od
+poprzednich przypadków. Obok silników FordFulkerson mierzony jest
+networkx.maximum_flow jako punkt odniesienia. Dla każdego przypadku
+zapisywane są: czas obliczeń, czas przygotowania sieci, liczba powiększeń,
+liczba wierzchołków odwiedzonych przez BFS i pamięć szczytowa procesu.
+
+Wyniki trafiają do pliku JSON. Zawsze są porównywane z dołączonym
+wzorcem WZORZEC (pola deterministyczne: wartość przepływu, liczby powiększeń
+i odwiedzin BFS), a z opcją --baseline także z własnym wzorcem, łącznie
+z czasem i pamięcią. Każda regresja (inna wartość przepływu, więcej
+powiększeń lub odwiedzin, czas albo pamięć ponad tolerancję) kończy program
+kodem 1. Benchmark nie rysuje niczego i działa bez środowiska graficznego.
+
+Użycie:
+    python benchmark_max_flow.py --profil szybki
+    python benchmark_max_flow.py --profil szybki --aktualizuj-wzorzec
+    python benchmark_max_flow.py --profil szybki --zapisz-baseline wzorzec.json
+    python benchmark_max_flow.py --profil szybki --baseline wzorzec.json -o wyniki.json
+    python benchmark_max_flow.py --profil pelny --algorytmy dinic push-relabel networkx
+    python benchmark_max_flow.py --algorytmy edmonds-karp --bfs jednokierunkowy dwukierunkowy
+"""
+
+import os
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Profile: liczby warstw N, zakresy przepustowości, ziarna. Warstwy mają od 2 do N
+# wierzchołków, więc sieć ma ok. N^2/2 wierzchołków (ziarno 0: N=10 - 83, N=50 - 1373,
+# N=200 - 20500, N=300 - ok. 45 tys.)
+PROFILE = {
+    'mini': {'N': [2, 3, 5], 'przepustowosci': [(1, 10)], 'ziarna': [0]},
+    'szybki': {'N': [2, 5, 10, 20, 50], 'przepustowosci': [(1, 10), (1, 1000)], 'ziarna': [0, 1, 2]},
+    'pelny': {'N': [2, 5, 10, 20, 50, 100, 200, 300],
+              'przepustowosci': [(1, 10), (1, 1000), (1, 10**6)], 'ziarna': [0, 1, 2]},
+}
+BASELINE_NX = 'networkx'
+# Wzorzec dołączony do repozytorium: pola deterministyczne profili 'mini' i 'szybki'
+WZORZEC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wzorzec_benchmarku.json')
+POLA_DETERMINISTYCZNE = ('max_flow', 'augmentations', 'bfs_visits', 'nodes', 'edges')
+
+
+def wszystkie_algorytmy() -> List[str]:
+    """Silniki FordFulkerson i networkx jako punkt odniesienia."""
+    from zadanie2_ford_fulkerson import FordFulkerson
+    return list(FordFulkerson.ALGORYTMY) + [BASELINE_NX]
+
+
+def id_przypadku(przypadek: Dict) -> str:
+    bfs = f"|bfs={przypadek['bfs']}" if przypadek.get('bfs') else ''
+    return (f"{przypadek['algorithm']}|N={przypadek['N']}|"
+            f"c={przypadek['min_capacity']}-{przypadek['max_capacity']}|seed={przypadek['seed']}{bfs}")
+
+
+def przypadki(profil: str, algorytmy: Optional[Iterable[str]] = None,
+              tryby_bfs: Optional[Iterable[str]] = None) -> List[Dict]:
+    """
+    Lista przypadków profilu, od najmniejszych sieci (krzywe skalowania).
+    
+    Z podanymi tryby_bfs każdy silnik FordFulkerson jest mierzony w każdym
+    trybie (klucz 'bfs'); bez nich przypadki nie mają klucza 'bfs' i ich id
+    są zgodne ze starszymi wzorcami.
+    """
+    opis = PROFILE[profil]
+    algorytmy = list(algorytmy or wszystkie_algorytmy())
+    tryby = list(tryby_bfs or [None])
+    return [{'algorithm': algorithm, 'N': N, 'min_capacity': lo, 'max_capacity': hi, 'seed': seed,
+             **({'bfs': bfs} if bfs else {})}
+            for N in opis['N'] for lo, hi in opis['przepustowosci'] for seed in opis['ziarna']
+            for algorithm in algorytmy for bfs in (tryby if algorithm != BASELINE_NX else [None])]
+
+
+def _pamiec_szczytowa() -> int:
+    """Szczytowy rozmiar rezydentny bieżącego procesu w bajtach."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024  # Linux podaje KiB
+
+
+def zmierz_przypadek(przypadek: Dict) -> Dict:
+    """
+    Generuje sieć i mierzy jedno obliczenie maksymalnego przepływu.
+    
+    Wywoływana w osobnym procesie; pamięć_obliczen to przyrost pamięci
+    szczytowej procesu w trakcie samego obliczenia.
+    """
+    import networkx as nx
+    from zadanie1_siec_przeplywowa import SiecPrzeplywowa
+    from zadanie2_ford_fulkerson import FordFulkerson
+    from dziennik import CISZA
+    
+    start = time.perf_counter()
+    generator = SiecPrzeplywowa(przypadek['N'], przypadek['min_capacity'], przypadek['max_capacity'],
+                                verbosity=CISZA, seed=przypadek['seed'])
+    siec = generator.generuj_siec_csr()
+    if przypadek['algorithm'] == BASELINE_NX:
+        graf = siec.do_grafu()
+    czas_przygotowania = time.perf_counter() - start
+    
+    pamiec_przed = _pamiec_szczytowa()
+    start = time.perf_counter()
+    if przypadek['algorithm'] == BASELINE_NX:
+        max_flow, _ = nx.maximum_flow(graf, 's', 't')
+        powiekszenia = odwiedzone = statystyki = None
+    else:
+        ff = FordFulkerson(siec, history='off', verbosity=CISZA)
+        max_flow = ff.znajdz_maksymalny_przeplyw('s', 't', algorithm=przypadek['algorithm'],
+                                                 bfs=przypadek.get('bfs'))
+        powiekszenia, odwiedzone = ff.liczba_iteracji, ff.odwiedzone_wierzcholki
+        statystyki = ff.statystyki.slownik()
+    czas_obliczen = time.perf_counter() - start
+    pamiec_po = _pamiec_szczytowa()
+    
+    return {
+        'max_flow': max_flow,
+        'augmentations': powiekszenia,
+        'bfs_visits': odwiedzone,
+        'nodes': siec.n,
+        'edges': siec.m,
+        'czas_przygotowania': czas_przygotowania,
+        'czas_obliczen': czas_obliczen,
+        'pamiec_szczytowa': pamiec_po,
+        'pamiec_obliczen': pamiec_po - pamiec_przed,
+        'statystyki': statystyki,
+    }
+
+
+def uruchom(przypadki: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Mierzy przypadki po kolei, każdy w nowym procesie.
+    
+    Przypadki nie są liczone równolegle, żeby nie konkurowały o procesor
+    i pamięć podręczną; świeży proces daje niezależny pomiar pamięci.
+    
+    Yields:
+        Rekord przypadku z kluczami 'id', parametrami i wynikiem pomiaru
+    """
+    for przypadek in przypadki:
+        # Nowa pula na każdy przypadek - proces roboczy nie jest używany ponownie
+        with ProcessPoolExecutor(1) as pula:
+            wynik = pula.submit(zmierz_przypadek, przypadek).result()
+        rekord = {'id': id_przypadku(przypadek), **przypadek}
+        rekord.update(wynik)
+        yield rekord
+
+
+def niezgodne_przeplywy(wyniki: List[Dict]) -> List[str]:
+    """Opisy instancji, dla których silniki dały różne wartości przepływu."""
+    wartosci: Dict[Tuple, Dict[str, object]] = {}
+    for rekord in wyniki:
+        instancja = (rekord['N'], rekord['min_capacity'], rekord['max_capacity'], rekord['seed'])
+        silnik = rekord['algorithm'] + (f"/{rekord['bfs']}" if rekord.get('bfs') else '')
+        wartosci.setdefault(instancja, {})[silnik] = rekord['max_flow']
+    return [f"N={N} c={lo}-{hi} seed={seed}: {przeplywy}"
+            for (N, lo, hi, seed), przeplywy in wartosci.items() if len(set(przeplywy.values())) > 1]
+
+
+def porownaj_z_baseline(wyniki: List[Dict], baseline: List[Dict], tolerancja_czasu: float = 0.5,
+                        min_roznica_czasu: float = 0.05, tolerancja_pamieci: float = 0.25,
+                        min_roznica_pamieci: int = 16 * 2**20, czasy: bool = True) -> List[str]:
+    """
+    Porównuje wyniki ze wzorcem i zwraca opisy regresji (pusta lista - brak).
+    
+    Wartość przepływu musi być identyczna, a liczby powiększeń i odwiedzin BFS
+    nie mogą wzrosnąć (generator z ziarnem jest deterministyczny). Czas
+    i pamięć są regresją dopiero po przekroczeniu tolerancji względnej
+    i minimalnej różnicy bezwzględnej - pomiary małych sieci są zaszumione.
+    Przypadki nieobecne we wzorcu są pomijane.
+    
+    Args:
+        wyniki: Rekordy z uruchom
+        baseline: Rekordy wzorca (ta sama postać)
+        tolerancja_czasu: Dopuszczalny względny wzrost czasu obliczeń
+        min_roznica_czasu: Wzrost czasu w sekundach, poniżej którego nie ma regresji
+        tolerancja_pamieci: Dopuszczalny względny wzrost pamięci szczytowej
+        min_roznica_pamieci: Wzrost pamięci w bajtach, poniżej którego nie ma regresji
+        czasy: Czy porównywać czas i pamięć (False - tylko pola deterministyczne,
+            np. dla dołączonego wzorca z innej maszyny)
+    """
+    wzorce = {rekord['id']: rekord for rekord in baseline}
+    regresje = []
+    for rekord in wyniki:
+        wzorzec = wzorce.get(rekord['id'])
+        if wzorzec is None:
+            continue
+        id_ = rekord['id']
+        
+        if rekord['max_flow'] != wzorzec['max_flow']:
+            regresje.append(f"{id_}: przepływ {rekord['max_flow']} zamiast {wzorzec['max_flow']}")
+        for klucz in ('augmentations', 'bfs_visits'):
+            if rekord.get(klucz) is not None and wzorzec.get(klucz) is not None and rekord[klucz] > wzorzec[klucz]:
+                regresje.append(f"{id_}: {klucz} {rekord[klucz]} (wzorzec {wzorzec[klucz]})")
+        if not czasy:
+            continue
+            
+        czas, czas_wzorca = rekord['czas_obliczen'], wzorzec['czas_obliczen']
+        if czas > czas_wzorca * (1 + tolerancja_czasu) and czas - czas_wzorca > min_roznica_czasu:
+            regresje.append(f"{id_}: czas {czas:.3f} s (wzorzec {czas_wzorca:.3f} s)")
+            
+        pamiec, pamiec_wzorca = rekord['pamiec_szczytowa'], wzorzec['pamiec_szczytowa']
+        if pamiec > pamiec_wzorca * (1 + tolerancja_pamieci) and pamiec - pamiec_wzorca > min_roznica_pamieci:
+            regresje.append(f"{id_}: pamięć {pamiec / 2**20:.1f} MiB (wzorzec {pamiec_wzorca / 2**20:.1f} MiB)")
+    return regresje
+
+
+def wczytaj_wzorzec(sciezka: str = WZORZEC) -> List[Dict]:
+    """Rekordy dołączonego wzorca (pusta lista, gdy pliku nie ma)."""
+    if not os.path.exists(sciezka):
+        return []
+    with open(sciezka, encoding='utf-8') as plik:
+        return json.load(plik)['wyniki']
+
+
+def aktualizuj_wzorzec(wyniki: List[Dict], sciezka: str = WZORZEC):
+    """Dopisuje (lub zastępuje) pola deterministyczne przypadków w dołączonym wzorcu."""
+    rekordy = {rekord['id']: rekord for rekord in wczytaj_wzorzec(sciezka)}
+    for rekord in wyniki:
+        rekordy[rekord['id']] = {'id': rekord['id'], **{pole: rekord[pole] for pole in POLA_DETERMINISTYCZNE}}
+    with open(sciezka, 'w', encoding='utf-8') as plik:
+        json.dump({'wyniki': sorted(rekordy.values(), key=lambda r: r['id'])}, plik, ensure_ascii=False, indent=1)
+        plik.write('\n')
+
+
+def _metadane(profil: str) -> Dict:
+    import networkx as nx
+    import numpy as np
+    return {
+        'profil': profil,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'networkx': nx.__version__,
+        'platforma': platform.platform(),
+        'procesor': platform.processor() or platform.machine(),
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def main(argv=None):
+    """Wiersz poleceń: uruchamia profil i porównuje wyniki ze wzorcem."""
+    parser = argparse.ArgumentParser(description="Benchmark silników maksymalnego przepływu")
+    parser.add_argument('--profil', choices=sorted(PROFILE), default='szybki')
+    parser.add_argument('--algorytmy', nargs='*', default=None,
+                        help="silniki do zmierzenia (domyślnie wszystkie i networkx)")
+    parser.add_argument('--bfs', nargs='*', default=None,
+                        help="tryby BFS silników FordFulkerson (np. jednokierunkowy dwukierunkowy)")
+    parser.add_argument('-o', '--wyjscie', default=None, help="plik JSON z wynikami")
+    parser.add_argument('--baseline', default=None, help="plik wzorca do porównania")
+    parser.add_argument('--zapisz-baseline', default=None, help="zapisz wyniki jako nowy wzorzec")
+    parser.add_argument('--aktualizuj-wzorzec', action='store_true',
+                        help="zapisz pola deterministyczne wyników w dołączonym wzorcu (po zamierzonej zmianie)")
+    parser.add_argument('--bez-wzorca', action='store_true', help="nie porównuj z dołączonym wzorcem")
+    parser.add_argument('--tolerancja-czasu', type=float, default=0.5)
+    parser.add_argument('--tolerancja-pamieci', type=float, default=0.25)
+    args = parser.parse_args(argv)
+    
+    dostepne = wszystkie_algorytmy()
+    for algorithm in args.algorytmy or []:
+        if algorithm not in dostepne:
+            parser.error(f"nieznany algorytm: {algorithm} (dostępne: {', '.join(dostepne)})")
+    from zadanie2_ford_fulkerson import FordFulkerson
+    for tryb in args.bfs or []:
+        if tryb not in FordFulkerson.TRYBY_BFS:
+            parser.error(f"nieznany tryb BFS: {tryb} (dostępne: {', '.join(FordFulkerson.TRYBY_BFS)})")
+            
+    wyniki = []
+    for rekord in uruchom(przypadki(args.profil, args.algorytmy, args.bfs)):
+        wyniki.append(rekord)
+        dodatkowe = '' if rekord['augmentations'] is None else \
+            f", {rekord['augmentations']} powiększeń, {rekord['bfs_visits']} odwiedzin BFS"
+        print(f"{rekord['id']:<64} {rekord['nodes']:>7} wierzch.  przepływ {rekord['max_flow']:<9} "
+              f"{rekord['czas_obliczen']:8.3f} s  {rekord['pamiec_szczytowa'] / 2**20:7.1f} MiB{dodatkowe}",
+              flush=True)
+              
+    dane = {'meta': _metadane(args.profil), 'wyniki': wyniki}
+    for sciezka in (args.wyjscie, args.zapisz_baseline):
+        if sciezka:
+            with open(sciezka, 'w', encoding='utf-8') as plik:
+                json.dump(dane, plik, ensure_ascii=False, indent=1)
+                
+    bledy = [f"niezgodne wartości przepływu: {opis}" for opis in niezgodne_przeplywy(wyniki)]
+    if args.aktualizuj_wzorzec:
+        aktualizuj_wzorzec(wyniki)
+    elif not args.bez_wzorca:
+        bledy += porownaj_z_baseline(wyniki, wczytaj_wzorzec(), czasy=False)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as plik:
+            baseline = json.load(plik)['wyniki']
+        bledy += porownaj_z_baseline(wyniki, baseline, args.tolerancja_czasu,
+                                     tolerancja_pamieci=args.tolerancja_pamieci)
+                                     
+    if bledy:
+        print(f"\nREGRESJE ({len(bledy)}):")
+        for opis in bledy:
+            print(f"  {opis}")
+        return 1
+    print(f"\nBrak regresji ({len(wyniki)} przypadków)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
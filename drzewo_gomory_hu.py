@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Drzewo Gomory'ego-Hu (algorytm Gusfielda) - minimalne przekroje dla wszystkich par.
+
+Drzewo powstaje z n-1 obliczeń maksymalnego przepływu (FordFulkerson) i
+koduje minimalne przekroje wszystkich par wierzchołków: wartość przekroju
+(u, v) to najmniejsza waga na ścieżce u-v w drzewie, a usunięcie tej
+krawędzi dzieli wierzchołki na strony przekroju. Zapytanie o parę kosztuje
+O(n), bez kolejnych obliczeń przepływu.
+
+Drzewo Gomory'ego-Hu istnieje tylko dla przekrojów nieskierowanych, więc
+sieć skierowana jest symetryzowana: krawędź {u, v} ma przepustowość
+c(u, v) + c(v, u). Wartości z drzewa to przekroje tej sieci nieskierowanej
+(dla sieci skierowanej - ograniczenie górne na przepływ u -> v).
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Set, Tuple, Union
+import numpy as np
+from siec_csr import SiecCSR
+from zadanie2_ford_fulkerson import FordFulkerson
+from dziennik import Dziennik, Ujscie, SZCZEGOLY, ITERACJE, PODSUMOWANIE, CISZA
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def _siec_nieskierowana(graph: Union['nx.Graph', 'nx.DiGraph', SiecCSR], capacity: str) -> SiecCSR:
+    """
+    Buduje sieć CSR, w której każda para {u, v} ma łuki w obu kierunkach
+    o przepustowości równej sumie przepustowości krawędzi między u i v.
+    """
+    # Graf nieskierowany zwraca każdą krawędź {u, v} raz, skierowany - każdy łuk osobno
+    siec = graph if isinstance(graph, SiecCSR) else SiecCSR.z_grafu(graph, capacity)
+    
+    n = siec.n
+    u = np.minimum(siec.zrodla, siec.cele)
+    v = np.maximum(siec.zrodla, siec.cele)
+    bez_petli = u != v
+    klucze, odwrotne = np.unique(u[bez_petli] * n + v[bez_petli], return_inverse=True)
+    sumy = np.bincount(odwrotne, weights=siec.przepustowosci[bez_petli], minlength=len(klucze))
+    if siec.przepustowosci.dtype.kind == 'i':
+        sumy = sumy.astype(np.int64)
+        
+    a, b = klucze // n, klucze % n
+    return SiecCSR(siec.wezly, np.concatenate((a, b)), np.concatenate((b, a)), np.concatenate((sumy, sumy)))
+
+
+class DrzewoGomoryegoHu:
+    def __init__(self, graph: Union['nx.Graph', 'nx.DiGraph', SiecCSR], capacity: str = 'capacity',
+                 algorithm: str = 'dinic', verbosity: int = SZCZEGOLY, sink: Optional[Ujscie] = None):
+        """
+        Buduje drzewo n-1 obliczeniami maksymalnego przepływu.
+        
+        Args:
+            graph: Sieć (graf skierowany jest symetryzowany) lub SiecCSR
+            capacity: Nazwa atrybutu przepustowości krawędzi grafu
+            algorithm: Silnik FordFulkerson używany do obliczeń przepływu
+            verbosity: Minimalny poziom zgłaszanych zdarzeń z modułu dziennik
+            sink: Odbiorca zdarzeń (poziom, komunikat); domyślnie stdout
+        """
+        self.dziennik = Dziennik(verbosity, sink)
+        self.siec = _siec_nieskierowana(graph, capacity)
+        self.wezly = self.siec.wezly
+        self.indeks = self.siec.indeks
+        n = self.siec.n
+        
+        # Drzewo zapisane tablicą rodziców (korzeń: wierzchołek 0) i wagami krawędzi do rodzica
+        self.rodzic: List[int] = [0] * n
+        self.waga: List[Union[int, float]] = [0] * n
+        self.liczba_przeplywow = 0
+        
+        self.dziennik(PODSUMOWANIE, f"Buduję drzewo Gomory'ego-Hu ({n} wierzchołków, {n - 1} obliczeń przepływu)...")
+        zera = np.zeros(self.siec.m, dtype=self.siec.przepustowosci.dtype)
+        for s in range(1, n):
+            t = self.rodzic[s]
+            self.siec.przeplyw = zera.copy()
+            ff = FordFulkerson(self.siec, history='off', verbosity=CISZA)
+            self.waga[s] = ff.znajdz_maksymalny_przeplyw(self.wezly[s], self.wezly[t], algorithm=algorithm)
+            self.liczba_przeplywow += 1
+            
+            # Wierzchołki po stronie s, podpięte dotąd pod t, przechodzą pod s;
+            # jeśli rodzic t też jest po stronie s, s wchodzi między t a jego rodzica
+            strona = ff.strona_zrodla(self.wezly[s])
+            po_stronie_s = [False] * n
+            for v in strona:
+                i = self.indeks[v]
+                po_stronie_s[i] = True
+                if i != s and self.rodzic[i] == t:
+                    self.rodzic[i] = s
+            if po_stronie_s[self.rodzic[t]]:
+                self.rodzic[s] = self.rodzic[t]
+                self.rodzic[t] = s
+                self.waga[s], self.waga[t] = self.waga[t], self.waga[s]
+            if self.dziennik.wlaczony(ITERACJE):
+                self.dziennik(ITERACJE, f"  Przekrój {self.wezly[s]} | {self.wezly[t]}: {self.waga[s]} "
+                                        f"(strona źródła: {len(strona)} wierzchołków)")
+        self.siec.przeplyw = zera
+        
+        # Kolejność od korzenia i głębokości - do zapytań o ścieżki i poddrzewa
+        dzieci = [[] for _ in range(n)]
+        for v in range(1, n):
+            dzieci[self.rodzic[v]].append(v)
+        self.glebokosc = [0] * n
+        self._kolejnosc = []
+        kolejka = deque([0] if n else [])
+        while kolejka:
+            u = kolejka.popleft()
+            self._kolejnosc.append(u)
+            for v in dzieci[u]:
+                self.glebokosc[v] = self.glebokosc[u] + 1
+                kolejka.append(v)
+                
+        self.dziennik(PODSUMOWANIE, f"Drzewo zbudowane ({self.liczba_przeplywow} obliczeń przepływu)")
+        
+    def _najslabsza_krawedz(self, u: Hashable, v: Hashable) -> int:
+        """Wierzchołek x, którego krawędź (x, rodzic[x]) ma najmniejszą wagę na ścieżce u-v."""
+        a, b = self.indeks[u], self.indeks[v]
+        if a == b:
+            raise ValueError("Przekrój wymaga dwóch różnych wierzchołków")
+        najslabsza = None
+        while a != b:
+            # Wspinamy się z głębszego końca, aż oba spotkają się we wspólnym przodku
+            if self.glebokosc[a] < self.glebokosc[b]:
+                a, b = b, a
+            if najslabsza is None or self.waga[a] < self.waga[najslabsza]:
+                najslabsza = a
+            a = self.rodzic[a]
+        return najslabsza
+        
+    def minimalny_przekroj(self, u: Hashable, v: Hashable) -> Union[int, float]:
+        """Wartość minimalnego przekroju rozdzielającego u i v."""
+        return self.waga[self._najslabsza_krawedz(u, v)]
+        
+    def strona_przekroju(self, u: Hashable, v: Hashable) -> Set[Hashable]:
+        """Wierzchołki po stronie u minimalnego przekroju rozdzielającego u i v."""
+        x = self._najslabsza_krawedz(u, v)
+        # Poddrzewo x to jedna strona przekroju, reszta drzewa - druga
+        w_poddrzewie = [False] * len(self.wezly)
+        for w in self._kolejnosc:
+            w_poddrzewie[w] = w == x or (w != 0 and w_poddrzewie[self.rodzic[w]])
+        po_stronie_u = w_poddrzewie[self.indeks[u]]
+        return {self.wezly[w] for w in range(len(self.wezly)) if w_poddrzewie[w] == po_stronie_u}
+        
+    def krawedzie(self) -> List[Tuple[Hashable, Hashable, Union[int, float]]]:
+        """Krawędzie drzewa jako (wierzchołek, rodzic, waga)."""
+        return [(self.wezly[v], self.wezly[self.rodzic[v]], self.waga[v]) for v in range(1, len(self.wezly))]
+        
+    def do_grafu(self) -> 'nx.Graph':
+        """Drzewo jako nieskierowany graf networkx z wagami w atrybucie 'weight'."""
+        import networkx as nx
+        drzewo = nx.Graph()
+        drzewo.add_nodes_from(self.wezly)
+        drzewo.add_weighted_edges_from(self.krawedzie())
+        return drzewo
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Poziomowy dziennik zdarzeń generatora sieci i algorytmów przepływu.
+
+Komunikaty o postępie obliczeń trafiają do wymiennego ujścia (stdout,
+logger, lista, plik) zamiast bezpośrednio na ekran. Kod w gorących pętlach
+sprawdza poziom przed sformatowaniem komunikatu, więc w trybie cichym nie
+jest tworzony żaden napis.
+
+Poziomy (zgodne liczbowo z modułem logging):
+- SZCZEGOLY: pojedyncze krawędzie (np. zmiana przepływu na łuku ścieżki)
+- ITERACJE: iteracje, fazy, zawartość warstw
+- PODSUMOWANIE: początek i wynik obliczeń
+- CISZA: nic nie jest zgłaszane
+"""
+
+import logging
+from typing import Callable, List, Optional, TextIO, Tuple, Union
+
+
+SZCZEGOLY = logging.DEBUG
+ITERACJE = 15
+PODSUMOWANIE = logging.INFO
+CISZA = logging.CRITICAL + 10
+
+# Ujście to dowolna funkcja przyjmująca (poziom, komunikat)
+Ujscie = Callable[[int, str], None]
+
+
+def ujscie_stdout(poziom: int, wiadomosc: str):
+    """Wypisuje komunikat na standardowe wyjście (zachowanie domyślne)."""
+    print(wiadomosc)
+
+
+class UjscieLista:
+    """Zbiera zdarzenia w liście par (poziom, komunikat)."""
+    
+    def __init__(self):
+        self.zdarzenia: List[Tuple[int, str]] = []
+        
+    def __call__(self, poziom: int, wiadomosc: str):
+        self.zdarzenia.append((poziom, wiadomosc.strip('\n')))
+
+
+class UjscieLoggera:
+    """Przekazuje zdarzenia do loggera modułu logging."""
+    
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger('grafy')
+        
+    def __call__(self, poziom: int, wiadomosc: str):
+        self.logger.log(poziom, wiadomosc.strip('\n'))
+
+
+class UjsciePliku:
+    """Dopisuje zdarzenia do pliku tekstowego (ścieżka lub otwarty plik)."""
+    
+    def __init__(self, plik: Union[str, TextIO]):
+        self._wlasny = isinstance(plik, str)
+        self.plik = open(plik, 'a', encoding='utf-8') if self._wlasny else plik
+        
+    def __call__(self, poziom: int, wiadomosc: str):
+        self.plik.write(wiadomosc.strip('\n') + '\n')
+        
+    def close(self):
+        """Zamyka plik, jeśli został otwarty przez ujście."""
+        if self._wlasny:
+            self.plik.close()
+
+
+class Dziennik:
+    """Filtruje zdarzenia według poziomu i przekazuje je do ujścia."""
+    
+    def __init__(self, poziom: int = SZCZEGOLY, ujscie: Optional[Ujscie] = None):
+        """
+        Args:
+            poziom: Minimalny poziom zgłaszanych zdarzeń (CISZA wyłącza wszystkie)
+            ujscie: Odbiorca zdarzeń (domyślnie stdout)
+        """
+        self.poziom = poziom
+        self.ujscie = ujscie or ujscie_stdout
+        
+    def wlaczony(self, poziom: int) -> bool:
+        """Czy zdarzenia danego poziomu są zgłaszane - sprawdzać przed formatowaniem."""
+        return poziom >= self.poziom
+        
+    def __call__(self, poziom: int, wiadomosc: str):
+        if poziom >= self.poziom:
+            self.ujscie(poziom, wiadomosc)
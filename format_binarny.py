@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Binarny format sieci przepływowej odwzorowywany w pamięci (mmap).
+
+Plik to 64-bajtowy nagłówek, po którym następują ciągłe tablice (każda
+wyrównana do 8 bajtów), w kolejności:
+
+    poczatki[n+1], zrodla[m], cele[m], przepustowosci[m], glowy[2m],
+    krawedz_luku[2m], odwrotny[2m], w_przod[2m], luk_przod[m], luk_tyl[m],
+    przeplyw[m] (opcjonalnie), warstwy[n] (opcjonalnie), nazwy wierzchołków
+
+Indeksy są zapisane jako int32, gdy mieszczą się w tym typie (inaczej int64),
+przepustowości i przepływ jako int64 albo float64, warstwy jako int32.
+Nazwy wierzchołków to napisy UTF-8 rozdzielone znakiem nowej linii albo,
+gdy nie są napisami, lista JSON.
+
+Wczytanie nie kopiuje tablic: są to widoki na odwzorowany plik, a silniki
+FordFulkerson czytają je bezpośrednio (przez memoryview). Dekodowane są
+tylko nazwy wierzchołków.
+"""
+
+import json
+import struct
+from typing import Hashable, List
+import numpy as np
+from siec_csr import SiecCSR
+
+
+SYGNATURA = b'SIECCSR\0'
+WERSJA_FORMATU = 1
+NAGLOWEK = struct.Struct('<8sIIqqq')  # sygnatura, wersja, flagi, n, m, bajty nazw
+ROZMIAR_NAGLOWKA = 64
+WYROWNANIE = 8
+
+# Flagi nagłówka
+Z_PRZEPLYWEM = 1
+Z_WARSTWAMI = 2
+PRZEPUSTOWOSCI_FLOAT = 4
+INDEKSY_INT64 = 8
+NAZWY_JSON = 16
+
+
+def _uklad(n: int, m: int, flagi: int):
+    """Lista (nazwa, typ, długość) tablic w kolejności zapisu w pliku."""
+    indeks = np.int64 if flagi & INDEKSY_INT64 else np.int32
+    wartosc = np.float64 if flagi & PRZEPUSTOWOSCI_FLOAT else np.int64
+    uklad = [
+        ('poczatki', indeks, n + 1),
+        ('zrodla', indeks, m),
+        ('cele', indeks, m),
+        ('przepustowosci', wartosc, m),
+        ('glowy', indeks, 2 * m),
+        ('krawedz_luku', indeks, 2 * m),
+        ('odwrotny', indeks, 2 * m),
+        ('w_przod', np.bool_, 2 * m),
+        ('luk_przod', indeks, m),
+        ('luk_tyl', indeks, m),
+    ]
+    if flagi & Z_PRZEPLYWEM:
+        uklad.append(('przeplyw', wartosc, m))
+    if flagi & Z_WARSTWAMI:
+        uklad.append(('warstwy', np.int32, n))
+    return uklad
+
+
+def _dopelnienie(pozycja: int) -> int:
+    return -pozycja % WYROWNANIE
+
+
+def _koduj_nazwy(wezly: List[Hashable]):
+    """Zwraca (bajty, czy_json) dla listy nazw wierzchołków."""
+    if all(isinstance(v, str) and '\n' not in v for v in wezly):
+        return '\n'.join(wezly).encode('utf-8'), False
+    return json.dumps(wezly).encode('utf-8'), True
+
+
+def _krotki(wartosc):
+    """Zamienia listy z JSON z powrotem na krotki (nazwy wierzchołków muszą być haszowalne)."""
+    if isinstance(wartosc, list):
+        return tuple(_krotki(x) for x in wartosc)
+    return wartosc
+
+
+def zapisz_siec(siec: SiecCSR, sciezka: str, z_przeplywem: bool = None):
+    """
+    Zapisuje sieć CSR w formacie binarnym.
+    
+    Args:
+        siec: Sieć do zapisania
+        sciezka: Ścieżka pliku
+        z_przeplywem: Czy zapisać przepływ (domyślnie, gdy jest niezerowy)
+    """
+    n, m = siec.n, siec.m
+    if z_przeplywem is None:
+        z_przeplywem = bool(np.any(siec.przeplyw))
+        
+    flagi = 0
+    if z_przeplywem:
+        flagi |= Z_PRZEPLYWEM
+    if siec.warstwy is not None:
+        flagi |= Z_WARSTWAMI
+    if siec.przepustowosci.dtype.kind == 'f':
+        flagi |= PRZEPUSTOWOSCI_FLOAT
+    if max(n + 1, 2 * m) > np.iinfo(np.int32).max:
+        flagi |= INDEKSY_INT64
+    nazwy, czy_json = _koduj_nazwy(siec.wezly)
+    if czy_json:
+        flagi |= NAZWY_JSON
+        
+    with open(sciezka, 'wb') as plik:
+        naglowek = NAGLOWEK.pack(SYGNATURA, WERSJA_FORMATU, flagi, n, m, len(nazwy))
+        plik.write(naglowek.ljust(ROZMIAR_NAGLOWKA, b'\0'))
+        pozycja = ROZMIAR_NAGLOWKA
+        
+        for nazwa, typ, dlugosc in _uklad(n, m, flagi):
+            tablica = np.ascontiguousarray(getattr(siec, nazwa), dtype=typ)
+            if len(tablica) != dlugosc:
+                raise ValueError(f"Tablica {nazwa} ma długość {len(tablica)}, oczekiwano {dlugosc}")
+            plik.write(b'\0' * _dopelnienie(pozycja))
+            pozycja += _dopelnienie(pozycja)
+            plik.write(memoryview(tablica).cast('B'))
+            pozycja += tablica.nbytes
+            
+        plik.write(b'\0' * _dopelnienie(pozycja))
+        plik.write(nazwy)
+
+
+def wczytaj_siec(sciezka: str) -> SiecCSR:
+    """
+    Odwzorowuje plik w pamięci i zwraca sieć CSR z tablicami będącymi widokami na plik.
+    
+    Tablice są tylko do odczytu; obliczony przepływ trafia do nowej tablicy.
+    """
+    bufor = np.memmap(sciezka, dtype=np.uint8, mode='r')
+    if len(bufor) < ROZMIAR_NAGLOWKA:
+        raise ValueError(f"Plik {sciezka} jest za krótki na nagłówek sieci")
+    sygnatura, wersja, flagi, n, m, bajty_nazw = NAGLOWEK.unpack_from(bufor[:NAGLOWEK.size].tobytes())
+    if sygnatura != SYGNATURA:
+        raise ValueError(f"Plik {sciezka} nie jest siecią w formacie binarnym")
+    if wersja != WERSJA_FORMATU:
+        raise ValueError(f"Nieobsługiwana wersja formatu: {wersja}")
+        
+    uklad = _uklad(n, m, flagi)
+    pozycja = ROZMIAR_NAGLOWKA
+    for _, typ, dlugosc in uklad:
+        pozycja += _dopelnienie(pozycja) + dlugosc * np.dtype(typ).itemsize
+    pozycja += _dopelnienie(pozycja)
+    if len(bufor) < pozycja + bajty_nazw:
+        raise ValueError(f"Plik {sciezka} jest obcięty")
+        
+    tablice = {}
+    pozycja = ROZMIAR_NAGLOWKA
+    for nazwa, typ, dlugosc in uklad:
+        pozycja += _dopelnienie(pozycja)
+        koniec = pozycja + dlugosc * np.dtype(typ).itemsize
+        tablice[nazwa] = bufor[pozycja:koniec].view(typ)
+        pozycja = koniec
+        
+    pozycja += _dopelnienie(pozycja)
+    nazwy = bufor[pozycja:pozycja + bajty_nazw].tobytes().decode('utf-8')
+    if flagi & NAZWY_JSON:
+        wezly = [_krotki(v) for v in json.loads(nazwy)]
+    else:
+        wezly = nazwy.split('\n') if n else []
+        
+    return SiecCSR.z_tablic(wezly, tablice, zmapowana=True)
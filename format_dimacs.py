@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Odczyt i zapis sieci w formacie DIMACS dla problemu maksymalnego przepływu.
+
+Format problemu:
+    c komentarz
+    p max <liczba wierzchołków> <liczba łuków>
+    n <id> s                  (źródło)
+    n <id> t                  (ujście)
+    a <u> <v> <przepustowość>
+
+Format rozwiązania:
+    s <wartość przepływu>
+    f <u> <v> <przepływ>
+
+Wierzchołki mają numery 1..n. Plik jest czytany porcjami bajtów (także .gz),
+a łuki z każdej porcji są zamieniane na tablice NumPy hurtowo, więc nawet
+pliki rzędu setek MB nie są wczytywane w całości jako tekst.
+"""
+
+import gzip
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple, Union
+import numpy as np
+from siec_csr import SiecCSR
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+ROZMIAR_PORCJI = 1 << 22  # bajty czytane naraz
+KRAWEDZIE_NA_ZAPIS = 1 << 16  # krawędzie formatowane naraz przy zapisie
+
+
+def _otworz(sciezka: str, tryb: str):
+    """Otwiera plik, rozpakowując go w locie, jeśli ma rozszerzenie .gz."""
+    if sciezka.endswith('.gz'):
+        return gzip.open(sciezka, tryb, compresslevel=6)  # 9 spowalnia zapis kilkukrotnie
+    return open(sciezka, tryb)
+
+
+def _liczby(tokeny: List[bytes]) -> np.ndarray:
+    """Zamienia tokeny na int64 (lub float64, gdy nie są całkowite)."""
+    tablica = np.array(tokeny)
+    try:
+        return tablica.astype(np.int64)
+    except ValueError:
+        return tablica.astype(np.float64)
+
+
+class _Parser:
+    """Stan parsera DIMACS między kolejnymi porcjami pliku."""
+    
+    def __init__(self, nazwa: str):
+        self.nazwa = nazwa
+        self.n = self.m = None
+        self.zrodlo = self.ujscie = None
+        self.zrodla, self.cele, self.przepustowosci = [], [], []
+        self.nr_linii = 0
+        
+    def blad(self, nr_linii: int, opis: str):
+        raise ValueError(f"{self.nazwa}, linia {nr_linii}: {opis}")
+        
+    def przetworz(self, linie: List[bytes]):
+        """Przetwarza pełne linie jednej porcji pliku."""
+        luki = []
+        pierwsza = self.nr_linii + 1
+        for nr, linia in enumerate(linie, pierwsza):
+            # Typ linii to pierwszy niebiały znak (linie mogą być wcięte)
+            if linia.lstrip()[:1] == b'a':
+                luki.append(linia)
+            else:
+                self._linia_opisu(nr, linia)
+        self.nr_linii += len(linie)
+        
+        if luki:
+            if self.n is None:
+                self.blad(pierwsza, "łuk przed linią 'p max'")
+            tokeny = b' '.join(luki).split()
+            if len(tokeny) != 4 * len(luki):
+                # Szukamy błędnej linii tylko wtedy, gdy porcja jest niepoprawna
+                for nr, linia in enumerate(linie, pierwsza):
+                    if linia.lstrip()[:1] == b'a' and len(linia.split()) != 4:
+                        self.blad(nr, f"oczekiwano 'a u v c', jest {linia.decode(errors='replace')!r}")
+            try:
+                zrodla = _liczby(tokeny[1::4])
+                cele = _liczby(tokeny[2::4])
+                przepustowosci = _liczby(tokeny[3::4])
+            except ValueError:
+                self.blad(pierwsza, "niepoprawna liczba w łukach (porcja pliku od tej linii)")
+            if zrodla.dtype.kind == 'f' or cele.dtype.kind == 'f':
+                self.blad(pierwsza, "numer wierzchołka nie jest liczbą całkowitą (porcja pliku od tej linii)")
+            if min(zrodla.min(), cele.min()) < 1 or max(zrodla.max(), cele.max()) > self.n:
+                self.blad(pierwsza, f"numer wierzchołka spoza zakresu 1..{self.n} (porcja pliku od tej linii)")
+            self.zrodla.append(zrodla - 1)
+            self.cele.append(cele - 1)
+            self.przepustowosci.append(przepustowosci)
+            
+    def _linia_opisu(self, nr: int, linia: bytes):
+        pola = linia.split()
+        if not pola or pola[0] == b'c':
+            return
+        if pola[0] == b'p':
+            if len(pola) != 4 or pola[1] != b'max':
+                self.blad(nr, "oczekiwano 'p max <n> <m>'")
+            if self.n is not None:
+                self.blad(nr, "powtórzona linia 'p'")
+            self.n, self.m = int(pola[2]), int(pola[3])
+        elif pola[0] == b'n':
+            if len(pola) != 3 or pola[2] not in (b's', b't'):
+                self.blad(nr, "oczekiwano 'n <id> s|t'")
+            if self.n is None:
+                self.blad(nr, "opis wierzchołka przed linią 'p max'")
+            wierzcholek = int(pola[1])
+            if not 1 <= wierzcholek <= self.n:
+                self.blad(nr, f"numer wierzchołka spoza zakresu 1..{self.n}")
+            if pola[2] == b's':
+                self.zrodlo = wierzcholek
+            else:
+                self.ujscie = wierzcholek
+        else:
+            self.blad(nr, f"nieznany typ linii {pola[0].decode(errors='replace')!r}")
+            
+    def wynik(self) -> Tuple[SiecCSR, int, int]:
+        if self.n is None:
+            raise ValueError(f"{self.nazwa}: brak linii 'p max'")
+        if self.zrodlo is None or self.ujscie is None:
+            raise ValueError(f"{self.nazwa}: brak opisu źródła lub ujścia ('n <id> s|t')")
+            
+        zrodla = np.concatenate(self.zrodla) if self.zrodla else np.empty(0, dtype=np.int64)
+        cele = np.concatenate(self.cele) if self.cele else np.empty(0, dtype=np.int64)
+        przepustowosci = np.concatenate(self.przepustowosci) if self.przepustowosci else np.empty(0, dtype=np.int64)
+        if len(zrodla) != self.m:
+            raise ValueError(f"{self.nazwa}: zadeklarowano {self.m} łuków, wczytano {len(zrodla)}")
+            
+        # Łuki równoległe są scalane w jeden (przepustowości się sumują), żeby
+        # przepływ (u, v) -> f był jednoznaczny; kolejność pierwszych wystąpień zostaje
+        klucze = zrodla * self.n + cele
+        _, pierwsze, numery = np.unique(klucze, return_index=True, return_inverse=True)
+        if len(pierwsze) < len(klucze):
+            kolejnosc = np.argsort(pierwsze, kind='stable')
+            pozycja = np.empty_like(kolejnosc)
+            pozycja[kolejnosc] = np.arange(len(kolejnosc))
+            scalone = np.zeros(len(pierwsze), dtype=przepustowosci.dtype)
+            np.add.at(scalone, pozycja[numery.ravel()], przepustowosci)
+            zrodla, cele, przepustowosci = zrodla[pierwsze[kolejnosc]], cele[pierwsze[kolejnosc]], scalone
+            
+        siec = SiecCSR(range(1, self.n + 1), zrodla, cele, przepustowosci)
+        return siec, self.zrodlo, self.ujscie
+
+
+def wczytaj_dimacs(sciezka: str, rozmiar_porcji: int = ROZMIAR_PORCJI) -> Tuple[SiecCSR, int, int]:
+    """
+    Wczytuje sieć z pliku DIMACS (max flow), czytając go porcjami.
+    
+    Łuki równoległe (ten sam początek i koniec) są scalane w jedną krawędź
+    o sumarycznej przepustowości.
+    
+    Args:
+        sciezka: Ścieżka pliku (.gz jest rozpakowywany w locie)
+        rozmiar_porcji: Liczba bajtów czytanych naraz
+        
+    Returns:
+        Krotka (sieć CSR z wierzchołkami 1..n, źródło, ujście)
+    """
+    parser = _Parser(sciezka)
+    reszta = b''
+    with _otworz(sciezka, 'rb') as plik:
+        while True:
+            porcja = plik.read(rozmiar_porcji)
+            if not porcja:
+                break
+            dane = reszta + porcja
+            koniec = dane.rfind(b'\n')
+            if koniec < 0:
+                reszta = dane
+                continue
+            parser.przetworz(dane[:koniec].split(b'\n'))
+            reszta = dane[koniec + 1:]
+    if reszta.strip():
+        parser.przetworz([reszta])
+        
+    return parser.wynik()
+
+
+def _jako_csr(siec: Union['nx.DiGraph', SiecCSR]) -> SiecCSR:
+    return siec if isinstance(siec, SiecCSR) else SiecCSR.z_grafu(siec)
+
+
+def _zapisz_linie(plik, szablon: str, u: np.ndarray, v: np.ndarray, wartosci: np.ndarray):
+    """Zapisuje linie '<szablon> u v x' porcjami (numery wierzchołków od 1)."""
+    for poczatek in range(0, len(u), KRAWEDZIE_NA_ZAPIS):
+        koniec = poczatek + KRAWEDZIE_NA_ZAPIS
+        plik.write(''.join(f'{szablon} {a} {b} {x}\n' for a, b, x in
+                           zip((u[poczatek:koniec] + 1).tolist(), (v[poczatek:koniec] + 1).tolist(),
+                               wartosci[poczatek:koniec].tolist())))
+
+
+def zapisz_dimacs(siec: Union['nx.DiGraph', SiecCSR], sciezka: str,
+                  source: Hashable = 's', sink: Hashable = 't', komentarz: Optional[str] = None):
+    """
+    Zapisuje sieć w formacie DIMACS.
+    
+    Wierzchołki dostają numery 1..n w kolejności sieci; nazwy, które nie są
+    tymi numerami, są zapisywane w komentarzach 'c wierzcholek <id> <nazwa>'.
+    
+    Args:
+        siec: Graf z przepustowościami (np. SiecPrzeplywowa.graph) albo SiecCSR
+        sciezka: Ścieżka pliku (.gz jest kompresowany)
+        source: Nazwa źródła
+        sink: Nazwa ujścia
+        komentarz: Opcjonalny komentarz na początku pliku
+    """
+    siec = _jako_csr(siec)
+    with _otworz(sciezka, 'wt') as plik:
+        if komentarz:
+            for linia in komentarz.splitlines():
+                plik.write(f'c {linia}\n')
+        plik.write(f'p max {siec.n} {siec.m}\n')
+        plik.write(f'n {siec.indeks[source] + 1} s\n')
+        plik.write(f'n {siec.indeks[sink] + 1} t\n')
+        if siec.wezly != list(range(1, siec.n + 1)):
+            for poczatek in range(0, siec.n, KRAWEDZIE_NA_ZAPIS):
+                plik.write(''.join(f'c wierzcholek {i} {v}\n' for i, v in
+                                   enumerate(siec.wezly[poczatek:poczatek + KRAWEDZIE_NA_ZAPIS], poczatek + 1)))
+        _zapisz_linie(plik, 'a', siec.zrodla, siec.cele, siec.przepustowosci)
+
+
+def zapisz_przeplyw_dimacs(siec: Union['nx.DiGraph', SiecCSR], sciezka: str,
+                           przeplyw: Union[Dict[Tuple[Hashable, Hashable], int], np.ndarray, None] = None,
+                           source: Hashable = 's'):
+    """
+    Zapisuje rozwiązanie (wartość i przepływ na łukach) w formacie DIMACS.
+    
+    Numeracja wierzchołków jest taka sama jak w zapisz_dimacs dla tej sieci.
+    
+    Args:
+        siec: Sieć, dla której obliczono przepływ
+        sciezka: Ścieżka pliku (.gz jest kompresowany)
+        przeplyw: Słownik (u, v) -> f (np. FordFulkerson.flow), tablica
+            przepływów krawędzi albo None (przepływ zapisany w SiecCSR)
+        source: Nazwa źródła (do wyznaczenia wartości przepływu)
+        
+    Raises:
+        ValueError: Gdy przepływ podano słownikiem, a sieć ma krawędzie równoległe
+    """
+    siec = _jako_csr(siec)
+    if isinstance(przeplyw, dict):
+        if len(set(siec.nazwy_krawedzi())) < siec.m:
+            raise ValueError("Sieć ma krawędzie równoległe - słownik (u, v) -> f nie wyznacza przepływu "
+                             "każdej z nich; podaj tablicę przepływów krawędzi (np. SiecCSR.przeplyw)")
+        wartosci = np.array([przeplyw.get(e, 0) for e in siec.nazwy_krawedzi()],
+                            dtype=siec.przepustowosci.dtype)
+    elif przeplyw is not None:
+        wartosci = np.asarray(przeplyw)
+    else:
+        wartosci = siec.przeplyw
+        
+    s = siec.indeks[source]
+    wartosc = (wartosci[siec.zrodla == s].sum() - wartosci[siec.cele == s].sum()).item()
+    with _otworz(sciezka, 'wt') as plik:
+        plik.write(f's {wartosc}\n')
+        _zapisz_linie(plik, 'f', siec.zrodla, siec.cele, wartosci)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Klient lokalnej usługi maksymalnego przepływu (usluga_przeplywu).
+
+KlientAsynchroniczny korzysta z połączeń asyncio, więc oczekiwanie na
+wynik nie blokuje pętli zdarzeń usługi wywołującej. Klient (synchroniczny,
+http.client) służy skryptom i kodowi bez asyncio. Oba mają te same metody:
+zglos, stan, strumien, czekaj, anuluj, rozwiaz i stan_uslugi.
+
+Przykład:
+    async with KlientAsynchroniczny('http://127.0.0.1:8765') as klient:
+        wynik = await klient.rozwiaz({'krawedzie': [['s', 'a', 3], ['a', 't', 2]]})
+        print(wynik['max_flow'])
+"""
+
+import asyncio
+import http.client
+import json
+import time
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+KONCOWE = ('gotowe', 'blad', 'przekroczony-czas', 'anulowane')
+
+
+class BladUslugi(RuntimeError):
+    """Odpowiedź usługi z kodem błędu HTTP (atrybut status, np. 429 - pełna kolejka)."""
+    
+    def __init__(self, status: int, opis: str, odpowiedz: Optional[Dict] = None):
+        super().__init__(f"{status}: {opis}")
+        self.status = status
+        self.odpowiedz = odpowiedz
+
+
+class BladZadania(RuntimeError):
+    """Zadanie zakończone bez wyniku: błąd obliczeń, przekroczony czas lub anulowanie (atrybut stan)."""
+    
+    def __init__(self, stan: Dict):
+        super().__init__(f"zadanie {stan['id']}: {stan['stan']}" + (f" ({stan['blad']})" if stan['blad'] else ''))
+        self.stan = stan
+
+
+def _adres(url: str) -> Tuple[str, int]:
+    czesci = urlsplit(url)
+    return czesci.hostname or '127.0.0.1', czesci.port or 80
+
+
+def _sprawdz(status: int, dane: Dict) -> Dict:
+    if status >= 400:
+        raise BladUslugi(status, dane.get('blad', ''), dane)
+    return dane
+
+
+def _wynik_zadania(stan: Dict) -> Dict:
+    """Wynik zakończonego zadania albo BladZadania dla błędu, przekroczenia czasu lub anulowania."""
+    if stan['stan'] != 'gotowe':
+        raise BladZadania(stan)
+    return stan['wynik']
+
+
+class KlientAsynchroniczny:
+    """Klient usługi dla kodu asyncio (połączenie na żądanie, bez zależności)."""
+    
+    def __init__(self, url: str = 'http://127.0.0.1:8765'):
+        self.host, self.port = _adres(url)
+        
+    async def __aenter__(self) -> 'KlientAsynchroniczny':
+        return self
+        
+    async def __aexit__(self, *wyjatek):
+        pass
+        
+    async def _polacz(self, metoda: str, sciezka: str, dane: Optional[Dict] = None):
+        czytnik, pisarz = await asyncio.open_connection(self.host, self.port)
+        cialo = b'' if dane is None else json.dumps(dane).encode('utf-8')
+        pisarz.write(f'{metoda} {sciezka} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n'
+                     f'Content-Type: application/json\r\nContent-Length: {len(cialo)}\r\n'
+                     f'Connection: close\r\n\r\n'.encode('latin-1') + cialo)
+        await pisarz.drain()
+        status = int((await czytnik.readline()).split()[1])
+        while (await czytnik.readline()).strip():
+            pass
+        return status, czytnik, pisarz
+        
+    async def _zapytaj(self, metoda: str, sciezka: str, dane: Optional[Dict] = None) -> Dict:
+        status, czytnik, pisarz = await self._polacz(metoda, sciezka, dane)
+        try:
+            return _sprawdz(status, json.loads(await czytnik.read()))
+        finally:
+            pisarz.close()
+        
+    async def zglos(self, zadanie: Dict) -> str:
+        """Zgłasza zadanie i zwraca jego id (BladUslugi 429, gdy kolejka usługi jest pełna)."""
+        return (await self._zapytaj('POST', '/zadania', zadanie))['id']
+        
+    async def stan(self, id_: str) -> Dict:
+        return await self._zapytaj('GET', f'/zadania/{id_}')
+        
+    async def anuluj(self, id_: str) -> Dict:
+        return await self._zapytaj('DELETE', f'/zadania/{id_}')
+        
+    async def stan_uslugi(self) -> Dict:
+        return await self._zapytaj('GET', '/stan')
+        
+    async def strumien(self, id_: str) -> AsyncIterator[Dict]:
+        """Kolejne stany zadania (od bieżącego do końcowego)."""
+        status, czytnik, pisarz = await self._polacz('GET', f'/zadania/{id_}/strumien')
+        try:
+            if status >= 400:
+                _sprawdz(status, json.loads(await czytnik.read()))
+            async for linia in czytnik:
+                yield json.loads(linia)
+        finally:
+            pisarz.close()
+        
+    async def czekaj(self, id_: str) -> Dict:
+        """Czeka na zakończenie zadania i zwraca jego wynik."""
+        async for stan in self.strumien(id_):
+            if stan['stan'] in KONCOWE:
+                return _wynik_zadania(stan)
+        raise ConnectionError(f"Strumień zadania {id_} zakończył się przed wynikiem")
+        
+    async def rozwiaz(self, zadanie: Dict, ponowienia: int = 10) -> Dict:
+        """Zgłasza zadanie (ponawiając przy pełnej kolejce) i zwraca wynik."""
+        for proba in range(ponowienia + 1):
+            try:
+                id_ = await self.zglos(zadanie)
+                break
+            except BladUslugi as e:
+                if e.status != 429 or proba == ponowienia:
+                    raise
+                await asyncio.sleep(min(0.05 * 2**proba, 2.0))
+        return await self.czekaj(id_)
+
+
+class Klient:
+    """Klient usługi dla kodu synchronicznego (http.client)."""
+    
+    def __init__(self, url: str = 'http://127.0.0.1:8765', timeout: Optional[float] = None):
+        self.host, self.port = _adres(url)
+        self.timeout = timeout
+        
+    def _polacz(self, metoda: str, sciezka: str, dane: Optional[Dict] = None):
+        polaczenie = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        cialo = None if dane is None else json.dumps(dane).encode('utf-8')
+        polaczenie.request(metoda, sciezka, body=cialo, headers={'Content-Type': 'application/json'})
+        return polaczenie, polaczenie.getresponse()
+        
+    def _zapytaj(self, metoda: str, sciezka: str, dane: Optional[Dict] = None) -> Dict:
+        polaczenie, odpowiedz = self._polacz(metoda, sciezka, dane)
+        try:
+            return _sprawdz(odpowiedz.status, json.loads(odpowiedz.read()))
+        finally:
+            polaczenie.close()
+        
+    def zglos(self, zadanie: Dict) -> str:
+        return self._zapytaj('POST', '/zadania', zadanie)['id']
+        
+    def stan(self, id_: str) -> Dict:
+        return self._zapytaj('GET', f'/zadania/{id_}')
+        
+    def anuluj(self, id_: str) -> Dict:
+        return self._zapytaj('DELETE', f'/zadania/{id_}')
+        
+    def stan_uslugi(self) -> Dict:
+        return self._zapytaj('GET', '/stan')
+        
+    def strumien(self, id_: str) -> Iterator[Dict]:
+        polaczenie, odpowiedz = self._polacz('GET', f'/zadania/{id_}/strumien')
+        try:
+            if odpowiedz.status >= 400:
+                _sprawdz(odpowiedz.status, json.loads(odpowiedz.read()))
+            for linia in odpowiedz:
+                yield json.loads(linia)
+        finally:
+            polaczenie.close()
+        
+    def czekaj(self, id_: str) -> Dict:
+        for stan in self.strumien(id_):
+            if stan['stan'] in KONCOWE:
+                return _wynik_zadania(stan)
+        raise ConnectionError(f"Strumień zadania {id_} zakończył się przed wynikiem")
+        
+    def rozwiaz(self, zadanie: Dict, ponowienia: int = 10) -> Dict:
+        for proba in range(ponowienia + 1):
+            try:
+                id_ = self.zglos(zadanie)
+                break
+            except BladUslugi as e:
+                if e.status != 429 or proba == ponowienia:
+                    raise
+                time.sleep(min(0.05 * 2**proba, 2.0))
+        return self.czekaj(id_)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Dyskowa pamięć podręczna wygenerowanych sieci przepływowych.
+
+Sieć jest zapisywana jako zestaw tablic NumPy (plik .npz) pod kluczem
+wyznaczonym z parametrów generatora (skrót SHA-256), więc te same parametry
+i ziarno zawsze trafiają w ten sam plik. Rozmiar katalogu jest ograniczony;
+po przekroczeniu limitu usuwane są najdawniej używane wpisy (LRU według
+czasu modyfikacji, odświeżanego przy każdym odczycie).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+import numpy as np
+
+
+ROZSZERZENIE = '.npz'
+
+
+class PamiecSieci:
+    def __init__(self, katalog: str, max_rozmiar: int = 512 * 2**20):
+        """
+        Args:
+            katalog: Katalog z plikami pamięci (tworzony, jeśli nie istnieje)
+            max_rozmiar: Limit łącznego rozmiaru plików w bajtach
+        """
+        self.katalog = katalog
+        self.max_rozmiar = max_rozmiar
+        os.makedirs(katalog, exist_ok=True)
+        
+    @staticmethod
+    def klucz(*parametry) -> str:
+        """Wyznacza klucz wpisu z parametrów (muszą dać się zapisać jako JSON)."""
+        opis = json.dumps(parametry, sort_keys=True)
+        return hashlib.sha256(opis.encode('utf-8')).hexdigest()
+        
+    def _sciezka(self, klucz: str) -> str:
+        return os.path.join(self.katalog, klucz + ROZSZERZENIE)
+        
+    def wczytaj(self, klucz: str) -> Optional[Dict[str, np.ndarray]]:
+        """Zwraca zapisane tablice albo None, gdy wpisu nie ma (lub jest uszkodzony)."""
+        sciezka = self._sciezka(klucz)
+        try:
+            with np.load(sciezka, allow_pickle=False) as dane:
+                tablice = {nazwa: dane[nazwa] for nazwa in dane.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Uszkodzony wpis traktujemy jak brak - zostanie wygenerowany ponownie
+            self.usun(klucz)
+            return None
+            
+        os.utime(sciezka)  # oznacz jako ostatnio używany
+        return tablice
+        
+    def zapisz(self, klucz: str, tablice: Dict[str, np.ndarray]):
+        """Zapisuje tablice pod kluczem i usuwa najdawniej używane wpisy ponad limit."""
+        # Zapis do pliku tymczasowego i podmiana - współbieżny odczyt nie widzi połowy pliku
+        uchwyt, tymczasowy = tempfile.mkstemp(dir=self.katalog, suffix='.tmp')
+        try:
+            with os.fdopen(uchwyt, 'wb') as plik:
+                np.savez(plik, **tablice)
+            os.replace(tymczasowy, self._sciezka(klucz))
+        except BaseException:
+            os.unlink(tymczasowy)
+            raise
+            
+        self._usun_nadmiar(chroniony=klucz)
+        
+    def usun(self, klucz: str):
+        """Usuwa wpis (brak wpisu nie jest błędem)."""
+        try:
+            os.unlink(self._sciezka(klucz))
+        except FileNotFoundError:
+            pass
+            
+    def _wpisy(self):
+        """Lista (czas użycia, rozmiar, ścieżka) wszystkich wpisów."""
+        wpisy = []
+        for nazwa in os.listdir(self.katalog):
+            if nazwa.endswith(ROZSZERZENIE):
+                sciezka = os.path.join(self.katalog, nazwa)
+                try:
+                    stat = os.stat(sciezka)
+                except FileNotFoundError:
+                    continue
+                wpisy.append((stat.st_mtime, stat.st_size, sciezka))
+        return wpisy
+        
+    def rozmiar(self) -> int:
+        """Łączny rozmiar wpisów w bajtach."""
+        return sum(rozmiar for _, rozmiar, _ in self._wpisy())
+        
+    def __contains__(self, klucz: str) -> bool:
+        return os.path.exists(self._sciezka(klucz))
+        
+    def _usun_nadmiar(self, chroniony: Optional[str] = None):
+        """Usuwa najdawniej używane wpisy, dopóki łączny rozmiar przekracza limit."""
+        wpisy = sorted(self._wpisy())
+        lacznie = sum(rozmiar for _, rozmiar, _ in wpisy)
+        chroniona_sciezka = None if chroniony is None else self._sciezka(chroniony)
+        
+        for _, rozmiar, sciezka in wpisy:
+            if lacznie <= self.max_rozmiar:
+                break
+            if sciezka == chroniona_sciezka:
+                continue  # właśnie zapisany wpis zostaje, nawet gdy sam przekracza limit
+            try:
+                os.unlink(sciezka)
+            except FileNotFoundError:
+                pass
+            lacznie -= rozmiar
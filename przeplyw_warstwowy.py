@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Zachłanny przepływ początkowy wzdłuż warstw sieci (ciepły start silników).
+
+Wierzchołki są przetwarzane warstwami od źródła do ujścia (SiecCSR.warstwy
+z generatora, a bez nich odległości BFS od źródła - jak w układzie do
+rysowania). Używane są tylko krawędzie prowadzące do dalszej warstwy, więc
+przepływ nie ma cykli:
+
+1. W przód: źródło wysyła tyle, ile według górnego ograniczenia (suma
+   po krawędziach w przód, liczona od ujścia) da się dostarczyć do ujścia,
+   a każdy wierzchołek rozdziela to, co do niego wpłynęło, na krawędzie
+   wychodzące od największej przepustowości, nie przekraczając żadnej
+   z nich ani ograniczenia wierzchołka docelowego.
+2. Wstecz: nadmiar, którego wierzchołek nie zdołał przesłać dalej, jest
+   odsyłany warstwami w stronę źródła przez zmniejszenie przepływu na
+   krawędziach wchodzących.
+
+Kolejne przebiegi powtarzają oba kroki na przepustowościach, które zostały
+wolne, dopóki coś dokładają (najwyżej PRZEBIEGI razy).
+
+Wynik jest dopuszczalnym przepływem (przepustowości i zachowanie przepływu),
+od którego silnik FordFulkerson szuka już tylko brakującej reszty. Każda
+warstwa to kilka operacji NumPy na wszystkich jej krawędziach.
+"""
+
+from typing import Dict, Hashable, Optional
+import numpy as np
+from siec_csr import SiecCSR
+from uklad_warstwowy import warstwy_ukladu
+
+
+PRZEBIEGI = 8  # przebiegi zachłanne (każdy w przód i wstecz)
+
+
+def _rozdziel(ilosci: np.ndarray, grupy: np.ndarray, limity: np.ndarray) -> np.ndarray:
+    """
+    Zachłanny podział ilosci[g] na kolejne elementy grupy g (posortowane
+    według grup), każdy co najwyżej do swojego limitu.
+    """
+    if not len(grupy):
+        return limity[:0].copy()
+    suma = np.cumsum(limity)
+    poczatek_grupy = np.flatnonzero(np.r_[True, grupy[1:] != grupy[:-1]])
+    liczby = np.diff(np.r_[poczatek_grupy, len(grupy)])
+    # Suma limitów poprzednich elementów tej samej grupy
+    przed = suma - limity - np.repeat(suma[poczatek_grupy] - limity[poczatek_grupy], liczby)
+    return np.clip(ilosci[grupy] - przed, 0, limity)
+
+
+def _przebieg(n: int, s: int, t: int, zrodla: np.ndarray, cele: np.ndarray, wolne: np.ndarray,
+              warstwy_w_przod, warstwy_wstecz) -> np.ndarray:
+    """Jeden przebieg w przód i wstecz po wolnych przepustowościach; zwraca dodany przepływ."""
+    # Górne ograniczenie przepływu z każdego wierzchołka do ujścia po krawędziach
+    # w przód (od najdalszych warstw) - wierzchołki bez drogi do ujścia nic nie dostaną
+    do_ujscia = np.zeros(n, dtype=wolne.dtype)
+    do_ujscia[t] = wolne.sum()
+    for krawedzie in reversed(warstwy_w_przod):
+        np.add.at(do_ujscia, zrodla[krawedzie], np.minimum(wolne[krawedzie], do_ujscia[cele[krawedzie]]))
+    
+    przeplyw = np.zeros(len(wolne), dtype=wolne.dtype)
+    wplyw = np.zeros(n, dtype=wolne.dtype)
+    wplyw[s] = do_ujscia[s]
+    for krawedzie in warstwy_w_przod:
+        limity = np.minimum(wolne[krawedzie], do_ujscia[cele[krawedzie]])
+        f = _rozdziel(np.minimum(wplyw, do_ujscia), zrodla[krawedzie], limity)
+        przeplyw[krawedzie] = f
+        np.add.at(wplyw, cele[krawedzie], f)
+    
+    nadmiar = wplyw
+    for krawedzie in warstwy_w_przod:
+        np.subtract.at(nadmiar, zrodla[krawedzie], przeplyw[krawedzie])
+    nadmiar[[s, t]] = 0
+    for krawedzie in warstwy_wstecz:
+        cofniete = _rozdziel(nadmiar, cele[krawedzie], przeplyw[krawedzie])
+        przeplyw[krawedzie] -= cofniete
+        np.add.at(nadmiar, zrodla[krawedzie], cofniete)
+        nadmiar[[s, t]] = 0
+    return przeplyw
+
+
+def przeplyw_warstwowy(siec: SiecCSR, source: Hashable = 's', sink: Hashable = 't',
+                       warstwy: Optional[np.ndarray] = None, max_przebiegow: int = PRZEBIEGI) -> np.ndarray:
+    """
+    Wyznacza zachłannie dopuszczalny przepływ warstwami od źródła do ujścia.
+    
+    Args:
+        siec: Sieć CSR (jej przepływ nie jest zmieniany)
+        source: Źródło
+        sink: Ujście
+        warstwy: Warstwa każdego wierzchołka (domyślnie warstwy_ukladu)
+        max_przebiegow: Najwięcej tylu przebiegów (kolejne dokładają przepływ
+            na przepustowościach wolnych po poprzednich)
+        
+    Returns:
+        Przepływy krawędzi (w kolejności krawędzi sieci)
+    """
+    przepustowosci = np.asarray(siec.przepustowosci)
+    przeplyw = np.zeros(siec.m, dtype=przepustowosci.dtype)
+    s, t = siec.indeks.get(source), siec.indeks.get(sink)
+    if s is None or t is None or s == t:
+        return przeplyw
+    
+    warstwa = warstwy_ukladu(siec, source, sink) if warstwy is None else np.asarray(warstwy, dtype=np.int64)
+    zrodla, cele = np.asarray(siec.zrodla), np.asarray(siec.cele)
+    uzyteczne = np.flatnonzero((warstwa[zrodla] < warstwa[cele]) & (cele != s) & (zrodla != t)
+                               & (przepustowosci > 0))
+    
+    # Krawędzie według warstwy początku, wierzchołka i malejącej przepustowości
+    # (w przód) oraz według warstwy końca malejąco i wierzchołka (wstecz)
+    w_przod = uzyteczne[np.lexsort((-przepustowosci[uzyteczne], zrodla[uzyteczne],
+                                    warstwa[zrodla[uzyteczne]]))]
+    warstwy_w_przod = np.split(w_przod, np.flatnonzero(np.diff(warstwa[zrodla[w_przod]])) + 1)
+    wstecz = uzyteczne[np.lexsort((cele[uzyteczne], -warstwa[cele[uzyteczne]]))]
+    warstwy_wstecz = np.split(wstecz, np.flatnonzero(np.diff(warstwa[cele[wstecz]])) + 1)
+    
+    for _ in range(max_przebiegow):
+        wolne = przepustowosci - przeplyw
+        dodany = _przebieg(siec.n, s, t, zrodla, cele, wolne, warstwy_w_przod, warstwy_wstecz)
+        if not dodany.any():
+            break
+        przeplyw += dodany
+    
+    return przeplyw
+
+
+def porownaj_start(siec: SiecCSR, source: Hashable = 's', sink: Hashable = 't',
+                   algorithm: Optional[str] = None, bfs: Optional[str] = None) -> Dict:
+    """
+    Liczy maksymalny przepływ od zera i od przepływu warstwowego i porównuje
+    liczby powiększeń (na kopiach sieci - jej przepływ nie jest zmieniany).
+    
+    Returns:
+        Słownik: max_flow, wartosc_startowa (przepływ po etapie zachłannym),
+        powiekszenia_od_zera, powiekszenia_ze_startem, zaoszczedzone
+        oraz czasy czas_od_zera i czas_ze_startem (w sekundach)
+    """
+    from zadanie2_ford_fulkerson import FordFulkerson
+    from dziennik import CISZA
+    
+    wyniki = {}
+    for start in ('zero', 'warstwowy'):
+        kopia = SiecCSR(siec.wezly, siec.zrodla, siec.cele, siec.przepustowosci, warstwy=siec.warstwy)
+        ff = FordFulkerson(kopia, history='off', verbosity=CISZA)
+        ff.znajdz_maksymalny_przeplyw(source, sink, algorithm=algorithm, bfs=bfs, start=start)
+        wyniki[start] = ff
+    
+    od_zera, ze_startem = wyniki['zero'], wyniki['warstwowy']
+    if od_zera.max_flow_value != ze_startem.max_flow_value:
+        raise RuntimeError(f"Różne wartości przepływu: {od_zera.max_flow_value} i {ze_startem.max_flow_value}")
+    return {
+        'max_flow': od_zera.max_flow_value,
+        'wartosc_startowa': ze_startem.statystyki.wartosc_startowa,
+        'powiekszenia_od_zera': od_zera.liczba_iteracji,
+        'powiekszenia_ze_startem': ze_startem.liczba_iteracji,
+        'zaoszczedzone': od_zera.liczba_iteracji - ze_startem.liczba_iteracji,
+        'czas_od_zera': od_zera.statystyki.czas_calkowity,
+        'czas_ze_startem': ze_startem.statystyki.czas_calkowity,
+    }
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Szybkie rysowanie dużych sieci przepływowych.
+
+Rysowanie przez networkx tworzy osobny obiekt matplotlib dla każdej krawędzi
+i każdej etykiety, więc sieć z tysiącami krawędzi rysuje się minutami.
+Tutaj wszystkie krawędzie to jedna LineCollection (kolor według nasycenia),
+wierzchołki to jeden wykres punktowy, a etykiety krawędzi powstają tylko
+dla małych sieci albo - w dużych - tylko dla krawędzi nasyconych.
+
+Przy zapisie do pliku (bez pokazywania okna) rysunek powstaje na płótnie
+Agg, bez pyplot i bez interaktywnego backendu, więc działa także na
+serwerze bez środowiska graficznego.
+"""
+
+from typing import Dict, Hashable, Optional, Sequence, Tuple, Union
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import matplotlib.patches as patches
+from siec_csr import SiecCSR
+
+
+PROG_ETYKIET = 300  # do tylu krawędzi (i wierzchołków) rysowane są wszystkie etykiety
+MAX_ETYKIET_NASYCONYCH = 200  # w większych sieciach - etykiety najwyżej tylu krawędzi nasyconych
+PROG_RYSOWANIA_NX = 200  # tryb 'auto': do tylu krawędzi rysuje networkx (strzałki, etykiety)
+
+KOLOR_NIEWYKORZYSTANEJ = 'lightgray'
+KOLOR_NASYCONEJ = 'red'
+KOLORY_WEZLOW = {'s': 'lightgreen', 't': 'lightcoral'}
+KOLOR_WEZLA = 'lightblue'
+
+
+def czy_szybki(tryb: str, liczba_krawedzi: int) -> bool:
+    """Rozstrzyga tryb rysowania: 'networkx', 'szybki' albo 'auto' (według rozmiaru)."""
+    if tryb not in ('auto', 'networkx', 'szybki'):
+        raise ValueError(f"Nieznany tryb rysowania: {tryb} (dostępne: auto, networkx, szybki)")
+    return tryb == 'szybki' or (tryb == 'auto' and liczba_krawedzi > PROG_RYSOWANIA_NX)
+
+
+def tablica_pozycji(wezly: Sequence[Hashable], pozycje: Union[Dict, np.ndarray]) -> np.ndarray:
+    """Pozycje wierzchołków jako tablica (n, 2) w kolejności wezly."""
+    if isinstance(pozycje, np.ndarray):
+        return pozycje
+    return np.array([pozycje[v] for v in wezly], dtype=float).reshape(len(wezly), 2)
+
+
+def _kolory_krawedzi(przepustowosci: np.ndarray, przeplyw: Optional[np.ndarray]):
+    """Kolory RGBA, grubości i maska nasycenia krawędzi."""
+    m = len(przepustowosci)
+    if przeplyw is None:
+        kolory = np.tile(to_rgba('gray', 0.6), (m, 1))
+        return kolory, np.full(m, 0.6), np.zeros(m, dtype=bool)
+        
+    nasycone = (przeplyw >= przepustowosci) & (przepustowosci > 0)
+    uzyte = (przeplyw > 0) & ~nasycone
+    # Krawędzie częściowo wykorzystane: odcień niebieskiego tym ciemniejszy, im większe nasycenie
+    stopien = np.divide(przeplyw, przepustowosci, out=np.zeros(m), where=przepustowosci > 0)
+    kolory = np.tile(to_rgba(KOLOR_NIEWYKORZYSTANEJ, 0.5), (m, 1))
+    kolory[uzyte] = np.column_stack((0.55 * (1 - stopien[uzyte]), 0.55 * (1 - stopien[uzyte]),
+                                     np.ones(uzyte.sum()), np.full(uzyte.sum(), 0.9)))
+    kolory[nasycone] = to_rgba(KOLOR_NASYCONEJ)
+    szerokosci = np.where(nasycone, 1.6, np.where(uzyte, 1.0, 0.4))
+    return kolory, szerokosci, nasycone
+
+
+def rysuj_siec(siec: SiecCSR, pozycje: Union[Dict, np.ndarray], przeplyw: Optional[np.ndarray] = None,
+               tytul: str = '', save_file: Optional[str] = None, pokaz: bool = False,
+               figsize: Tuple[int, int] = (14, 10), dpi: int = 150,
+               prog_etykiet: int = PROG_ETYKIET) -> Figure:
+    """
+    Rysuje sieć (opcjonalnie z przepływem) hurtowo, bez obiektu na krawędź.
+    
+    Args:
+        siec: Sieć CSR
+        pozycje: Słownik wierzchołek -> (x, y) albo tablica (n, 2) w kolejności siec.wezly
+        przeplyw: Przepływy krawędzi (kolory według nasycenia); None - sama sieć z przepustowościami
+        tytul: Tytuł rysunku
+        save_file: Plik wynikowy (rysunek powstaje wtedy na płótnie Agg)
+        pokaz: Czy pokazać okno przez pyplot (wymaga interaktywnego backendu)
+        figsize: Rozmiar rysunku w calach
+        dpi: Rozdzielczość zapisu
+        prog_etykiet: Do tylu krawędzi rysowane są etykiety wszystkich krawędzi i wierzchołków
+        
+    Returns:
+        Rysunek matplotlib
+    """
+    if pokaz:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    
+    xy = tablica_pozycji(siec.wezly, pozycje)
+    zrodla, cele = np.asarray(siec.zrodla), np.asarray(siec.cele)
+    przepustowosci = np.asarray(siec.przepustowosci)
+    if przeplyw is not None:
+        przeplyw = np.asarray(przeplyw)
+        
+    kolory, szerokosci, nasycone = _kolory_krawedzi(przepustowosci, przeplyw)
+    # Nasycone krawędzie na wierzchu
+    kolejnosc = np.argsort(nasycone, kind='stable')
+    odcinki = np.stack((xy[zrodla], xy[cele]), axis=1)[kolejnosc]
+    male = siec.m <= prog_etykiet
+    # Wygładzanie tysięcy cienkich linii kosztuje więcej niż samo rysowanie, a nie poprawia wyglądu
+    ax.add_collection(LineCollection(odcinki, colors=kolory[kolejnosc], linewidths=szerokosci[kolejnosc],
+                                     antialiaseds=male, zorder=1))
+    
+    if male and siec.m:
+        # Grot kierunku w 60% długości krawędzi (jeden obiekt dla wszystkich krawędzi)
+        wektor = xy[cele] - xy[zrodla]
+        grot = xy[zrodla] + 0.6 * wektor
+        ax.quiver(grot[:, 0], grot[:, 1], wektor[:, 0] * 0.01, wektor[:, 1] * 0.01, color=kolory,
+                  angles='xy', scale_units='xy', scale=1, pivot='tip', width=0.002, headwidth=8,
+                  headlength=10, headaxislength=9, minlength=0, zorder=2)
+    
+    kolory_wezlow = [KOLORY_WEZLOW.get(v, KOLOR_WEZLA) for v in siec.wezly]
+    rozmiar = 600 if siec.n <= prog_etykiet else max(1.0, 20000 / max(siec.n, 1))
+    ax.scatter(xy[:, 0], xy[:, 1], s=rozmiar, c=kolory_wezlow, alpha=0.9, linewidths=0, zorder=3)
+    
+    # Etykiety: wszystkie w małych sieciach, w dużych tylko części krawędzi nasyconych i s, t
+    if male:
+        etykietowane = np.arange(siec.m)
+        for i, v in enumerate(siec.wezly):
+            ax.text(xy[i, 0], xy[i, 1], str(v), fontsize=9, fontweight='bold',
+                    ha='center', va='center', zorder=4)
+    else:
+        etykietowane = np.flatnonzero(nasycone)[:MAX_ETYKIET_NASYCONYCH]
+        for v in ('s', 't'):
+            if v in siec.indeks:
+                i = siec.indeks[v]
+                ax.text(xy[i, 0], xy[i, 1], v, fontsize=10, fontweight='bold', ha='center', va='center', zorder=4)
+    srodki = (xy[zrodla[etykietowane]] + xy[cele[etykietowane]]) / 2
+    for (x, y), e in zip(srodki.tolist(), etykietowane.tolist()):
+        opis = str(przepustowosci[e]) if przeplyw is None else f"{przeplyw[e]}/{przepustowosci[e]}"
+        ax.text(x, y, opis, fontsize=7, ha='center', va='center', zorder=5,
+                bbox=dict(boxstyle='round,pad=0.1', fc='white', ec='none', alpha=0.7))
+    
+    legenda = [patches.Patch(color=KOLORY_WEZLOW['s'], label='Źródło (s)'),
+               patches.Patch(color=KOLORY_WEZLOW['t'], label='Ujście (t)'),
+               patches.Patch(color=KOLOR_WEZLA, label='Wierzchołki pośrednie')]
+    if przeplyw is not None:
+        legenda += [patches.Patch(color=KOLOR_NASYCONEJ, label='Krawędzie nasycone'),
+                    patches.Patch(color='blue', label='Krawędzie częściowo wykorzystane'),
+                    patches.Patch(color=KOLOR_NIEWYKORZYSTANEJ, label='Krawędzie niewykorzystane')]
+    ax.legend(handles=legenda, loc='upper right')
+    ax.set_title(tytul, fontsize=14, fontweight='bold')
+    ax.autoscale_view()
+    ax.margins(0.03)
+    ax.axis('off')
+    # Stałe marginesy zamiast tight_layout, który rysuje całą sieć dodatkowy raz
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.92)
+    
+    if save_file:
+        fig.savefig(save_file, dpi=dpi)
+    if pokaz:
+        import matplotlib.pyplot as plt
+        plt.show()
+    return fig
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Zwarta reprezentacja sieci przepływowej w formacie CSR.
+
+Wierzchołki są numerowane 0..n-1 (z odwzorowaniem nazwa <-> numer), a sieć
+rezydualna jest zapisana w tablicach NumPy: każda krawędź e = (u, v) daje
+łuk w przód (u -> v) i łuk wsteczny (v -> u). Łuki są posortowane według
+wierzchołka początkowego, więc łuki wychodzące z v to zakres
+poczatki[v]:poczatki[v + 1]. Kolejność łuków jednego wierzchołka odpowiada
+kolejności krawędzi w grafie, co zachowuje deterministyczny przebieg BFS.
+
+Reprezentacja jest budowana raz (z grafu networkx albo bezpośrednio przez
+generator) i używana przez silniki maksymalnego przepływu; słownik
+przepływów (u, v) -> f powstaje dopiero na granicy API.
+"""
+
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def _jako_tablica(wartosci) -> np.ndarray:
+    """Zamienia przepustowości na int64 (lub float64, gdy nie są całkowite)."""
+    tablica = np.asarray(wartosci)
+    if tablica.dtype.kind == 'f':
+        return tablica.astype(np.float64)
+    return tablica.astype(np.int64)
+
+
+class SiecCSR:
+    def __init__(self, wezly: Sequence[Hashable], zrodla, cele, przepustowosci,
+                 warstwy=None, przeplyw=None):
+        """
+        Tworzy sieć z list krawędzi podanych numerami wierzchołków.
+        
+        Args:
+            wezly: Nazwy wierzchołków (pozycja na liście to numer wierzchołka)
+            zrodla: Numery początków krawędzi
+            cele: Numery końców krawędzi
+            przepustowosci: Przepustowości krawędzi
+            warstwy: Opcjonalny numer warstwy każdego wierzchołka
+            przeplyw: Opcjonalny przepływ początkowy na krawędziach (domyślnie 0)
+        """
+        self.wezly = list(wezly)
+        self._indeks = None
+        self.zrodla = np.asarray(zrodla, dtype=np.int64)
+        self.cele = np.asarray(cele, dtype=np.int64)
+        self.przepustowosci = _jako_tablica(przepustowosci)
+        self.warstwy = None if warstwy is None else np.asarray(warstwy, dtype=np.int64)
+        
+        if przeplyw is None:
+            self.przeplyw = np.zeros(self.m, dtype=self.przepustowosci.dtype)
+        else:
+            self.przeplyw = np.asarray(przeplyw, dtype=self.przepustowosci.dtype)
+            
+        self._nazwy_krawedzi = None
+        self._numery_krawedzi = None
+        self.zmapowana = False  # czy tablice są odwzorowane z pliku (format_binarny)
+        self._zbuduj_csr()
+        
+    @property
+    def indeks(self) -> Dict[Hashable, int]:
+        """Odwzorowanie nazwa wierzchołka -> numer (budowane przy pierwszym użyciu)."""
+        if self._indeks is None:
+            self._indeks = {v: i for i, v in enumerate(self.wezly)}
+        return self._indeks
+    
+    @property
+    def n(self) -> int:
+        """Liczba wierzchołków."""
+        return len(self.wezly)
+        
+    @property
+    def m(self) -> int:
+        """Liczba krawędzi (łuków jest 2m)."""
+        return len(self.zrodla)
+        
+    def _zbuduj_csr(self):
+        """Wyznacza tablice CSR łuków w przód i wstecz."""
+        n, m = self.n, self.m
+        
+        # Łuk 2e to e w przód, łuk 2e + 1 to e wstecz (kolejność przed sortowaniem)
+        ogony = np.empty(2 * m, dtype=np.int64)
+        ogony[0::2] = self.zrodla
+        ogony[1::2] = self.cele
+        glowy = np.empty(2 * m, dtype=np.int64)
+        glowy[0::2] = self.cele
+        glowy[1::2] = self.zrodla
+        
+        # Sortowanie stabilne zachowuje kolejność krawędzi wśród łuków wierzchołka
+        porzadek = np.argsort(ogony, kind='stable')
+        pozycja = np.empty(2 * m, dtype=np.int64)
+        pozycja[porzadek] = np.arange(2 * m, dtype=np.int64)
+        
+        self.poczatki = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ogony, minlength=n), out=self.poczatki[1:])
+        self.glowy = glowy[porzadek]
+        self.krawedz_luku = porzadek >> 1       # krawędź, z której pochodzi łuk
+        self.w_przod = (porzadek & 1) == 0      # czy łuk ma kierunek krawędzi
+        self.odwrotny = pozycja[porzadek ^ 1]   # łuk przeciwny
+        self.luk_przod = pozycja[0::2]          # łuk w przód krawędzi e
+        self.luk_tyl = pozycja[1::2]            # łuk wsteczny krawędzi e
+        
+    @classmethod
+    def z_tablic(cls, wezly: Sequence[Hashable], tablice: Dict[str, np.ndarray],
+                 zmapowana: bool = False) -> 'SiecCSR':
+        """
+        Tworzy sieć z gotowych tablic (krawędzi i CSR) bez ich kopiowania i przeliczania.
+        
+        Args:
+            wezly: Nazwy wierzchołków
+            tablice: zrodla, cele, przepustowosci, poczatki, glowy, krawedz_luku,
+                w_przod, odwrotny, luk_przod, luk_tyl oraz opcjonalnie
+                przeplyw i warstwy
+            zmapowana: Czy tablice są odwzorowaniem pliku w pamięci
+        """
+        siec = cls.__new__(cls)
+        siec.wezly = list(wezly)
+        siec._indeks = None
+        siec._nazwy_krawedzi = None
+        siec._numery_krawedzi = None
+        siec.zmapowana = zmapowana
+        for nazwa in ('zrodla', 'cele', 'przepustowosci', 'poczatki', 'glowy', 'krawedz_luku',
+                      'w_przod', 'odwrotny', 'luk_przod', 'luk_tyl'):
+            setattr(siec, nazwa, tablice[nazwa])
+        siec.warstwy = tablice.get('warstwy')
+        siec.przeplyw = tablice.get('przeplyw')
+        if siec.przeplyw is None:
+            siec.przeplyw = np.zeros(siec.m, dtype=siec.przepustowosci.dtype)
+        return siec
+        
+    @classmethod
+    def z_grafu(cls, graph: 'nx.DiGraph', capacity: str = 'capacity') -> 'SiecCSR':
+        """Buduje reprezentację CSR z grafu networkx (z atrybutem 'warstwa', jeśli jest)."""
+        wezly = list(graph.nodes())
+        indeks = {v: i for i, v in enumerate(wezly)}
+        
+        m = graph.number_of_edges()
+        zrodla = np.empty(m, dtype=np.int64)
+        cele = np.empty(m, dtype=np.int64)
+        przepustowosci = []
+        for e, (u, v, c) in enumerate(graph.edges(data=capacity)):
+            zrodla[e] = indeks[u]
+            cele[e] = indeks[v]
+            przepustowosci.append(c)
+            
+        warstwy = None
+        if wezly and all('warstwa' in d for _, d in graph.nodes(data=True)):
+            warstwy = [d['warstwa'] for _, d in graph.nodes(data=True)]
+            
+        return cls(wezly, zrodla, cele, przepustowosci, warstwy=warstwy)
+        
+    @classmethod
+    def z_krawedzi(cls, krawedzie: Sequence[Tuple[Hashable, Hashable, float]]) -> 'SiecCSR':
+        """Buduje sieć z listy (u, v, przepustowość); wierzchołki numerowane w kolejności wystąpień."""
+        indeks = {}
+        zrodla, cele, przepustowosci = [], [], []
+        for u, v, c in krawedzie:
+            zrodla.append(indeks.setdefault(u, len(indeks)))
+            cele.append(indeks.setdefault(v, len(indeks)))
+            przepustowosci.append(c)
+        return cls(list(indeks), zrodla, cele, przepustowosci)
+        
+    def do_grafu(self) -> 'nx.DiGraph':
+        """Odtwarza graf networkx z przepustowościami (i warstwami, jeśli są)."""
+        import networkx as nx
+        graph = nx.DiGraph()
+        if self.warstwy is not None:
+            graph.add_nodes_from((v, {'warstwa': w}) for v, w in zip(self.wezly, self.warstwy.tolist()))
+        else:
+            graph.add_nodes_from(self.wezly)
+            
+        graph.add_edges_from((u, v, {'capacity': c}) for (u, v), c
+                             in zip(self.nazwy_krawedzi(), self.przepustowosci.tolist()))
+        return graph
+        
+    def nazwy_krawedzi(self) -> List[Tuple[Hashable, Hashable]]:
+        """Zwraca krawędzie jako pary nazw wierzchołków (w kolejności krawędzi)."""
+        if self._nazwy_krawedzi is None:
+            wezly = self.wezly
+            self._nazwy_krawedzi = [(wezly[u], wezly[v])
+                                    for u, v in zip(self.zrodla.tolist(), self.cele.tolist())]
+        return self._nazwy_krawedzi
+        
+    def numer_krawedzi(self, u: Hashable, v: Hashable) -> Optional[int]:
+        """Numer krawędzi (u, v) lub None (dla krawędzi równoległych - pierwszej)."""
+        if self._numery_krawedzi is None:
+            self._numery_krawedzi = {}
+            for e, nazwa in enumerate(self.nazwy_krawedzi()):
+                self._numery_krawedzi.setdefault(nazwa, e)
+        return self._numery_krawedzi.get((u, v))
+        
+    def rezydualna(self) -> np.ndarray:
+        """Przepustowości rezydualne łuków dla bieżącego przepływu."""
+        przeplyw = self.przeplyw[self.krawedz_luku]
+        return np.where(self.w_przod, self.przepustowosci[self.krawedz_luku] - przeplyw, przeplyw)
+        
+    def ustaw_przeplyw_z_rezydualnej(self, rezydualna):
+        """Odczytuje przepływ krawędzi z przepustowości rezydualnej łuków wstecznych."""
+        self.przeplyw = np.asarray(rezydualna, dtype=self.przepustowosci.dtype)[self.luk_tyl]
+        
+    def slownik_przeplywu(self) -> Dict[Tuple[Hashable, Hashable], int]:
+        """
+        Zwraca przepływ jako słownik (u, v) -> f (konwersja na granicy API).
+        
+        Przepływy krawędzi równoległych są sumowane; przepływ każdej z nich
+        osobno jest w tablicy przeplyw.
+        """
+        slownik = dict(zip(self.nazwy_krawedzi(), self.przeplyw.tolist()))
+        if len(slownik) < self.m:
+            slownik = dict.fromkeys(slownik, 0)
+            for nazwa, f in zip(self.nazwy_krawedzi(), self.przeplyw.tolist()):
+                slownik[nazwa] += f
+        return slownik
+        
+    def wartosc_przeplywu(self, source: Hashable) -> int:
+        """Przepływ netto wychodzący ze źródła."""
+        s = self.indeks.get(source)
+        if s is None:
+            return 0
+        return (self.przeplyw[self.zrodla == s].sum() - self.przeplyw[self.cele == s].sum()).item()
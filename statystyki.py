@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Statystyki obliczeń maksymalnego przepływu: czasy faz i liczniki operacji.
+
+FordFulkerson wypełnia nowy obiekt Statystyki przy każdym wywołaniu
+znajdz_maksymalny_przeplyw. Silniki zliczają operacje w zmiennych lokalnych
+i dopisują je raz na przeszukanie, a czasy mierzą perf_counter raz na
+ścieżkę lub fazę, więc zbieranie statystyk może być zawsze włączone.
+"""
+
+from typing import Dict, Optional, Union
+
+
+class Statystyki:
+    """Czasy faz (w sekundach) i liczniki operacji jednego obliczenia przepływu."""
+    
+    CZASY = (
+        'czas_startu',        # zachłanny przepływ początkowy (start='warstwowy')
+        'czas_budowy',        # przygotowanie sieci rezydualnej
+        'czas_bfs',           # wyszukiwanie ścieżek i poziomów (BFS, DFS Dinica, globalne przeetykietowanie)
+        'czas_powiekszania',  # powiększanie przepływu (w push-relabel: przepychanie i przeetykietowania)
+        'czas_wartosci',      # wyznaczenie wartości przepływu
+    )
+    LICZNIKI = (
+        'sciezki',            # ścieżki powiększające
+        'zdjete_z_kolejki',   # wierzchołki zdjęte z kolejek BFS
+        'przejrzane_luki',    # łuki sprawdzone przez przeszukiwania i rozładowania
+        'cofniecia',          # powiększenia wzdłuż łuków wstecznych (cofnięcie przepływu)
+        'pchniecia',          # przepchnięcia push-relabel
+        'przeetykietowania',  # przeetykietowania push-relabel
+    )
+    __slots__ = ('algorithm', 'czas_calkowity', 'wartosc_startowa') + CZASY + LICZNIKI
+    
+    def __init__(self, algorithm: Optional[str] = None):
+        self.algorithm = algorithm
+        self.czas_calkowity = 0.0
+        self.wartosc_startowa = 0  # wartość przepływu, od którego ruszył silnik
+        for nazwa in self.CZASY:
+            setattr(self, nazwa, 0.0)
+        for nazwa in self.LICZNIKI:
+            setattr(self, nazwa, 0)
+            
+    def slownik(self) -> Dict[str, Union[str, int, float, None]]:
+        """Statystyki jako słownik (np. do zapisu w JSON)."""
+        return {nazwa: getattr(self, nazwa) for nazwa in self.__slots__}
+        
+    def __repr__(self) -> str:
+        pola = ', '.join(f'{nazwa}={getattr(self, nazwa)!r}' for nazwa in self.__slots__)
+        return f'Statystyki({pola})'
+        
+    def __str__(self) -> str:
+        linie = [f"Algorytm: {self.algorithm}, czas całkowity: {self.czas_calkowity * 1000:.2f} ms"]
+        for nazwa in self.CZASY:
+            udzial = getattr(self, nazwa) / self.czas_calkowity * 100 if self.czas_calkowity else 0
+            linie.append(f"  {nazwa}: {getattr(self, nazwa) * 1000:.2f} ms ({udzial:.1f}%)")
+        for nazwa in self.LICZNIKI:
+            linie.append(f"  {nazwa}: {getattr(self, nazwa)}")
+        return '\n'.join(linie)
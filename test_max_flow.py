@@ -6,7 +6,28 @@ Pozwala na łatwe testowanie różnych konfiguracji sieci
 
 from zadanie1_siec_przeplywowa import SiecPrzeplywowa
 from zadanie2_ford_fulkerson import FordFulkerson
+from dziennik import UjscieLista, CISZA, ITERACJE, PODSUMOWANIE
+from magazyn_sieci import PamiecSieci
+from format_binarny import wczytaj_siec, zapisz_siec
+from siec_csr import SiecCSR
+from format_dimacs import wczytaj_dimacs, zapisz_dimacs, zapisz_przeplyw_dimacs
+from wsadowe import rozwiaz_wsadowo, rozwiaz_zadanie
+from przeplyw_warstwowy import przeplyw_warstwowy, porownaj_start
+from drzewo_gomory_hu import DrzewoGomoryegoHu
+from rysowanie import czy_szybki, tablica_pozycji
+from uklad_warstwowy import liczba_przeciec, pozycje_warstwowe, uklad_warstwowy, uklad_warstwowy_grafu
+from weryfikacja import sprawdz_przeplyw, zapisz_raport_csv
+from benchmark_max_flow import niezgodne_przeplywy, porownaj_z_baseline, przypadki, uruchom, wczytaj_wzorzec
+import benchmark_importu
+from usluga_przeplywu import UslugaPrzeplywu
+from klient_przeplywu import BladUslugi, BladZadania, Klient, KlientAsynchroniczny
+import asyncio
 import networkx as nx
+import numpy as np
+import os
+import random
+import shutil
+import tempfile
 
 
 def test_klasyczny_przyklad():
@@ -168,6 +189,936 @@ def test_cofanie_przepływu():
     return max_flow
 
 
+def test_zgodnosc_z_networkx():
+    """Test zgodności wyniku z implementacją networkx na losowych sieciach."""
+    print("\n" + "="*50)
+    print("TEST: Zgodność z networkx.maximum_flow_value")
+    print("="*50)
+    
+    for N in [2, 5, 10]:
+        generator = SiecPrzeplywowa(N=N, min_capacity=1, max_capacity=20)
+        siec = generator.generuj_siec()
+        
+        oczekiwany = nx.maximum_flow_value(siec, 's', 't')
+        
+        for algorithm in FordFulkerson.ALGORYTMY:
+            ff = FordFulkerson(siec)
+            max_flow = ff.znajdz_maksymalny_przeplyw(algorithm=algorithm)
+            
+            print(f"N={N}, {algorithm}: przepływ={max_flow}, networkx={oczekiwany}")
+            assert max_flow == oczekiwany
+
+
+def test_wszystkie_algorytmy():
+    """Test wszystkich silników na przykładach o znanym maksymalnym przepływie."""
+    print("\n" + "="*50)
+    print("TEST: Wszystkie algorytmy na przykładach testowych")
+    print("="*50)
+    
+    przyklady = {
+        'klasyczny': ([('s', 'v1', 16), ('s', 'v2', 13), ('v1', 'v2', 10), ('v1', 'v3', 12),
+                       ('v2', 'v1', 4), ('v2', 'v4', 14), ('v3', 'v2', 9), ('v3', 't', 20),
+                       ('v4', 'v3', 7), ('v4', 't', 4)], 23),
+        'waskie_gardlo': ([('s', 'a', 100), ('s', 'b', 100), ('a', 'c', 1),
+                           ('b', 'c', 100), ('c', 't', 100)], 100),  # c->t ogranicza do 100
+        'cofanie': ([('s', 'a', 10), ('s', 'b', 10), ('a', 'b', 1),
+                     ('a', 't', 1), ('b', 't', 10)], 11),
+    }
+    
+    for nazwa, (krawedzie, oczekiwany) in przyklady.items():
+        G = nx.DiGraph()
+        for u, v, c in krawedzie:
+            G.add_edge(u, v, capacity=c)
+        
+        for algorithm in FordFulkerson.ALGORYTMY:
+            ff = FordFulkerson(G)
+            max_flow = ff.znajdz_maksymalny_przeplyw(algorithm=algorithm)
+            
+            print(f"{nazwa}, {algorithm}: przepływ={max_flow} (oczekiwane: {oczekiwany})")
+            assert max_flow == oczekiwany
+
+
+def test_skalowanie_przepustowosci():
+    """Test faz skalowania przepustowości: progi, powiększenia i przepustowości poniżej 1."""
+    print("\n" + "="*50)
+    print("TEST: Skalowanie przepustowości")
+    print("="*50)
+    
+    # Szeroki zakres przepustowości: fazy od 2**floor(log2(U)) do 1, mniej powiększeń niż EK
+    losowe = np.random.default_rng(0)
+    G = nx.DiGraph()
+    for u in range(30):
+        for v in range(30):
+            if u != v and losowe.random() < 0.3:
+                G.add_edge(u, v, capacity=int(losowe.integers(1, 10**6, endpoint=True)))
+    U = max(c for _, _, c in G.edges(data='capacity'))
+    ek = FordFulkerson(G, history='off', verbosity=CISZA)
+    oczekiwany = ek.znajdz_maksymalny_przeplyw(0, 29, algorithm='edmonds-karp')
+    ff = FordFulkerson(G, history='off', verbosity=CISZA)
+    assert ff.znajdz_maksymalny_przeplyw(0, 29, algorithm='capacity-scaling') == oczekiwany
+    delty = [faza['delta'] for faza in ff.fazy_skalowania]
+    print(f"U={U}: faz {len(delty)}, powiększeń {ff.liczba_iteracji} (Edmonds-Karp: {ek.liczba_iteracji})")
+    assert delty == [2**k for k in range(U.bit_length() - 1, -1, -1)]
+    assert sum(faza['augmentations'] for faza in ff.fazy_skalowania) == ff.liczba_iteracji
+    assert ff.liczba_iteracji < ek.liczba_iteracji
+    
+    # Próg >= delta: łuk o przepustowości równej delta jest używany już w jej fazie
+    G = nx.DiGraph()
+    for u, v, c in [('s', 'a', 4), ('a', 't', 4), ('s', 'b', 3), ('b', 't', 3)]:
+        G.add_edge(u, v, capacity=c)
+    ff = FordFulkerson(G, history='off', verbosity=CISZA)
+    assert ff.znajdz_maksymalny_przeplyw(algorithm='capacity-scaling') == 7
+    assert ff.fazy_skalowania == [{'delta': 4, 'augmentations': 1}, {'delta': 2, 'augmentations': 1},
+                                  {'delta': 1, 'augmentations': 0}]
+    
+    # Przepustowości ułamkowe, także wszystkie poniżej 1 (jedna faza - zwykły Edmonds-Karp)
+    for krawedzie, oczekiwany, fazy in (([('s', 'a', 0.5), ('a', 't', 0.25)], 0.25, 1),
+                                        ([('s', 'a', 2.5), ('a', 't', 1.5), ('s', 't', 0.75)], 2.25, 2)):
+        G = nx.DiGraph()
+        for u, v, c in krawedzie:
+            G.add_edge(u, v, capacity=c)
+        ff = FordFulkerson(G, history='off', verbosity=CISZA)
+        assert ff.znajdz_maksymalny_przeplyw(algorithm='capacity-scaling') == oczekiwany
+        assert len(ff.fazy_skalowania) == fazy and ff.fazy_skalowania[-1]['delta'] == 1
+
+
+def test_tryby_historii():
+    """Test odtwarzania przepływu z przyrostowej historii iteracji."""
+    print("\n" + "="*50)
+    print("TEST: Tryby historii iteracji")
+    print("="*50)
+    
+    generator = SiecPrzeplywowa(N=6, min_capacity=1, max_capacity=20)
+    siec = generator.generuj_siec()
+    
+    pelna = FordFulkerson(siec, history='full')
+    pelna.znajdz_maksymalny_przeplyw()
+    
+    for history in ['delta', 'checkpoints']:
+        ff = FordFulkerson(siec, history=history, checkpoint_interval=2)
+        ff.znajdz_maksymalny_przeplyw()
+        ff.wypisz_historie_iteracji()
+        
+        print(f"{history}: iteracje={ff.liczba_iteracji}, punkty kontrolne={sorted(ff._punkty_kontrolne)}")
+        assert 'flow' not in ff.iterations[0]
+        for k in range(ff.liczba_iteracji + 1):
+            assert ff.przeplyw_w_iteracji(k) == pelna.przeplyw_w_iteracji(k)
+    
+    ff = FordFulkerson(siec, history='off')
+    ff.znajdz_maksymalny_przeplyw()
+    assert ff.iterations == [] and ff.liczba_iteracji == pelna.liczba_iteracji
+    
+    # Push-relabel nie zapisuje ścieżek - odtwarzanie przepływu z historii jest odrzucane
+    for algorytm in ('push-relabel', 'push-relabel-fifo'):
+        ff = FordFulkerson(siec, verbosity=CISZA)
+        ff.znajdz_maksymalny_przeplyw(algorithm=algorytm)
+        try:
+            ff.przeplyw_w_iteracji(0)
+            assert False, "push-relabel nie ma historii ścieżek"
+        except ValueError as e:
+            assert algorytm in str(e)
+
+
+def test_poziomy_dziennika():
+    """Test przekazywania zdarzeń do ujścia i trybu cichego."""
+    print("\n" + "="*50)
+    print("TEST: Poziomy dziennika zdarzeń")
+    print("="*50)
+    
+    zdarzenia = UjscieLista()
+    generator = SiecPrzeplywowa(N=4, verbosity=CISZA, sink=zdarzenia)
+    siec = generator.generuj_siec()
+    
+    ff = FordFulkerson(siec, verbosity=CISZA, sink=zdarzenia)
+    ff.znajdz_maksymalny_przeplyw()
+    assert zdarzenia.zdarzenia == []
+    
+    ff = FordFulkerson(siec, verbosity=ITERACJE, sink=zdarzenia)
+    max_flow = ff.znajdz_maksymalny_przeplyw()
+    
+    poziomy = {poziom for poziom, _ in zdarzenia.zdarzenia}
+    print(f"Zebrano {len(zdarzenia.zdarzenia)} zdarzeń, poziomy: {sorted(poziomy)}")
+    assert poziomy == {ITERACJE, PODSUMOWANIE}
+    assert zdarzenia.zdarzenia[-1] == (PODSUMOWANIE, f"Maksymalny przepływ: {max_flow}")
+
+
+def test_siec_csr():
+    """Test rozwiązywania sieci podanej bezpośrednio w postaci CSR."""
+    print("\n" + "="*50)
+    print("TEST: Sieć w postaci CSR")
+    print("="*50)
+    
+    generator = SiecPrzeplywowa(N=5, min_capacity=1, max_capacity=15)
+    siec = generator.generuj_siec()
+    csr = generator.do_csr()
+    
+    print(f"Wierzchołki: {csr.n}, krawędzie: {csr.m}, łuki: {len(csr.glowy)}")
+    assert nx.utils.graphs_equal(csr.do_grafu(), siec)
+    assert csr.warstwy.tolist() == [siec.nodes[v]['warstwa'] for v in csr.wezly]
+    
+    ff_nx = FordFulkerson(siec)
+    ff_csr = FordFulkerson(csr)
+    assert ff_csr.znajdz_maksymalny_przeplyw() == ff_nx.znajdz_maksymalny_przeplyw()
+    assert ff_csr.flow == {e: int(f) for e, f in zip(csr.nazwy_krawedzi(), csr.przeplyw)}
+
+
+def test_generator_wektorowy():
+    """Test generatora wektorowego (NumPy) - struktura warstw i zgodność przepływu."""
+    print("\n" + "="*50)
+    print("TEST: Wektorowy generator sieci")
+    print("="*50)
+    
+    for N in [2, 5, 20]:
+        generator = SiecPrzeplywowa(N=N, min_capacity=1, max_capacity=15, verbosity=CISZA)
+        csr = generator.generuj_siec_csr()
+        siec = generator.zbuduj_graf()
+        
+        print(f"N={N}: wierzchołki={csr.n}, krawędzie={csr.m}")
+        assert siec.in_degree('s') == 0 and siec.out_degree('t') == 0
+        assert all(siec.out_degree(v) > 0 for v in siec if v != 't')
+        assert all(siec.in_degree(v) > 0 for v in siec if v != 's')
+        assert all(siec.nodes[u]['warstwa'] + 1 == siec.nodes[v]['warstwa']
+                   for u, v in csr.nazwy_krawedzi()[:csr.m - 2 * N])
+        assert all(1 <= c <= 15 for _, _, c in siec.edges(data='capacity'))
+        assert len(generator.warstwy) == N + 2 and set(generator.pozycje) == set(siec)
+        
+        ff = FordFulkerson(csr, verbosity=CISZA)
+        assert ff.znajdz_maksymalny_przeplyw() == nx.maximum_flow_value(siec, 's', 't')
+
+
+def test_ziarno_i_pamiec_sieci():
+    """Test powtarzalności generatora (seed) i dyskowej pamięci podręcznej sieci."""
+    print("\n" + "="*50)
+    print("TEST: Ziarno generatora i pamięć podręczna")
+    print("="*50)
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        pamiec = PamiecSieci(katalog)
+        for metoda in ['generuj_siec', 'generuj_siec_csr']:
+            pierwszy = SiecPrzeplywowa(N=4, seed=7, verbosity=CISZA, cache=pamiec)
+            bez_pamieci = SiecPrzeplywowa(N=4, seed=7, verbosity=CISZA)
+            zdarzenia = UjscieLista()
+            z_pamieci = SiecPrzeplywowa(N=4, seed=7, verbosity=PODSUMOWANIE, sink=zdarzenia, cache=pamiec)
+            
+            wyniki = [getattr(g, metoda)() for g in (pierwszy, bez_pamieci, z_pamieci)]
+            if metoda == 'generuj_siec_csr':
+                wyniki = [g.zbuduj_graf() for g in (pierwszy, bez_pamieci, z_pamieci)]
+            
+            assert any('pamięci podręcznej' in w for _, w in zdarzenia.zdarzenia)
+            assert all(list(g.edges(data=True)) == list(wyniki[0].edges(data=True)) for g in wyniki)
+            assert all(list(g.nodes(data=True)) == list(wyniki[0].nodes(data=True)) for g in wyniki)
+            assert z_pamieci.warstwy == pierwszy.warstwy and z_pamieci.pozycje == pierwszy.pozycje
+        
+        inny = SiecPrzeplywowa(N=4, seed=8, verbosity=CISZA).generuj_siec()
+        assert list(inny.edges(data=True)) != list(wyniki[0].edges(data=True))
+        
+        # Kolejne wywołania z seed dają tę samą sieć z pamięcią i bez niej, z rng - nowe sieci
+        wzor = list(SiecPrzeplywowa(N=4, seed=7, verbosity=CISZA).generuj_siec().edges(data=True))
+        for generator in (SiecPrzeplywowa(N=4, seed=7, verbosity=CISZA),
+                          SiecPrzeplywowa(N=4, seed=7, verbosity=CISZA, cache=pamiec)):
+            assert all(list(generator.generuj_siec().edges(data=True)) == wzor for _ in range(2))
+        generator = SiecPrzeplywowa(N=4, rng=random.Random(7), verbosity=CISZA)
+        assert list(generator.generuj_siec().edges(data=True)) == wzor
+        assert list(generator.generuj_siec().edges(data=True)) != wzor
+        try:
+            SiecPrzeplywowa(N=4, seed=7, rng=random.Random(7), cache=pamiec)
+            assert False, "seed i rng naraz powinny zostać odrzucone"
+        except ValueError:
+            pass
+        print(f"Wpisy w pamięci: {len(os.listdir(katalog))}, rozmiar: {pamiec.rozmiar()} B")
+        
+        # Limit rozmiaru: nowy wpis wypiera najdawniej używany
+        pamiec.max_rozmiar = pamiec.rozmiar()
+        klucz = PamiecSieci.klucz('dodatkowy')
+        pamiec.zapisz(klucz, {'a': np.arange(10)})
+        assert klucz in pamiec and len(os.listdir(katalog)) == 2
+    finally:
+        shutil.rmtree(katalog)
+
+
+def test_format_binarny():
+    """Test zapisu sieci w formacie binarnym i obliczeń na odwzorowanym pliku."""
+    print("\n" + "="*50)
+    print("TEST: Binarny format sieci (mmap)")
+    print("="*50)
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        generator = SiecPrzeplywowa(N=6, seed=3, verbosity=CISZA)
+        siec = generator.generuj_siec()
+        generator.zapisz(os.path.join(katalog, 'siec.bin'))
+        
+        wczytana = wczytaj_siec(os.path.join(katalog, 'siec.bin'))
+        print(f"Rozmiar pliku: {os.path.getsize(os.path.join(katalog, 'siec.bin'))} B")
+        assert isinstance(wczytana.glowy, np.memmap) and wczytana.zmapowana
+        assert nx.utils.graphs_equal(wczytana.do_grafu(), siec)
+        
+        oczekiwany = nx.maximum_flow_value(siec, 's', 't')
+        for algorytm in FordFulkerson.ALGORYTMY:
+            ff = FordFulkerson(wczytana, verbosity=CISZA)
+            assert ff.znajdz_maksymalny_przeplyw(algorithm=algorytm) == oczekiwany
+        
+        # Zapis z przepływem i sieć o nazwach wierzchołków innych niż napisy
+        ff.zapisz_siec(os.path.join(katalog, 'wynik.bin'))
+        wynik = wczytaj_siec(os.path.join(katalog, 'wynik.bin'))
+        assert wynik.slownik_przeplywu() == ff.flow and wynik.wartosc_przeplywu('s') == oczekiwany
+        
+        graf = nx.DiGraph()
+        graf.add_edge(0, (1, 2), capacity=2.5)
+        graf.add_edge((1, 2), 't', capacity=1.5)
+        zapisz_siec(SiecCSR.z_grafu(graf), os.path.join(katalog, 'nazwy.bin'))
+        assert nx.utils.graphs_equal(wczytaj_siec(os.path.join(katalog, 'nazwy.bin')).do_grafu(), graf)
+    finally:
+        shutil.rmtree(katalog)
+
+
+def test_format_dimacs():
+    """Test zapisu i strumieniowego odczytu sieci oraz rozwiązania w formacie DIMACS."""
+    print("\n" + "="*50)
+    print("TEST: Format DIMACS")
+    print("="*50)
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        generator = SiecPrzeplywowa(N=5, seed=11, verbosity=CISZA)
+        siec = generator.generuj_siec()
+        ff = FordFulkerson(siec, verbosity=CISZA)
+        max_flow = ff.znajdz_maksymalny_przeplyw()
+        
+        for nazwa in ['siec.max', 'siec.max.gz']:
+            zapisz_dimacs(siec, os.path.join(katalog, nazwa), komentarz="test")
+            # Mała porcja wymusza dzielenie linii między kolejne odczyty
+            csr, s, t = wczytaj_dimacs(os.path.join(katalog, nazwa), rozmiar_porcji=16)
+            assert (csr.n, csr.m) == (siec.number_of_nodes(), siec.number_of_edges())
+            assert list(siec.nodes())[s - 1] == 's' and list(siec.nodes())[t - 1] == 't'
+            wynik = FordFulkerson(csr, verbosity=CISZA)
+            assert wynik.znajdz_maksymalny_przeplyw(s, t) == max_flow
+        
+        zapisz_przeplyw_dimacs(siec, os.path.join(katalog, 'siec.sol'), ff.flow)
+        with open(os.path.join(katalog, 'siec.sol')) as plik:
+            linie = plik.read().split('\n')
+        print(f"Rozwiązanie: {linie[0]}, łuków: {len(linie) - 2}")
+        assert linie[0] == f"s {max_flow}" and len(linie) - 2 == siec.number_of_edges()
+        
+        with open(os.path.join(katalog, 'zly.max'), 'w') as plik:
+            plik.write("p max 2 1\nn 1 s\nn 2 t\na 1 2\n")
+        try:
+            wczytaj_dimacs(os.path.join(katalog, 'zly.max'))
+            assert False, "oczekiwano błędu dla niepełnej linii łuku"
+        except ValueError as e:
+            assert 'linia 4' in str(e)
+        
+        # Wcięte linie (także łuków) są czytane jak pozostałe
+        with open(os.path.join(katalog, 'wciete.max'), 'w') as plik:
+            plik.write("p max 3 2\n n 1 s\n\tn 3 t\n  a 1 2 5\na 2 3 4\n")
+        csr, s, t = wczytaj_dimacs(os.path.join(katalog, 'wciete.max'))
+        assert (csr.m, s, t) == (2, 1, 3) and csr.przepustowosci.tolist() == [5, 4]
+        
+        # Łuki równoległe są scalane, więc przepływ i rozwiązanie są dopuszczalne
+        with open(os.path.join(katalog, 'rownolegle.max'), 'w') as plik:
+            plik.write("p max 3 3\nn 1 s\nn 3 t\na 1 2 3\na 1 2 4\na 2 3 10\n")
+        csr, s, t = wczytaj_dimacs(os.path.join(katalog, 'rownolegle.max'))
+        assert csr.m == 2 and csr.przepustowosci.tolist() == [7, 10]
+        ff = FordFulkerson(csr, verbosity=CISZA)
+        assert ff.znajdz_maksymalny_przeplyw(s, t) == 7 and ff.flow == {(1, 2): 7, (2, 3): 7}
+        zapisz_przeplyw_dimacs(csr, os.path.join(katalog, 'rownolegle.sol'), ff.flow, source=s)
+        with open(os.path.join(katalog, 'rownolegle.sol')) as plik:
+            assert plik.read().split('\n')[:3] == ['s 7', 'f 1 2 7', 'f 2 3 7']
+        # Sieć z krawędziami równoległymi: słownik sumuje, zapis wymaga tablicy
+        rownolegla = SiecCSR.z_krawedzi([('s', 'a', 3), ('s', 'a', 4), ('a', 't', 10)])
+        ff = FordFulkerson(rownolegla, verbosity=CISZA)
+        ff.znajdz_maksymalny_przeplyw()
+        assert ff.flow == {('s', 'a'): 7, ('a', 't'): 7}
+        try:
+            zapisz_przeplyw_dimacs(ff.siec, os.path.join(katalog, 'x.sol'), ff.flow)
+            assert False, "słownik nie wyznacza przepływu krawędzi równoległych"
+        except ValueError as e:
+            assert 'równoległe' in str(e)
+        zapisz_przeplyw_dimacs(ff.siec, os.path.join(katalog, 'x.sol'))
+        with open(os.path.join(katalog, 'x.sol')) as plik:
+            assert plik.read().split('\n')[:4] == ['s 7', 'f 1 2 3', 'f 1 2 4', 'f 2 3 7']
+    finally:
+        shutil.rmtree(katalog)
+
+
+def _zadanie_z_awaria(zadanie, katalog_pamieci=None):
+    """Zadanie wsadowe, które dla klucza 'awaria' zabija proces roboczy."""
+    if isinstance(zadanie, dict) and zadanie.get('awaria'):
+        os._exit(1)
+    return rozwiaz_zadanie(zadanie, katalog_pamieci)
+
+
+def test_rozwiazywanie_wsadowe():
+    """Test wsadowego rozwiązywania w puli procesów (z awarią procesu roboczego)."""
+    print("\n" + "="*50)
+    print("TEST: Rozwiązywanie wsadowe")
+    print("="*50)
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        generator = SiecPrzeplywowa(N=4, seed=5, verbosity=CISZA)
+        generator.generuj_siec_csr()
+        generator.zapisz(os.path.join(katalog, 'siec.bin'))
+        
+        zadania = [{'N': N, 'seed': N, 'algorithm': 'dinic'} for N in [2, 3, 5]]
+        zadania += [os.path.join(katalog, 'siec.bin'), {'N': 3, 'seed': 1, 'awaria': True},
+                    {'N': 1}, {'N': 6, 'seed': 6, 'tryb': 'graf'}]
+        rekordy = {r['indeks']: r for r in rozwiaz_wsadowo(zadania, procesy=2, funkcja=_zadanie_z_awaria)}
+        
+        for indeks, rekord in sorted(rekordy.items()):
+            print(f"  {indeks}: przepływ={rekord.get('max_flow')}, błąd={rekord['blad']}")
+        assert sorted(rekordy) == list(range(len(zadania)))
+        assert rekordy[4]['blad'] == "awaria procesu roboczego"
+        assert rekordy[5]['blad'].startswith("ValueError")
+        
+        for indeks in [0, 1, 2, 6]:
+            zadanie = zadania[indeks]
+            generator = SiecPrzeplywowa(N=zadanie['N'], seed=zadanie['seed'], verbosity=CISZA)
+            if zadanie.get('tryb') == 'graf':
+                siec = generator.generuj_siec()
+            else:
+                generator.generuj_siec_csr()
+                siec = generator.zbuduj_graf()
+            assert rekordy[indeks]['blad'] is None
+            assert rekordy[indeks]['max_flow'] == nx.maximum_flow_value(siec, 's', 't')
+            assert rekordy[indeks]['edges'] == siec.number_of_edges()
+        zapisana = FordFulkerson(wczytaj_siec(os.path.join(katalog, 'siec.bin')), verbosity=CISZA)
+        assert rekordy[3]['max_flow'] == zapisana.znajdz_maksymalny_przeplyw()
+    finally:
+        shutil.rmtree(katalog)
+
+
+def test_drzewo_gomory_hu():
+    """Test drzewa Gomory'ego-Hu - przekroje wszystkich par z n-1 obliczeń przepływu."""
+    print("\n" + "="*50)
+    print("TEST: Drzewo Gomory'ego-Hu")
+    print("="*50)
+    
+    generator = SiecPrzeplywowa(N=4, seed=3, verbosity=CISZA)
+    siec = generator.generuj_siec()
+    drzewo = DrzewoGomoryegoHu(siec, verbosity=CISZA)
+    
+    # Sieć skierowana jest symetryzowana: c{u, v} = c(u, v) + c(v, u)
+    nieskierowana = nx.Graph()
+    for u, v, c in siec.edges(data='capacity'):
+        poprzednia = nieskierowana[u][v]['capacity'] if nieskierowana.has_edge(u, v) else 0
+        nieskierowana.add_edge(u, v, capacity=poprzednia + c)
+    
+    print(f"Wierzchołki: {siec.number_of_nodes()}, obliczenia przepływu: {drzewo.liczba_przeplywow}")
+    assert drzewo.liczba_przeplywow == siec.number_of_nodes() - 1
+    assert nx.is_tree(drzewo.do_grafu())
+    
+    wezly = list(siec.nodes())
+    for i, u in enumerate(wezly):
+        for v in wezly[i + 1:]:
+            wartosc = drzewo.minimalny_przekroj(u, v)
+            assert wartosc == nx.minimum_cut_value(nieskierowana, u, v)
+            strona = drzewo.strona_przekroju(u, v)
+            assert u in strona and v not in strona
+            assert wartosc == sum(c for a, b, c in nieskierowana.edges(data='capacity')
+                                  if (a in strona) != (b in strona))
+
+
+def test_cieply_start():
+    """Test zmian sieci po obliczeniach i ponownej optymalizacji od bieżącego przepływu."""
+    print("\n" + "="*50)
+    print("TEST: Ciepły start po zmianach sieci")
+    print("="*50)
+    
+    generator = SiecPrzeplywowa(N=6, seed=21, verbosity=CISZA)
+    siec = generator.generuj_siec().copy()
+    ff = FordFulkerson(siec, verbosity=CISZA)
+    ff.znajdz_maksymalny_przeplyw()
+    
+    # Obniżenie przepustowości poniżej przepływu, dodanie i usunięcie krawędzi
+    u, v = max(ff.flow, key=ff.flow.get)
+    siec[u][v]['capacity'] = ff.flow[(u, v)] // 2
+    ff.zmien_przepustowosc(u, v, siec[u][v]['capacity'])
+    assert ff.flow[(u, v)] <= siec[u][v]['capacity']
+    
+    siec.add_edge('s', 'v3_0', capacity=7)
+    ff.dodaj_krawedz('s', 'v3_0', 7)
+    try:
+        ff.dodaj_krawedz('s', 'v3_0', 5)
+        assert False, "istniejąca krawędź nie powinna zostać zdublowana"
+    except ValueError as e:
+        assert 'zmien_przepustowosc' in str(e)
+    usuwana = next(e for e in siec.edges if e[0] != 's' and ff.flow.get(e, 0) > 0)
+    siec.remove_edge(*usuwana)
+    ff.usun_krawedz(*usuwana)
+    
+    # Po naprawie przepływ jest dopuszczalny - zachowanie przepływu w wierzchołkach
+    for w in siec.nodes():
+        if w not in ('s', 't'):
+            assert sum(ff.flow[(a, w)] for a in siec.predecessors(w)) == \
+                sum(ff.flow[(w, b)] for b in siec.successors(w))
+    
+    max_flow = ff.znajdz_maksymalny_przeplyw()
+    od_zera = FordFulkerson(siec, verbosity=CISZA)
+    assert max_flow == od_zera.znajdz_maksymalny_przeplyw() == nx.maximum_flow_value(siec, 's', 't')
+    print(f"Przepływ: {max_flow}, powiększenia: {ff.liczba_iteracji} (od zera: {od_zera.liczba_iteracji})")
+    assert ff.liczba_iteracji <= od_zera.liczba_iteracji
+
+
+def test_minimalny_przekroj():
+    """Test minimalnego przekroju (S, T) - certyfikat max-flow = min-cut."""
+    print("\n" + "="*50)
+    print("TEST: Minimalny przekrój")
+    print("="*50)
+    
+    generator = SiecPrzeplywowa(N=5, seed=4, verbosity=CISZA)
+    siec = generator.generuj_siec()
+    oczekiwany = nx.minimum_cut_value(siec, 's', 't')
+    
+    for algorytm in FordFulkerson.ALGORYTMY:
+        ff = FordFulkerson(siec, verbosity=CISZA)
+        max_flow = ff.znajdz_maksymalny_przeplyw(algorithm=algorytm)
+        przekroj = ff.minimalny_przekroj()
+        
+        S, T = przekroj['strona_zrodla'], przekroj['strona_ujscia']
+        assert 's' in S and 't' in T and S | T == set(siec.nodes()) and not S & T
+        assert przekroj['przepustowosc'] == max_flow == oczekiwany
+        assert set(przekroj['krawedzie']) == {(u, v) for u, v in siec.edges() if u in S and v in T}
+        # Krawędzie przekroju są nasycone
+        assert all(ff.flow[e] == siec.edges[e]['capacity'] for e in przekroj['krawedzie'])
+    
+    print(f"Przekrój: {len(przekroj['krawedzie'])} krawędzi, przepustowość {przekroj['przepustowosc']}")
+    
+    # Po zmianie sieci bez ponownych obliczeń przepływ nie musi być maksymalny
+    u, v = przekroj['krawedzie'][0]
+    ff.zmien_przepustowosc(u, v, siec[u][v]['capacity'] + 5)
+    try:
+        ff.minimalny_przekroj()
+        assert False, "oczekiwano błędu dla przepływu, który nie jest maksymalny"
+    except ValueError:
+        pass
+
+
+def test_benchmark():
+    """Test benchmarku - pomiary w osobnych procesach i wykrywanie regresji."""
+    print("\n" + "="*50)
+    print("TEST: Benchmark i porównanie ze wzorcem")
+    print("="*50)
+    
+    lista = [p for p in przypadki('mini', ['edmonds-karp', 'dinic', 'networkx']) if p['N'] <= 3]
+    wyniki = list(uruchom(lista))
+    
+    assert [r['id'] for r in wyniki] == [f"{p['algorithm']}|N={p['N']}|c=1-10|seed=0" for p in lista]
+    assert not niezgodne_przeplywy(wyniki)
+    for r in wyniki:
+        assert r['pamiec_szczytowa'] > 0 and r['czas_obliczen'] >= 0
+        if r['algorithm'] == 'networkx':
+            assert r['augmentations'] is None
+        else:
+            assert r['augmentations'] > 0 and r['bfs_visits'] > 0
+    print(f"Zmierzono {len(wyniki)} przypadków")
+    
+    # Te same wyniki nie są regresją; gorszy wzorzec jest wykrywany
+    assert porownaj_z_baseline(wyniki, wyniki) == []
+    wzorzec = [dict(r) for r in wyniki]
+    wzorzec[0]['augmentations'] -= 1
+    wzorzec[1]['max_flow'] += 1
+    wzorzec[2]['czas_obliczen'] = wyniki[2]['czas_obliczen'] - 1.0
+    regresje = porownaj_z_baseline(wyniki, wzorzec)
+    assert len(regresje) == 3, regresje
+    for opis in regresje:
+        print(f"  {opis}")
+    
+    zepsute = [dict(wyniki[0], max_flow=wyniki[0]['max_flow'] + 1)] + wyniki[1:]
+    assert len(niezgodne_przeplywy(zepsute)) == 1
+    
+    # Dołączony wzorzec obejmuje profil 'mini' i zgadza się w polach deterministycznych;
+    # bez czasów gorszy wzorzec jest wykrywany tylko po liczbach powiększeń i przepływie
+    dolaczony = wczytaj_wzorzec()
+    assert {r['id'] for r in wyniki} <= {r['id'] for r in dolaczony}
+    assert porownaj_z_baseline(wyniki, dolaczony, czasy=False) == []
+    assert len(porownaj_z_baseline(wyniki, wzorzec, czasy=False)) == 2
+
+
+def test_statystyki():
+    """Test statystyk obliczeń (czasy faz, liczniki) i obserwatorów zdarzeń."""
+    print("\n" + "="*50)
+    print("TEST: Statystyki i obserwatorzy")
+    print("="*50)
+    
+    generator = SiecPrzeplywowa(N=6, seed=2, verbosity=CISZA)
+    siec = generator.generuj_siec()
+    
+    for algorytm in FordFulkerson.ALGORYTMY:
+        ff = FordFulkerson(siec, history='off', verbosity=CISZA)
+        zdarzenia = []
+        ff.dodaj_obserwatora(zdarzenia.append)
+        ff.znajdz_maksymalny_przeplyw(algorithm=algorytm)
+        st = ff.statystyki
+        
+        assert st.algorithm == algorytm
+        assert st.czas_calkowity >= st.czas_budowy + st.czas_bfs + st.czas_powiekszania + st.czas_wartosci > 0
+        assert st.zdjete_z_kolejki > 0 and st.przejrzane_luki >= st.zdjete_z_kolejki - 2
+        assert st.zdjete_z_kolejki <= ff.odwiedzone_wierzcholki
+        powiekszenia = [z for z in zdarzenia if z['zdarzenie'] == 'powiekszenie']
+        assert len(powiekszenia) == st.sciezki == ff.liczba_iteracji
+        assert all(z['statystyki'] is st for z in zdarzenia)
+        if algorytm.startswith('push-relabel'):
+            assert st.pchniecia > 0 and st.sciezki == 0
+        else:
+            assert st.sciezki > 0 and st.pchniecia == 0
+            assert st.cofniecia == sum(1 for z in powiekszenia for arc in z['arcs'] if not ff._w_przod[arc])
+        print(f"{algorytm}: {st.sciezki} ścieżek, {st.zdjete_z_kolejki} zdjęć z kolejki, "
+              f"{st.przejrzane_luki} łuków, {st.cofniecia} cofnięć, {st.pchniecia} przepchnięć")
+    
+    # Każde obliczenie ma nowe statystyki; usunięty obserwator nie dostaje zdarzeń
+    ff.usun_obserwatora(zdarzenia.append)
+    liczba = len(zdarzenia)
+    ff.flow = {}
+    ff.znajdz_maksymalny_przeplyw(algorithm='dinic')
+    assert len(zdarzenia) == liczba
+    assert ff.statystyki is not st and ff.statystyki.algorithm == 'dinic'
+    assert set(ff.statystyki.slownik()) >= {'czas_bfs', 'sciezki', 'cofniecia'}
+
+
+def test_szybkie_rysowanie():
+    """Test szybkiego rysowania dużych sieci (bez pyplot przy zapisie do pliku)."""
+    print("\n" + "="*50)
+    print("TEST: Szybkie rysowanie")
+    print("="*50)
+    import matplotlib.pyplot as plt
+    
+    generator = SiecPrzeplywowa(N=40, seed=3, verbosity=CISZA)
+    siec = generator.generuj_siec_csr()
+    assert czy_szybki('auto', siec.m) and not czy_szybki('auto', 10) and not czy_szybki('networkx', siec.m)
+    try:
+        czy_szybki('svg', 10)
+        assert False, "oczekiwano błędu dla nieznanego trybu"
+    except ValueError:
+        pass
+    
+    # Pozycje wektorowe są takie same jak pozycje generatora
+    generator.zbuduj_graf()
+    assert np.allclose(pozycje_warstwowe(siec.warstwy), tablica_pozycji(siec.wezly, generator.pozycje))
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        figury = plt.get_fignums()
+        generator.wizualizuj(save_file=os.path.join(katalog, 'siec.png'))
+        ff = FordFulkerson(siec, history='off', verbosity=CISZA)
+        ff.znajdz_maksymalny_przeplyw(algorithm='dinic')
+        ff.wizualizuj_wynik(save_file=os.path.join(katalog, 'wynik.png'), tryb='szybki')
+        # Zapis odbywa się na płótnie Agg - pyplot nie ma nowych (otwartych) figur
+        assert plt.get_fignums() == figury
+        
+        # Tryb networkx: zapis do pliku domyślnie nie pokazuje okna i zamyka rysunek
+        maly = SiecPrzeplywowa(N=3, seed=3, verbosity=CISZA)
+        maly.generuj_siec()
+        ff_maly = FordFulkerson(maly.graph, history='off', verbosity=CISZA)
+        ff_maly.znajdz_maksymalny_przeplyw()
+        pokazane = []
+        show, plt.show = plt.show, lambda *args, **kwargs: pokazane.append(1)
+        try:
+            maly.wizualizuj(save_file=os.path.join(katalog, 'maly.png'), tryb='networkx', dpi=50)
+            ff_maly.wizualizuj_wynik(save_file=os.path.join(katalog, 'maly_wynik.png'), tryb='networkx', dpi=50)
+        finally:
+            plt.show = show
+        assert not pokazane and plt.get_fignums() == figury
+        for nazwa in ('siec.png', 'wynik.png', 'maly.png', 'maly_wynik.png'):
+            assert os.path.getsize(os.path.join(katalog, nazwa)) > 0
+        print(f"Narysowano sieć z {siec.m} krawędziami")
+    finally:
+        shutil.rmtree(katalog)
+
+
+def test_uklad_warstwowy():
+    """Test warstwowego układu wierzchołków (warstwy, BFS, redukcja przecięć, pamięć)."""
+    print("\n" + "="*50)
+    print("TEST: Układ warstwowy")
+    print("="*50)
+    
+    siec = SiecPrzeplywowa(N=20, seed=5, verbosity=CISZA).generuj_siec_csr()
+    pozycje = uklad_warstwowy(siec)
+    assert pozycje.shape == (siec.n, 2)
+    # Kolumny to warstwy generatora, kolejność w warstwach zmniejsza liczbę przecięć
+    assert np.array_equal(pozycje[:, 0], 2 * siec.warstwy)
+    przed = liczba_przeciec(siec, pozycje_warstwowe(siec.warstwy))
+    po = liczba_przeciec(siec, pozycje)
+    print(f"Przecięcia: {przed} -> {po}")
+    assert po < przed
+    # Pamięć układu: ta sama tablica bez ponownego liczenia
+    assert uklad_warstwowy(siec) is pozycje
+    
+    # Bez warstw: odległości BFS od źródła, ujście w ostatniej kolumnie
+    graf = nx.DiGraph([('s', 'a'), ('s', 'b'), ('a', 'c'), ('b', 'c'), ('c', 't'), ('a', 't'), ('x', 'a')])
+    uklad = uklad_warstwowy_grafu(graf)
+    assert uklad['s'][0] == 0 and uklad['a'][0] == uklad['b'][0] == 2 and uklad['c'][0] == 4
+    # x jest nieosiągalny ze źródła (kolumna za najdalszą), ujście zawsze na końcu
+    assert uklad['x'][0] == 6 and uklad['t'][0] == 8
+    assert uklad_warstwowy_grafu(graf) is uklad
+    graf.add_edge('t', 'y')
+    assert 'y' in uklad_warstwowy_grafu(graf)  # zmiana grafu unieważnia zapamiętany układ
+    
+    # Przecięcia liczone bezpośrednio: dwie krawędzie na krzyż
+    krzyz = SiecCSR(['a', 'b', 'c', 'd'], [0, 1], [3, 2], [1, 1])
+    assert liczba_przeciec(krzyz, np.array([[0, 0], [0, 1], [2, 0], [2, 1]], dtype=float)) == 1
+    assert liczba_przeciec(krzyz, np.array([[0, 0], [0, 1], [2, 1], [2, 0]], dtype=float)) == 0
+
+
+def test_weryfikacja():
+    """Test wektorowej weryfikacji przepływu i raportu CSV."""
+    print("\n" + "="*50)
+    print("TEST: Weryfikacja przepływu i raport CSV")
+    print("="*50)
+    
+    siec = SiecPrzeplywowa(N=10, seed=2, verbosity=CISZA).generuj_siec_csr()
+    ff = FordFulkerson(siec, history='off', verbosity=CISZA)
+    wartosc = ff.znajdz_maksymalny_przeplyw()
+    wynik = ff.sprawdz_przeplyw()
+    assert wynik['poprawny'] and wynik['wartosc'] == wynik['wartosc_ujscia'] == wartosc
+    assert not wynik['naruszenia_przepustowosci'] and not wynik['naruszenia_bilansu']
+    
+    # Zepsuty przepływ: przekroczona przepustowość i niezachowany bilans na jej końcach
+    zepsuty = siec.przeplyw.copy()
+    e = int(np.flatnonzero((siec.zrodla != siec.indeks['s']) & (siec.cele != siec.indeks['t']))[0])
+    zepsuty[e] = siec.przepustowosci[e] + 1
+    wynik = sprawdz_przeplyw(siec, zepsuty)
+    u, v = siec.wezly[siec.zrodla[e]], siec.wezly[siec.cele[e]]
+    print(f"Naruszenia: {wynik['naruszenia_przepustowosci']}, {wynik['naruszenia_bilansu']}")
+    assert not wynik['poprawny'] and wynik['liczba_naruszen_przepustowosci'] == 1
+    assert wynik['naruszenia_przepustowosci'][0][:2] == (u, v)
+    assert {w for w, _, _ in wynik['naruszenia_bilansu']} == {u, v}
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        sciezka = os.path.join(katalog, 'raport.csv')
+        podsumowanie = ff.zapisz_raport(sciezka)
+        with open(sciezka, encoding='utf-8') as plik:
+            wiersze = plik.read().splitlines()
+        assert wiersze[0] == 'u,v,przeplyw,przepustowosc,wykorzystanie,nasycona'
+        assert len(wiersze) == siec.m + 1
+        assert sum(podsumowanie['histogram']) == siec.m
+        assert podsumowanie['nasycone'] == sum(w.endswith(',1') for w in wiersze[1:])
+        assert podsumowanie['suma_przeplywow'] == siec.przeplyw.sum()
+        # Raport skompresowany ma tę samą treść
+        assert zapisz_raport_csv(siec, sciezka + '.gz') == podsumowanie
+    finally:
+        shutil.rmtree(katalog)
+
+
+def test_lekki_import():
+    """Test importu modułów obliczeniowych bez matplotlib i networkx."""
+    print("\n" + "="*50)
+    print("TEST: Lekki import rdzenia")
+    print("="*50)
+    
+    wyniki = benchmark_importu.uruchom(powtorzenia=1)
+    for rekord in wyniki:
+        print(f"  {rekord['id']}: {rekord['czas_importu'] * 1000:.1f} ms")
+    assert benchmark_importu.porownaj_z_baseline(wyniki) == []
+    
+    # Wykrywanie regresji: ciężki pakiet i czas ponad tolerancję wzorca
+    rysowanie = benchmark_importu.zmierz_import('rysowanie', powtorzenia=1)
+    assert rysowanie['ciezkie'] == ['matplotlib']
+    wzorzec = [dict(rekord, czas_importu=rekord['czas_importu'] / 10) for rekord in wyniki]
+    regresje = benchmark_importu.porownaj_z_baseline(wyniki, wzorzec, min_roznica=0)
+    assert len(regresje) == len(wyniki)
+
+
+def test_usluga():
+    """Test lokalnej usługi HTTP/JSON: wyniki, kolejka z przeciwciśnieniem, limit czasu, anulowanie."""
+    print("\n" + "="*50)
+    print("TEST: Usługa przepływu (asyncio, HTTP/JSON)")
+    print("="*50)
+    
+    try:
+        UslugaPrzeplywu(host='0.0.0.0')
+        assert False, "usługa nie może nasłuchiwać poza pętlą zwrotną"
+    except ValueError:
+        pass
+        
+    async def scenariusz():
+        async with UslugaPrzeplywu(port=0, procesy=1, max_kolejka=1, limit_czasu=30) as usluga:
+            klient = KlientAsynchroniczny(usluga.adres)
+            krawedzie = [['s', 'a', 3], ['a', 't', 2], ['s', 't', 1]]
+            wynik = await klient.rozwiaz({'krawedzie': krawedzie, 'przeplyw': True})
+            print(f"Lista krawędzi: {wynik['max_flow']}, przepływy {wynik['przeplywy']}")
+            assert wynik['max_flow'] == 3 and ['a', 't', 2] in wynik['przeplywy']
+            
+            # Długie zadanie z limitem czasu zajmuje jedyny proces, drugie czeka w kolejce,
+            # trzecie nie mieści się w kolejce (429)
+            dlugie = await klient.zglos({'N': 300, 'seed': 1, 'limit_czasu': 0.5})
+            while (await klient.stan(dlugie))['stan'] == 'oczekuje':
+                await asyncio.sleep(0.01)
+            czekajace = await klient.zglos({'N': 5, 'seed': 1})
+            try:
+                await klient.zglos({'N': 5, 'seed': 2})
+                assert False, "pełna kolejka powinna odrzucić zgłoszenie"
+            except BladUslugi as e:
+                assert e.status == 429
+            try:
+                await klient.czekaj(dlugie)
+                assert False, "zadanie powinno przekroczyć limit czasu"
+            except BladZadania as e:
+                assert e.stan['stan'] == 'przekroczony-czas'
+                
+            # Nowy proces roboczy po zabiciu poprzedniego liczy kolejne zadania
+            stany = [stan['stan'] async for stan in klient.strumien(czekajace)]
+            assert stany[-1] == 'gotowe'
+            oczekiwany = SiecPrzeplywowa(N=5, seed=1, verbosity=CISZA).generuj_siec_csr()
+            assert (await klient.stan(czekajace))['wynik']['max_flow'] == \
+                FordFulkerson(oczekiwany, history='off', verbosity=CISZA).znajdz_maksymalny_przeplyw()
+                
+            # Klient synchroniczny (w wątku, żeby nie blokować pętli usługi)
+            synchroniczny = Klient(usluga.adres)
+            wynik = await asyncio.to_thread(synchroniczny.rozwiaz, {'krawedzie': krawedzie, 'algorithm': 'dinic'})
+            assert wynik['max_flow'] == 3 and wynik['algorithm'] == 'dinic'
+            
+            # Anulowanie zadania oczekującego i błędy zgłoszeń
+            await klient.zglos({'N': 300, 'seed': 2, 'limit_czasu': 0.3})
+            anulowane = await klient.zglos({'N': 5, 'seed': 3})
+            assert (await klient.anuluj(anulowane))['stan'] == 'anulowane'
+            for zadanie, status in (({'x': 1}, 400), ({'N': 5, 'limit_czasu': [1]}, 400),
+                                   ({'N': 5, 'limit_czasu': 'nan'}, 400),
+                                   ({'krawedzie': krawedzie, 'algorithm': 'brak'}, None)):
+                try:
+                    await klient.rozwiaz(zadanie)
+                    assert False, "zadanie powinno się nie udać"
+                except BladUslugi as e:
+                    assert e.status == status
+                except BladZadania as e:
+                    assert status is None and e.stan['stan'] == 'blad'
+            # Niepoprawny nagłówek Content-Length - odpowiedź 400, połączenie zamknięte
+            for dlugosc in ('abc', '-5'):
+                czytnik, pisarz = await asyncio.open_connection(klient.host, klient.port)
+                pisarz.write(f'POST /zadania HTTP/1.1\r\nContent-Length: {dlugosc}\r\n\r\n{{}}'.encode('latin-1'))
+                await pisarz.drain()
+                odpowiedz = await asyncio.wait_for(czytnik.read(), 5)
+                pisarz.close()
+                assert odpowiedz.split(b' ', 2)[1] == b'400', odpowiedz
+            stan = await klient.stan_uslugi()
+            print(f"Stan usługi: {stan}")
+            assert stan['zadania']['anulowane'] == 1 and stan['zadania']['przekroczony-czas'] == 2
+            
+    asyncio.run(scenariusz())
+
+
+def test_bfs_dwukierunkowy():
+    """Test dwukierunkowego BFS - te same przepływy, najkrótsze ścieżki, mniej odwiedzin."""
+    print("\n" + "="*50)
+    print("TEST: Dwukierunkowy BFS")
+    print("="*50)
+    
+    for N, seed in [(3, 0), (6, 1), (12, 2), (25, 3)]:
+        siec = SiecPrzeplywowa(N=N, seed=seed, verbosity=CISZA).generuj_siec()
+        oczekiwany = nx.maximum_flow_value(siec, 's', 't')
+        for algorytm in ('edmonds-karp', 'capacity-scaling'):
+            odwiedzone = {}
+            for tryb in FordFulkerson.TRYBY_BFS:
+                ff = FordFulkerson(siec, history='off', verbosity=CISZA)
+                sciezki = []
+                ff.dodaj_obserwatora(sciezki.append)
+                assert ff.znajdz_maksymalny_przeplyw(algorithm=algorytm, bfs=tryb) == oczekiwany
+                assert ff.sprawdz_przeplyw()['poprawny']
+                assert ff.minimalny_przekroj()['przepustowosc'] == oczekiwany
+                if algorytm == 'edmonds-karp':
+                    dlugosci = [len(z['arcs']) for z in sciezki if z['zdarzenie'] == 'powiekszenie']
+                    # Najkrótsze ścieżki: pierwsza jak w networkx, długości nie maleją
+                    assert dlugosci[0] == nx.shortest_path_length(siec, 's', 't')
+                    assert dlugosci == sorted(dlugosci)
+                odwiedzone[tryb] = ff.odwiedzone_wierzcholki
+            print(f"N={N}, {algorytm}: odwiedzone {odwiedzone}")
+            if N >= 12:
+                assert odwiedzone['dwukierunkowy'] < odwiedzone['jednokierunkowy']
+    
+    # Ścieżka przez łuk wsteczny (cofnięcie przepływu) i nieznany tryb
+    G = nx.DiGraph()
+    for u, v, c in [('s', 'a', 10), ('s', 'b', 10), ('a', 'b', 1), ('a', 't', 1), ('b', 't', 10)]:
+        G.add_edge(u, v, capacity=c)
+    ff = FordFulkerson(G, verbosity=CISZA)
+    assert ff.znajdz_maksymalny_przeplyw(bfs='dwukierunkowy') == 11
+    assert rozwiaz_zadanie({'krawedzie': [['s', 'a', 3], ['a', 't', 2]], 'bfs': 'dwukierunkowy'})['max_flow'] == 2
+    try:
+        ff.znajdz_maksymalny_przeplyw(bfs='brak')
+        assert False, "oczekiwano błędu dla nieznanego trybu BFS"
+    except ValueError:
+        pass
+
+
+def test_bfs_wektorowy():
+    """Test BFS poziomami w NumPy - sieć odwzorowana z pliku i przepustowości ułamkowe."""
+    print("\n" + "="*50)
+    print("TEST: Wektorowy BFS")
+    print("="*50)
+    
+    katalog = tempfile.mkdtemp()
+    try:
+        generator = SiecPrzeplywowa(N=15, seed=7, verbosity=CISZA)
+        siec = generator.generuj_siec()
+        generator.zapisz(os.path.join(katalog, 'siec.bin'))
+        oczekiwany = nx.maximum_flow_value(siec, 's', 't')
+        
+        for algorytm in ('edmonds-karp', 'capacity-scaling'):
+            ff = FordFulkerson(wczytaj_siec(os.path.join(katalog, 'siec.bin')), history='off', verbosity=CISZA)
+            assert ff.znajdz_maksymalny_przeplyw(algorithm=algorytm, bfs='wektorowy') == oczekiwany
+            assert type(ff.max_flow_value) is int and ff.sprawdz_przeplyw()['poprawny']
+            # Kopia NumPy nadąża za listą przepustowości rezydualnych
+            assert ff._rezydualna_np.tolist() == list(ff._rezydualna)
+            assert ff.minimalny_przekroj()['przepustowosc'] == oczekiwany
+            print(f"{algorytm}: przepływ={ff.max_flow_value}, {ff.liczba_iteracji} powiększeń, "
+                  f"{ff.statystyki.przejrzane_luki} łuków")
+    finally:
+        shutil.rmtree(katalog)
+    
+    G = nx.DiGraph()
+    for u, v, c in [('s', 'a', 2.5), ('s', 'b', 1.25), ('a', 'b', 0.5), ('a', 't', 1.0), ('b', 't', 3.0)]:
+        G.add_edge(u, v, capacity=c)
+    ff = FordFulkerson(G, verbosity=CISZA)
+    assert abs(ff.znajdz_maksymalny_przeplyw(bfs='wektorowy') - nx.maximum_flow_value(G, 's', 't')) < 1e-12
+
+
+def test_przeplyw_warstwowy():
+    """Test zachłannego przepływu początkowego warstwami (ciepły start silników)."""
+    print("\n" + "="*50)
+    print("TEST: Warstwowy przepływ początkowy")
+    print("="*50)
+    
+    for N, (lo, hi) in [(3, (1, 10)), (12, (1, 10)), (30, (1, 1000))]:
+        siec = SiecPrzeplywowa(N=N, min_capacity=lo, max_capacity=hi, seed=N, verbosity=CISZA).generuj_siec_csr()
+        przeplyw = przeplyw_warstwowy(siec)
+        wynik = sprawdz_przeplyw(siec, przeplyw)
+        assert wynik['poprawny'] and 0 < wynik['wartosc'] <= nx.maximum_flow_value(siec.do_grafu(), 's', 't')
+        assert not siec.przeplyw.any()  # sieć wejściowa bez zmian
+        
+        porownanie = porownaj_start(siec)
+        print(f"N={N}: przepływ początkowy {porownanie['wartosc_startowa']} z {porownanie['max_flow']}, "
+              f"powiększenia {porownanie['powiekszenia_od_zera']} -> {porownanie['powiekszenia_ze_startem']}")
+        assert porownanie['wartosc_startowa'] == wynik['wartosc']
+        assert porownanie['zaoszczedzone'] > 0
+    
+    # Każdy silnik kończy od przepływu warstwowego z tym samym wynikiem
+    siec = SiecPrzeplywowa(N=8, seed=4, verbosity=CISZA).generuj_siec()
+    oczekiwany = nx.maximum_flow_value(siec, 's', 't')
+    for algorytm in FordFulkerson.ALGORYTMY:
+        ff = FordFulkerson(siec, history='delta', verbosity=CISZA)
+        assert ff.znajdz_maksymalny_przeplyw(algorithm=algorytm, start='warstwowy') == oczekiwany
+        assert 0 < ff.statystyki.wartosc_startowa <= oczekiwany and ff.sprawdz_przeplyw()['poprawny']
+        if ff.liczba_iteracji:
+            assert ff.przeplyw_w_iteracji(ff.liczba_iteracji) == ff.flow
+    
+    # Bez warstw (odległości BFS), przepustowości ułamkowe, start od zera po obliczeniach
+    G = nx.DiGraph()
+    for u, v, c in [('s', 'a', 2.5), ('s', 'b', 1.25), ('a', 'b', 0.5), ('a', 't', 1.0), ('b', 't', 3.0)]:
+        G.add_edge(u, v, capacity=c)
+    ff = FordFulkerson(G, verbosity=CISZA)
+    assert ff.znajdz_maksymalny_przeplyw(start='warstwowy') == nx.maximum_flow_value(G, 's', 't') == 2.75
+    # a -> b łączy wierzchołki jednej warstwy BFS - przepływ przez nią znajduje dopiero silnik
+    assert ff.statystyki.wartosc_startowa == 2.25 and ff.liczba_iteracji == 1
+    ff.znajdz_maksymalny_przeplyw(start='zero')
+    assert ff.statystyki.wartosc_startowa == 0 and ff.liczba_iteracji > 0
+    try:
+        ff.znajdz_maksymalny_przeplyw(start='brak')
+        assert False, "oczekiwano błędu dla nieznanego trybu startu"
+    except ValueError:
+        pass
+
+
 def main():
     """Uruchamia wszystkie testy."""
     print("TESTY ALGORYTMU MAKSYMALNEGO PRZEPŁYWU")
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Lokalna usługa HTTP/JSON wyznaczania maksymalnego przepływu (asyncio).
+
+Usługi, które dotąd wywoływały FordFulkerson we własnej pętli zdarzeń
+(i blokowały ją na czas obliczeń), zgłaszają zadania przez HTTP i czekają
+na wynik asynchronicznie. Zadanie to słownik jak w wsadowe.rozwiaz_zadanie:
+lista krawędzi ('krawedzie': [[u, v, c], ...]), ścieżka zapisanej sieci
+('plik') albo parametry generatora ('N', 'seed', ...), oraz opcjonalnie
+'algorithm', 'source', 'sink', 'przeplyw' i 'limit_czasu' (sekundy).
+
+Obliczenia działają w stałej liczbie procesów roboczych. Zgłoszone zadania
+czekają w ograniczonej kolejce - gdy jest pełna, zgłoszenie dostaje 429
+(przeciwciśnienie zamiast nieograniczonego wzrostu pamięci). Proces, który
+przekroczy limit czasu zadania, jest zabijany i zastępowany nowym.
+
+Usługa nasłuchuje wyłącznie na adresie pętli zwrotnej. Punkty końcowe:
+    POST   /zadania                 zgłoszenie -> 202 {"id", "stan"} (429 - kolejka pełna)
+    GET    /zadania/<id>            stan zadania i wynik
+    GET    /zadania/<id>/strumien   zmiany stanu jako JSON Lines aż do zakończenia
+    DELETE /zadania/<id>            anulowanie zadania oczekującego w kolejce
+    GET    /stan                    procesy, długość kolejki, liczby zadań
+
+Użycie:
+    python usluga_przeplywu.py --port 8765 --procesy 4 --kolejka 64 --limit-czasu 60
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from wsadowe import rozwiaz_zadanie
+
+MAX_ROZMIAR_ZGLOSZENIA = 64 * 2**20  # bajty ciała POST /zadania
+MAX_ZAKONCZONYCH = 1000  # tyle zakończonych zadań pamięta usługa (najstarsze są zapominane)
+
+OCZEKUJE = 'oczekuje'
+W_TOKU = 'w-toku'
+GOTOWE = 'gotowe'
+BLAD = 'blad'
+PRZEKROCZONY_CZAS = 'przekroczony-czas'
+ANULOWANE = 'anulowane'
+KONCOWE = (GOTOWE, BLAD, PRZEKROCZONY_CZAS, ANULOWANE)
+
+
+def _kontekst():
+    """
+    Procesy robocze startują z serwera forkserver (z wczytanymi silnikami),
+    a nie przez fork wielowątkowego procesu usługi.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    kontekst = multiprocessing.get_context('forkserver')
+    kontekst.set_forkserver_preload(['zadanie2_ford_fulkerson', 'wsadowe'])
+    return kontekst
+
+
+def _petla_robocza(polaczenie, katalog_pamieci: Optional[str]):
+    """Proces roboczy: rozwiązuje kolejne zadania z potoku aż do jego zamknięcia."""
+    while True:
+        try:
+            opis = polaczenie.recv()
+        except EOFError:
+            return
+        try:
+            polaczenie.send((rozwiaz_zadanie(opis, katalog_pamieci), None))
+        except Exception as e:
+            polaczenie.send((None, f"{type(e).__name__}: {e}"))
+
+
+class _Stanowisko:
+    """Jeden proces roboczy z potokiem; po przekroczeniu czasu lub awarii jest uruchamiany od nowa."""
+    
+    def __init__(self, katalog_pamieci: Optional[str], watki: ThreadPoolExecutor):
+        self.katalog_pamieci = katalog_pamieci
+        self._watki = watki
+        self._uruchom()
+        
+    def _uruchom(self):
+        kontekst = _kontekst()
+        self.polaczenie, koniec_procesu = kontekst.Pipe()
+        self.proces = kontekst.Process(target=_petla_robocza, args=(koniec_procesu, self.katalog_pamieci),
+                                       daemon=True)
+        self.proces.start()
+        koniec_procesu.close()
+        
+    def zatrzymaj(self):
+        self.proces.kill()
+        self.proces.join()
+        self.polaczenie.close()
+        
+    async def wykonaj(self, opis: Dict, limit_czasu: float) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Rozwiązuje zadanie w procesie stanowiska.
+        
+        Returns:
+            (wynik, None) albo (None, opis błędu)
+        
+        Raises:
+            asyncio.TimeoutError: Po przekroczeniu limitu czasu (proces jest zastępowany)
+        """
+        self.polaczenie.send(opis)
+        # Odbiór w wątku: pętla zdarzeń nie czeka na proces roboczy
+        odbior = asyncio.get_running_loop().run_in_executor(self._watki, self.polaczenie.recv)
+        try:
+            return await asyncio.wait_for(asyncio.shield(odbior), limit_czasu)
+        except asyncio.TimeoutError:
+            self._zastap(odbior)
+            raise
+        except (EOFError, OSError):
+            self._zastap(odbior)
+            return None, "awaria procesu roboczego"
+        except asyncio.CancelledError:
+            # Zatrzymanie usługi - proces zabije UslugaPrzeplywu.zatrzymaj
+            odbior.add_done_callback(lambda f: f.cancelled() or f.exception())
+            raise
+        
+    def _zastap(self, odbior: asyncio.Future):
+        # Zabicie procesu kończy też wątek czekający w recv (EOFError)
+        odbior.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.zatrzymaj()
+        self._uruchom()
+
+
+class _Zlecenie:
+    """Zadanie w usłudze: opis, stan, wynik i powiadamianie o zmianach stanu."""
+    
+    __slots__ = ('id', 'opis', 'limit_czasu', 'stan', 'wynik', 'blad', 'czasy', 'zmiana')
+    
+    def __init__(self, id_: str, opis: Dict, limit_czasu: float):
+        self.id = id_
+        self.opis = opis
+        self.limit_czasu = limit_czasu
+        self.stan = OCZEKUJE
+        self.wynik = None
+        self.blad = None
+        self.czasy = {OCZEKUJE: time.time()}
+        self.zmiana = asyncio.Condition()
+        
+    async def ustaw(self, stan: str, wynik: Optional[Dict] = None, blad: Optional[str] = None):
+        self.stan, self.wynik, self.blad = stan, wynik, blad
+        self.czasy[stan] = time.time()
+        async with self.zmiana:
+            self.zmiana.notify_all()
+        
+    def slownik(self) -> Dict:
+        return {'id': self.id, 'stan': self.stan, 'wynik': self.wynik, 'blad': self.blad, 'czasy': self.czasy}
+
+
+def _czy_lokalny(host: str) -> bool:
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class UslugaPrzeplywu:
+    """
+    Serwer HTTP/JSON z kolejką zadań i pulą procesów roboczych.
+    
+    Użycie w kodzie (port 0 - wolny port wybrany przez system):
+        async with UslugaPrzeplywu(procesy=2) as usluga:
+            print(usluga.adres)
+            await usluga.serwuj()
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, procesy: Optional[int] = None,
+                 max_kolejka: int = 64, limit_czasu: float = 60.0,
+                 katalog_pamieci: Optional[str] = None, max_zakonczonych: int = MAX_ZAKONCZONYCH):
+        """
+        Args:
+            host: Adres pętli zwrotnej (127.0.0.1, ::1 lub localhost)
+            port: Port TCP (0 - dowolny wolny)
+            procesy: Liczba procesów roboczych (domyślnie liczba procesorów)
+            max_kolejka: Najwięcej tylu zadań może czekać; kolejne zgłoszenia dostają 429
+            limit_czasu: Domyślny i maksymalny czas obliczeń zadania w sekundach
+            katalog_pamieci: Katalog PamiecSieci dla generowanych sieci (opcjonalnie)
+            max_zakonczonych: Ile zakończonych zadań pamiętać do odczytu wyniku
+        """
+        if not _czy_lokalny(host):
+            raise ValueError(f"Usługa działa tylko lokalnie - {host} nie jest adresem pętli zwrotnej")
+        if max_kolejka < 1:
+            raise ValueError("max_kolejka musi być >= 1")
+        self.host = host
+        self.port = port
+        self.procesy = procesy or os.cpu_count() or 1
+        self.max_kolejka = max_kolejka
+        self.limit_czasu = limit_czasu
+        self.katalog_pamieci = katalog_pamieci
+        self.max_zakonczonych = max_zakonczonych
+        self._zlecenia: Dict[str, _Zlecenie] = OrderedDict()
+        self._numery = itertools.count(1)
+        self._kolejka = None
+        self._serwer = None
+        self._stanowiska = []
+        self._robotnicy = []
+        self._watki = None
+        
+    @property
+    def adres(self) -> str:
+        return f"http://{self.host}:{self.port}"
+        
+    async def start(self):
+        """Uruchamia procesy robocze i zaczyna nasłuchiwać."""
+        self._kolejka = asyncio.Queue(self.max_kolejka)
+        self._watki = ThreadPoolExecutor(self.procesy)
+        self._stanowiska = [_Stanowisko(self.katalog_pamieci, self._watki) for _ in range(self.procesy)]
+        self._robotnicy = [asyncio.create_task(self._robotnik(stanowisko)) for stanowisko in self._stanowiska]
+        self._serwer = await asyncio.start_server(self._obsluz, self.host, self.port)
+        self.port = self._serwer.sockets[0].getsockname()[1]
+        
+    async def serwuj(self):
+        """Obsługuje połączenia aż do anulowania."""
+        await self._serwer.serve_forever()
+        
+    async def zatrzymaj(self):
+        """Zamyka serwer, przerywa obliczenia w toku i kończy procesy robocze."""
+        if self._serwer is not None:
+            self._serwer.close()
+            await self._serwer.wait_closed()
+        for robotnik in self._robotnicy:
+            robotnik.cancel()
+        await asyncio.gather(*self._robotnicy, return_exceptions=True)
+        for stanowisko in self._stanowiska:
+            stanowisko.zatrzymaj()
+        if self._watki is not None:
+            self._watki.shutdown(wait=False)
+        self._serwer, self._robotnicy, self._stanowiska = None, [], []
+        
+    async def __aenter__(self) -> 'UslugaPrzeplywu':
+        await self.start()
+        return self
+        
+    async def __aexit__(self, *wyjatek):
+        await self.zatrzymaj()
+        
+    # --- Kolejka i procesy robocze ---
+    
+    def zglos(self, opis: Dict) -> _Zlecenie:
+        """
+        Dodaje zadanie do kolejki.
+        
+        Raises:
+            asyncio.QueueFull: Gdy w kolejce czeka już max_kolejka zadań
+            ValueError: Gdy opis zadania jest niepoprawny
+        """
+        if not isinstance(opis, dict):
+            raise ValueError("Zadanie musi być obiektem JSON")
+        if not any(opis.get(klucz) is not None for klucz in ('krawedzie', 'plik', 'N')):
+            raise ValueError("Zadanie wymaga 'krawedzie', 'plik' albo 'N'")
+        opis = dict(opis)
+        limit_czasu = opis.pop('limit_czasu', None)
+        if limit_czasu is None:
+            limit_czasu = self.limit_czasu
+        elif (isinstance(limit_czasu, bool) or not isinstance(limit_czasu, (int, float))
+              or not math.isfinite(limit_czasu) or limit_czasu <= 0):
+            raise ValueError("limit_czasu musi być dodatnią liczbą sekund")
+        zlecenie = _Zlecenie(str(next(self._numery)), opis, min(limit_czasu, self.limit_czasu))
+        self._kolejka.put_nowait(zlecenie)
+        self._zlecenia[zlecenie.id] = zlecenie
+        self._zapomnij_stare()
+        return zlecenie
+        
+    def _zapomnij_stare(self):
+        zakonczone = [id_ for id_, zlecenie in self._zlecenia.items() if zlecenie.stan in KONCOWE]
+        for id_ in zakonczone[:max(0, len(zakonczone) - self.max_zakonczonych)]:
+            del self._zlecenia[id_]
+        
+    async def _robotnik(self, stanowisko: _Stanowisko):
+        while True:
+            zlecenie = await self._kolejka.get()
+            if zlecenie.stan == ANULOWANE:
+                continue
+            await zlecenie.ustaw(W_TOKU)
+            try:
+                wynik, blad = await stanowisko.wykonaj(zlecenie.opis, zlecenie.limit_czasu)
+            except asyncio.TimeoutError:
+                await zlecenie.ustaw(PRZEKROCZONY_CZAS, blad=f"przekroczono limit czasu {zlecenie.limit_czasu} s")
+            else:
+                await zlecenie.ustaw(BLAD if blad else GOTOWE, wynik, blad)
+            self._zapomnij_stare()
+        
+    def stan(self) -> Dict:
+        liczby = {}
+        for zlecenie in self._zlecenia.values():
+            liczby[zlecenie.stan] = liczby.get(zlecenie.stan, 0) + 1
+        return {'procesy': self.procesy, 'w_kolejce': self._kolejka.qsize(), 'max_kolejka': self.max_kolejka,
+                'limit_czasu': self.limit_czasu, 'zadania': liczby}
+        
+    # --- HTTP ---
+    
+    async def _obsluz(self, czytnik: asyncio.StreamReader, pisarz: asyncio.StreamWriter):
+        try:
+            metoda, sciezka, cialo = await self._wczytaj_zadanie(czytnik)
+            await self._przekieruj(metoda, sciezka, cialo, pisarz)
+        except _BladHttp as e:
+            self._odpowiedz(pisarz, e.status, {'blad': str(e)}, e.naglowki)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            # Każde zapytanie dostaje linię statusu, także po błędzie usługi
+            self._odpowiedz(pisarz, HTTPStatus.INTERNAL_SERVER_ERROR, {'blad': f'{type(e).__name__}: {e}'})
+        finally:
+            # Połączenie jest zamykane także po nieoczekiwanym wyjątku
+            try:
+                await pisarz.drain()
+                pisarz.close()
+                await pisarz.wait_closed()
+            except ConnectionError:
+                pass
+        
+    async def _wczytaj_zadanie(self, czytnik: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        try:
+            metoda, sciezka, _ = (await czytnik.readline()).decode('latin-1').split(' ', 2)
+        except ValueError:
+            raise _BladHttp(HTTPStatus.BAD_REQUEST, "Niepoprawny wiersz żądania")
+        naglowki = {}
+        while True:
+            linia = (await czytnik.readline()).decode('latin-1').strip()
+            if not linia:
+                break
+            nazwa, _, wartosc = linia.partition(':')
+            naglowki[nazwa.strip().lower()] = wartosc.strip()
+        try:
+            dlugosc = int(naglowki.get('content-length') or 0)
+        except ValueError:
+            dlugosc = -1
+        if dlugosc < 0:
+            raise _BladHttp(HTTPStatus.BAD_REQUEST, "Niepoprawny nagłówek Content-Length")
+        if dlugosc > MAX_ROZMIAR_ZGLOSZENIA:
+            raise _BladHttp(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            f"Zgłoszenie większe niż {MAX_ROZMIAR_ZGLOSZENIA} bajtów")
+        cialo = await czytnik.readexactly(dlugosc) if dlugosc else b''
+        return metoda.upper(), sciezka.split('?', 1)[0].rstrip('/'), cialo
+        
+    async def _przekieruj(self, metoda: str, sciezka: str, cialo: bytes, pisarz: asyncio.StreamWriter):
+        czesci = sciezka.strip('/').split('/')
+        if czesci == ['stan'] and metoda == 'GET':
+            self._odpowiedz(pisarz, HTTPStatus.OK, self.stan())
+        elif czesci == ['zadania'] and metoda == 'POST':
+            try:
+                zlecenie = self.zglos(json.loads(cialo or b'null'))
+            except asyncio.QueueFull:
+                raise _BladHttp(HTTPStatus.TOO_MANY_REQUESTS, "Kolejka zadań jest pełna",
+                                {'Retry-After': '1'})
+            except ValueError as e:  # także json.JSONDecodeError
+                raise _BladHttp(HTTPStatus.BAD_REQUEST, str(e))
+            self._odpowiedz(pisarz, HTTPStatus.ACCEPTED, {'id': zlecenie.id, 'stan': zlecenie.stan},
+                            {'Location': f'/zadania/{zlecenie.id}'})
+        elif len(czesci) in (2, 3) and czesci[0] == 'zadania':
+            zlecenie = self._zlecenia.get(czesci[1])
+            if zlecenie is None:
+                raise _BladHttp(HTTPStatus.NOT_FOUND, f"Nieznane zadanie: {czesci[1]}")
+            if len(czesci) == 2 and metoda == 'GET':
+                self._odpowiedz(pisarz, HTTPStatus.OK, zlecenie.slownik())
+            elif len(czesci) == 2 and metoda == 'DELETE':
+                if zlecenie.stan != OCZEKUJE:
+                    raise _BladHttp(HTTPStatus.CONFLICT, f"Zadanie jest w stanie {zlecenie.stan}")
+                await zlecenie.ustaw(ANULOWANE)
+                self._odpowiedz(pisarz, HTTPStatus.OK, zlecenie.slownik())
+            elif czesci[2:] == ['strumien'] and metoda == 'GET':
+                await self._strumien(zlecenie, pisarz)
+            else:
+                raise _BladHttp(HTTPStatus.NOT_FOUND, f"Brak zasobu {metoda} {sciezka}")
+        else:
+            raise _BladHttp(HTTPStatus.NOT_FOUND, f"Brak zasobu {metoda} {sciezka}")
+        
+    async def _strumien(self, zlecenie: _Zlecenie, pisarz: asyncio.StreamWriter):
+        """Wysyła stan zadania jako linię JSON przy każdej zmianie; koniec po stanie końcowym."""
+        pisarz.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nConnection: close\r\n\r\n')
+        wyslany = None
+        while True:
+            async with zlecenie.zmiana:
+                await zlecenie.zmiana.wait_for(lambda: zlecenie.stan != wyslany)
+                wyslany = zlecenie.stan
+                linia = json.dumps(zlecenie.slownik(), ensure_ascii=False) + '\n'
+            pisarz.write(linia.encode('utf-8'))
+            await pisarz.drain()
+            if wyslany in KONCOWE:
+                return
+        
+    @staticmethod
+    def _odpowiedz(pisarz: asyncio.StreamWriter, status: HTTPStatus, dane: Dict,
+                   naglowki: Optional[Dict[str, str]] = None):
+        cialo = json.dumps(dane, ensure_ascii=False).encode('utf-8')
+        dodatkowe = ''.join(f'{nazwa}: {wartosc}\r\n' for nazwa, wartosc in (naglowki or {}).items())
+        pisarz.write(f'HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n'
+                     f'Content-Length: {len(cialo)}\r\n{dodatkowe}Connection: close\r\n\r\n'.encode('latin-1')
+                     + cialo)
+
+
+class _BladHttp(Exception):
+    def __init__(self, status: HTTPStatus, opis: str, naglowki: Optional[Dict[str, str]] = None):
+        super().__init__(opis)
+        self.status = status
+        self.naglowki = naglowki
+
+
+def main(argv=None):
+    """Wiersz poleceń: uruchamia usługę do przerwania (Ctrl+C)."""
+    parser = argparse.ArgumentParser(description="Lokalna usługa HTTP/JSON maksymalnego przepływu")
+    parser.add_argument('--host', default='127.0.0.1', help="adres pętli zwrotnej")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--procesy', type=int, default=None, help="liczba procesów roboczych")
+    parser.add_argument('--kolejka', type=int, default=64, help="najwięcej zadań oczekujących")
+    parser.add_argument('--limit-czasu', type=float, default=60.0, help="limit czasu zadania w sekundach")
+    parser.add_argument('--cache', default=None, help="katalog pamięci podręcznej sieci")
+    args = parser.parse_args(argv)
+    
+    async def uruchom():
+        async with UslugaPrzeplywu(args.host, args.port, args.procesy, args.kolejka, args.limit_czasu,
+                                   args.cache) as usluga:
+            print(f"Usługa przepływu: {usluga.adres} ({usluga.procesy} procesów)", flush=True)
+            await usluga.serwuj()
+        
+    try:
+        asyncio.run(uruchom())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
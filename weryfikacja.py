@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Wektorowa weryfikacja przepływu i raport wykorzystania krawędzi.
+
+Ograniczenia przepustowości i warunek zachowania przepływu są sprawdzane
+dla wszystkich krawędzi i wierzchołków naraz operacjami na tablicach
+SiecCSR, a zwracane są tylko naruszenia. Raport CSV z przepływem
+i wykorzystaniem każdej krawędzi jest zapisywany porcjami, a podsumowanie
+(histogram wykorzystania, liczby krawędzi nasyconych i niewykorzystanych)
+jest liczone hurtowo - nic nie jest wypisywane na ekran krawędź po krawędzi.
+"""
+
+import csv
+import gzip
+from typing import Dict, Hashable, Optional
+import numpy as np
+from siec_csr import SiecCSR
+
+
+WIERSZE_NA_ZAPIS = 1 << 16  # wiersze raportu formatowane naraz
+PRZEDZIALY_HISTOGRAMU = 10
+MAX_NARUSZEN = 100  # naruszenia opisywane z nazwy (liczone są wszystkie)
+
+
+def _tolerancja(siec: SiecCSR, tolerancja: Optional[float]) -> float:
+    """Dopuszczalny błąd: 0 dla przepustowości całkowitych, względny dla zmiennoprzecinkowych."""
+    if tolerancja is not None:
+        return tolerancja
+    if siec.przepustowosci.dtype.kind == 'f' and siec.m:
+        return 1e-9 * max(1.0, float(np.abs(siec.przepustowosci).max()))
+    return 0
+
+
+def bilans_wierzcholkow(siec: SiecCSR, przeplyw: Optional[np.ndarray] = None):
+    """
+    Wpływ i wypływ każdego wierzchołka jako dwie tablice długości n.
+    
+    Sumy są liczone w typie przepływu (np.add.at), więc duże wartości
+    całkowite nie tracą dokładności jak przy sumowaniu w float64.
+    """
+    przeplyw = siec.przeplyw if przeplyw is None else np.asarray(przeplyw)
+    wplyw = np.zeros(siec.n, dtype=przeplyw.dtype)
+    wyplyw = np.zeros(siec.n, dtype=przeplyw.dtype)
+    np.add.at(wplyw, np.asarray(siec.cele), przeplyw)
+    np.add.at(wyplyw, np.asarray(siec.zrodla), przeplyw)
+    return wplyw, wyplyw
+
+
+def sprawdz_przeplyw(siec: SiecCSR, przeplyw: Optional[np.ndarray] = None, source: Hashable = 's',
+                     sink: Hashable = 't', tolerancja: Optional[float] = None,
+                     max_naruszen: int = MAX_NARUSZEN) -> Dict:
+    """
+    Sprawdza, czy przepływ jest dopuszczalny: 0 <= f(e) <= c(e) dla każdej
+    krawędzi i wpływ = wypływ w każdym wierzchołku poza źródłem i ujściem.
+    
+    Args:
+        siec: Sieć CSR
+        przeplyw: Przepływy krawędzi (domyślnie siec.przeplyw)
+        source: Źródło
+        sink: Ujście
+        tolerancja: Dopuszczalny błąd (domyślnie 0, a dla przepustowości
+            zmiennoprzecinkowych 1e-9 razy największa przepustowość)
+        max_naruszen: Najwięcej tylu naruszeń każdego rodzaju jest opisywanych z nazwy
+        
+    Returns:
+        Słownik: poprawny, wartosc (wypływ netto ze źródła), wartosc_ujscia
+        (wpływ netto do ujścia), liczba_naruszen_przepustowosci,
+        liczba_naruszen_bilansu oraz listy naruszenia_przepustowosci
+        [(u, v, f, c)] i naruszenia_bilansu [(v, wpływ, wypływ)]
+    """
+    przeplyw = siec.przeplyw if przeplyw is None else np.asarray(przeplyw)
+    if len(przeplyw) != siec.m:
+        raise ValueError(f"Przepływ ma {len(przeplyw)} wartości, sieć ma {siec.m} krawędzi")
+    eps = _tolerancja(siec, tolerancja)
+    wezly = siec.wezly
+    
+    przepustowosci = np.asarray(siec.przepustowosci)
+    zle_krawedzie = np.flatnonzero((przeplyw < -eps) | (przeplyw > przepustowosci + eps))
+    
+    wplyw, wyplyw = bilans_wierzcholkow(siec, przeplyw)
+    roznica = wplyw - wyplyw
+    koncowe = [siec.indeks[v] for v in (source, sink) if v in siec.indeks]
+    zle = np.abs(roznica) > eps
+    zle[koncowe] = False
+    zle_wierzcholki = np.flatnonzero(zle)
+    
+    zrodla, cele = np.asarray(siec.zrodla), np.asarray(siec.cele)
+    s, t = siec.indeks.get(source), siec.indeks.get(sink)
+    return {
+        'poprawny': not len(zle_krawedzie) and not len(zle_wierzcholki),
+        'wartosc': 0 if s is None else -roznica[s].item(),
+        'wartosc_ujscia': 0 if t is None else roznica[t].item(),
+        'liczba_naruszen_przepustowosci': len(zle_krawedzie),
+        'liczba_naruszen_bilansu': len(zle_wierzcholki),
+        'naruszenia_przepustowosci': [
+            (wezly[u], wezly[v], f, c) for u, v, f, c in zip(
+                zrodla[zle_krawedzie[:max_naruszen]].tolist(), cele[zle_krawedzie[:max_naruszen]].tolist(),
+                przeplyw[zle_krawedzie[:max_naruszen]].tolist(),
+                przepustowosci[zle_krawedzie[:max_naruszen]].tolist())],
+        'naruszenia_bilansu': [
+            (wezly[v], a, b) for v, a, b in zip(
+                zle_wierzcholki[:max_naruszen].tolist(), wplyw[zle_wierzcholki[:max_naruszen]].tolist(),
+                wyplyw[zle_wierzcholki[:max_naruszen]].tolist())],
+    }
+
+
+def podsumowanie_wykorzystania(siec: SiecCSR, przeplyw: Optional[np.ndarray] = None,
+                               przedzialy: int = PRZEDZIALY_HISTOGRAMU) -> Dict:
+    """
+    Zbiorcze statystyki wykorzystania krawędzi liczone hurtowo.
+    
+    Returns:
+        Słownik: krawedzie, nasycone, niewykorzystane, czesciowo,
+        suma_przeplywow, suma_przepustowosci, wykorzystanie (ogólne, 0-1),
+        histogram (liczby krawędzi) i granice_histogramu (przedziały wykorzystania)
+    """
+    przeplyw = siec.przeplyw if przeplyw is None else np.asarray(przeplyw)
+    przepustowosci = np.asarray(siec.przepustowosci)
+    wykorzystanie = _wykorzystanie(przeplyw, przepustowosci)
+    nasycone = int(np.count_nonzero((przeplyw >= przepustowosci) & (przepustowosci > 0)))
+    niewykorzystane = int(np.count_nonzero(przeplyw == 0))
+    histogram, granice = np.histogram(np.clip(wykorzystanie, 0, 1), bins=przedzialy, range=(0, 1))
+    suma_przeplywow = przeplyw.sum().item()
+    suma_przepustowosci = przepustowosci.sum().item()
+    return {
+        'krawedzie': siec.m,
+        'nasycone': nasycone,
+        'niewykorzystane': niewykorzystane,
+        'czesciowo': siec.m - nasycone - niewykorzystane,
+        'suma_przeplywow': suma_przeplywow,
+        'suma_przepustowosci': suma_przepustowosci,
+        'wykorzystanie': suma_przeplywow / suma_przepustowosci if suma_przepustowosci else 0.0,
+        'histogram': histogram.tolist(),
+        'granice_histogramu': granice.tolist(),
+    }
+
+
+def _wykorzystanie(przeplyw: np.ndarray, przepustowosci: np.ndarray) -> np.ndarray:
+    return np.divide(przeplyw, przepustowosci, out=np.zeros(len(przeplyw)), where=przepustowosci > 0)
+
+
+def zapisz_raport_csv(siec: SiecCSR, sciezka: str, przeplyw: Optional[np.ndarray] = None,
+                      przedzialy: int = PRZEDZIALY_HISTOGRAMU) -> Dict:
+    """
+    Zapisuje raport krawędzi do CSV porcjami i zwraca podsumowanie wykorzystania.
+    
+    Kolumny: u, v, przeplyw, przepustowosc, wykorzystanie (0-1), nasycona (0/1).
+    Plik .gz jest kompresowany.
+    
+    Args:
+        siec: Sieć CSR
+        sciezka: Ścieżka pliku CSV
+        przeplyw: Przepływy krawędzi (domyślnie siec.przeplyw)
+        przedzialy: Liczba przedziałów histogramu wykorzystania
+        
+    Returns:
+        Podsumowanie jak z podsumowanie_wykorzystania
+    """
+    przeplyw = siec.przeplyw if przeplyw is None else np.asarray(przeplyw)
+    przepustowosci = np.asarray(siec.przepustowosci)
+    zrodla, cele = np.asarray(siec.zrodla), np.asarray(siec.cele)
+    wezly = siec.wezly
+    
+    otworz = gzip.open if sciezka.endswith('.gz') else open
+    with otworz(sciezka, 'wt', newline='', encoding='utf-8') as plik:
+        pisarz = csv.writer(plik)
+        pisarz.writerow(['u', 'v', 'przeplyw', 'przepustowosc', 'wykorzystanie', 'nasycona'])
+        for poczatek in range(0, siec.m, WIERSZE_NA_ZAPIS):
+            koniec = poczatek + WIERSZE_NA_ZAPIS
+            f, c = przeplyw[poczatek:koniec], przepustowosci[poczatek:koniec]
+            wykorzystanie = np.round(_wykorzystanie(f, c), 6)
+            nasycona = ((f >= c) & (c > 0)).astype(np.int8)
+            pisarz.writerows(zip([wezly[u] for u in zrodla[poczatek:koniec].tolist()],
+                                 [wezly[v] for v in cele[poczatek:koniec].tolist()],
+                                 f.tolist(), c.tolist(), wykorzystanie.tolist(), nasycona.tolist()))
+    
+    return podsumowanie_wykorzystania(siec, przeplyw, przedzialy)
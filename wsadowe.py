@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Wsadowe rozwiązywanie wielu sieci przepływowych w puli procesów.
+
+Zadaniem jest specyfikacja generatora (słownik z N, min_capacity,
+max_capacity, seed, ...), lista krawędzi albo ścieżka zapisanej sieci (.bin z modułu
+format_binarny, .max / .max.gz w formacie DIMACS). Generowanie i obliczenia
+odbywają się w procesach roboczych, a rekordy wyników są zwracane w miarę
+ich kończenia (nie w kolejności zadań).
+
+Awaria procesu roboczego (np. zabity proces, brak pamięci) nie przerywa
+wsadu: zadania, które były wtedy w toku, są powtarzane pojedynczo, a zadanie
+powodujące awarię dostaje rekord z opisem błędu.
+
+Użycie z wiersza poleceń (wyniki w formacie JSON Lines):
+    python wsadowe.py --N 10 20 50 --seeds 0 1 2 --algorithm dinic
+    python wsadowe.py siec1.bin instancja.max.gz --procesy 8 -o wyniki.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+
+Zadanie = Union[Dict, str]
+
+
+def _opis_zadania(zadanie: Zadanie) -> Dict:
+    """Sprowadza zadanie do słownika (ścieżka pliku -> {'plik': ścieżka})."""
+    if isinstance(zadanie, (str, os.PathLike)):
+        return {'plik': os.fspath(zadanie)}
+    return dict(zadanie)
+
+
+def rozwiaz_zadanie(zadanie: Zadanie, katalog_pamieci: Optional[str] = None) -> Dict:
+    """
+    Generuje (lub wczytuje) sieć i wyznacza maksymalny przepływ.
+    
+    Klucze zadania:
+        plik: ścieżka sieci (.bin, .max, .max.gz) - zamiast parametrów generatora
+        krawedzie: lista [u, v, przepustowość] - sieć podana wprost (zamiast pliku i generatora)
+        N, min_capacity, max_capacity, seed: parametry SiecPrzeplywowa
+        tryb: 'csr' (generator wektorowy, domyślnie) lub 'graf' (networkx)
+        algorithm: silnik FordFulkerson (domyślnie edmonds-karp)
+        bfs: tryb wyszukiwania ścieżek z FordFulkerson.TRYBY_BFS (domyślnie jednokierunkowy)
+        start: przepływ początkowy z FordFulkerson.TRYBY_STARTU, np. 'warstwowy'
+        source, sink: wierzchołki (domyślnie 's' i 't' lub z pliku DIMACS)
+        przeplyw: czy dołączyć przepływy krawędzi (domyślnie nie)
+        
+    Returns:
+        Rekord wyniku: max_flow, iterations, nodes, edges, algorithm, bfs,
+        bfs_visits (wierzchołki odwiedzone przez wszystkie przeszukiwania),
+        wartosc_startowa (przepływ, od którego ruszył silnik) oraz
+        czasy czas_przygotowania i czas_obliczen w sekundach; z opcją przeplyw
+        także 'przeplywy' - lista [u, v, f] krawędzi z niezerowym przepływem
+    """
+    # Import w procesie roboczym - proces nadzorujący nie potrzebuje NumPy/networkx
+    from zadanie1_siec_przeplywowa import SiecPrzeplywowa
+    from zadanie2_ford_fulkerson import FordFulkerson
+    from magazyn_sieci import PamiecSieci
+    from siec_csr import SiecCSR
+    from dziennik import CISZA
+    
+    opis = _opis_zadania(zadanie)
+    source, sink = opis.get('source', 's'), opis.get('sink', 't')
+    
+    start = time.perf_counter()
+    plik = opis.get('plik')
+    if opis.get('krawedzie') is not None:
+        siec = SiecCSR.z_krawedzi(opis['krawedzie'])
+    elif plik is None:
+        generator = SiecPrzeplywowa(opis['N'], opis.get('min_capacity', 1), opis.get('max_capacity', 10),
+                                    verbosity=CISZA, seed=opis.get('seed'),
+                                    cache=PamiecSieci(katalog_pamieci) if katalog_pamieci else None)
+        if opis.get('tryb', 'csr') == 'graf':
+            generator.generuj_siec()
+            siec = generator.do_csr()
+        else:
+            siec = generator.generuj_siec_csr()
+    elif plik.endswith(('.max', '.max.gz', '.dimacs')):
+        from format_dimacs import wczytaj_dimacs
+        siec, source, sink = wczytaj_dimacs(plik)
+    else:
+        from format_binarny import wczytaj_siec
+        siec = wczytaj_siec(plik)
+    czas_przygotowania = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    ff = FordFulkerson(siec, history='off', verbosity=CISZA)
+    max_flow = ff.znajdz_maksymalny_przeplyw(source, sink, algorithm=opis.get('algorithm'), bfs=opis.get('bfs'),
+                                             start=opis.get('start'))
+    czas_obliczen = time.perf_counter() - start
+    
+    rekord = {
+        'max_flow': max_flow,
+        'iterations': ff.liczba_iteracji,
+        'nodes': siec.n,
+        'edges': siec.m,
+        'algorithm': opis.get('algorithm') or ff.domyslny_algorytm,
+        'bfs': opis.get('bfs') or ff.domyslny_bfs,
+        'bfs_visits': ff.odwiedzone_wierzcholki,
+        'wartosc_startowa': ff.statystyki.wartosc_startowa,
+        'czas_przygotowania': czas_przygotowania,
+        'czas_obliczen': czas_obliczen,
+    }
+    if opis.get('przeplyw'):
+        rekord['przeplywy'] = [[u, v, f] for (u, v), f in ff.flow.items() if f]
+    return rekord
+
+
+def _rekord(indeks: int, zadanie: Zadanie, wynik: Optional[Dict] = None, blad: Optional[str] = None) -> Dict:
+    rekord = {'indeks': indeks, 'zadanie': _opis_zadania(zadanie), 'blad': blad}
+    rekord.update(wynik or {})
+    return rekord
+
+
+def rozwiaz_wsadowo(zadania: Iterable[Zadanie], procesy: Optional[int] = None,
+                    katalog_pamieci: Optional[str] = None,
+                    funkcja: Callable[..., Dict] = rozwiaz_zadanie) -> Iterator[Dict]:
+    """
+    Rozwiązuje zadania w puli procesów i zwraca rekordy w kolejności ukończenia.
+    
+    Zadania są pobierane z iteratora leniwie - w toku jest najwyżej tyle zadań,
+    ile procesów, więc wsad może być dowolnie długi.
+    
+    Args:
+        zadania: Specyfikacje generatora lub ścieżki zapisanych sieci
+        procesy: Liczba procesów roboczych (domyślnie liczba procesorów)
+        katalog_pamieci: Katalog PamiecSieci dla generowanych sieci (opcjonalnie)
+        funkcja: Funkcja (zadanie, katalog_pamieci) -> rekord wykonywana w procesie
+        
+    Yields:
+        Rekord wyniku uzupełniony o 'indeks' (pozycja zadania), 'zadanie'
+        i 'blad' (None albo opis wyjątku lub awarii procesu)
+    """
+    procesy = procesy or os.cpu_count() or 1
+    kolejka = enumerate(zadania)
+    pula = ProcessPoolExecutor(procesy)
+    w_toku = {}  # future -> (indeks, zadanie)
+    
+    try:
+        while True:
+            while len(w_toku) < procesy:
+                nastepne = next(kolejka, None)
+                if nastepne is None:
+                    break
+                w_toku[pula.submit(funkcja, nastepne[1], katalog_pamieci)] = nastepne
+            if not w_toku:
+                return
+                
+            gotowe, _ = wait(w_toku, return_when=FIRST_COMPLETED)
+            awaria = False
+            for future in gotowe:
+                indeks, zadanie = w_toku.pop(future)
+                try:
+                    yield _rekord(indeks, zadanie, future.result())
+                except BrokenProcessPool:
+                    awaria = True
+                    yield from _powtorz_osobno([(indeks, zadanie)], katalog_pamieci, funkcja)
+                except Exception as e:
+                    yield _rekord(indeks, zadanie, blad=f"{type(e).__name__}: {e}")
+                    
+            if awaria:
+                # Pula jest bezużyteczna: pozostałe zadania w toku powtarzamy
+                # pojedynczo, żeby wskazać to, które powoduje awarię
+                podejrzane = list(w_toku.values())
+                w_toku.clear()
+                pula.shutdown(wait=False, cancel_futures=True)
+                yield from _powtorz_osobno(podejrzane, katalog_pamieci, funkcja)
+                pula = ProcessPoolExecutor(procesy)
+    finally:
+        pula.shutdown(wait=False, cancel_futures=True)
+
+
+def _powtorz_osobno(zadania, katalog_pamieci: Optional[str], funkcja) -> Iterator[Dict]:
+    """Wykonuje każde zadanie we własnym procesie; awaria dotyczy wtedy tylko jego."""
+    for indeks, zadanie in zadania:
+        with ProcessPoolExecutor(1) as pula:
+            try:
+                yield _rekord(indeks, zadanie, pula.submit(funkcja, zadanie, katalog_pamieci).result())
+            except BrokenProcessPool:
+                yield _rekord(indeks, zadanie, blad="awaria procesu roboczego")
+            except Exception as e:
+                yield _rekord(indeks, zadanie, blad=f"{type(e).__name__}: {e}")
+
+
+def main(argv=None):
+    """Wiersz poleceń: wsadowe rozwiązywanie sieci, wyniki jako JSON Lines."""
+    parser = argparse.ArgumentParser(description="Wsadowe wyznaczanie maksymalnego przepływu")
+    parser.add_argument('pliki', nargs='*', help="zapisane sieci (.bin, .max, .max.gz)")
+    parser.add_argument('--N', type=int, nargs='*', default=[], help="liczby warstw generowanych sieci")
+    parser.add_argument('--seeds', type=int, nargs='*', default=[0], help="ziarna generatora dla każdego N")
+    parser.add_argument('--min-capacity', type=int, default=1)
+    parser.add_argument('--max-capacity', type=int, default=10)
+    parser.add_argument('--algorithm', default=None, help="silnik FordFulkerson (domyślnie edmonds-karp)")
+    parser.add_argument('--bfs', default=None, help="tryb BFS: jednokierunkowy (domyślnie), dwukierunkowy lub wektorowy")
+    parser.add_argument('--start', default=None, help="przepływ początkowy: warstwowy (zachłanny) lub zero")
+    parser.add_argument('--procesy', type=int, default=None, help="liczba procesów roboczych")
+    parser.add_argument('--cache', default=None, help="katalog pamięci podręcznej sieci")
+    parser.add_argument('-o', '--wyjscie', default=None, help="plik wyników (domyślnie stdout)")
+    args = parser.parse_args(argv)
+    
+    zadania = [{'plik': plik, 'algorithm': args.algorithm, 'bfs': args.bfs, 'start': args.start}
+               for plik in args.pliki]
+    zadania += [{'N': N, 'min_capacity': args.min_capacity, 'max_capacity': args.max_capacity,
+                 'seed': seed, 'algorithm': args.algorithm, 'bfs': args.bfs, 'start': args.start}
+                for N in args.N for seed in args.seeds]
+    if not zadania:
+        parser.error("podaj pliki sieci lub --N")
+        
+    wyjscie = open(args.wyjscie, 'w', encoding='utf-8') if args.wyjscie else sys.stdout
+    bledy = 0
+    try:
+        for rekord in rozwiaz_wsadowo(zadania, args.procesy, args.cache):
+            bledy += rekord['blad'] is not None
+            wyjscie.write(json.dumps(rekord, ensure_ascii=False) + '\n')
+            wyjscie.flush()
+    finally:
+        if wyjscie is not sys.stdout:
+            wyjscie.close()
+    return 1 if bledy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,18 +10,34 @@ Program generuje losową sieć przepływową zgodnie z procedurą:
 4. Dodaje 2N dodatkowych losowych łuków
 5. Przypisuje przepustowości
 6. Wizualizuje sieć
+
+Dla dużych sieci generuj_siec_csr() wykonuje te same kroki wsadowo w NumPy
+i zwraca tablice CSR; graf networkx powstaje dopiero na żądanie (zbuduj_graf).
 """
 
 import random
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from typing import List, Tuple, Dict, Set
+from typing import TYPE_CHECKING, List, Tuple, Dict, Set, Optional
 import numpy as np
+from dziennik import Dziennik, Ujscie, SZCZEGOLY, ITERACJE, PODSUMOWANIE
+from siec_csr import SiecCSR
+from magazyn_sieci import PamiecSieci
+from format_binarny import zapisz_siec
+from uklad_warstwowy import uklad_warstwowy
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+# Wersja procedury generowania - zmiana przebiegu losowania musi ją podbić,
+# bo wchodzi do klucza pamięci podręcznej sieci
+WERSJA_GENERATORA = 1
 
 
 class SiecPrzeplywowa:
-    def __init__(self, N: int, min_capacity: int = 1, max_capacity: int = 10):
+    def __init__(self, N: int, min_capacity: int = 1, max_capacity: int = 10,
+                 verbosity: int = SZCZEGOLY, sink: Optional[Ujscie] = None,
+                 seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                 cache: Optional[PamiecSieci] = None):
         """
         Inicjalizuje generator sieci przepływowej.
         
@@ -29,20 +45,64 @@ class SiecPrzeplywowa:
             N: Liczba pośrednich warstw (N >= 2)
             min_capacity: Minimalna przepustowość krawędzi
             max_capacity: Maksymalna przepustowość krawędzi
+            verbosity: Minimalny poziom zgłaszanych zdarzeń z modułu dziennik
+            sink: Odbiorca zdarzeń (poziom, komunikat); domyślnie stdout
+            seed: Ziarno losowania - ta sama wartość daje tę samą sieć, także
+                przy każdym kolejnym wywołaniu generuj_siec / generuj_siec_csr
+            rng: Własny generator liczb losowych (random.Random); kolejne
+                wywołania kontynuują jego strumień, więc dają różne sieci. Bez
+                seed i rng używany jest globalny moduł random
+            cache: Pamięć podręczna sieci; używana tylko przy podanym seed
+            
+        Raises:
+            ValueError: Gdy N < 2 albo podano jednocześnie seed i rng
         """
         if N < 2:
             raise ValueError("N musi być >= 2")
+        if seed is not None and rng is not None:
+            raise ValueError("Podaj seed albo rng, nie oba naraz")
         
         self.N = N
         self.min_capacity = min_capacity
         self.max_capacity = max_capacity
-        self.graph = nx.DiGraph()
+        self._graph = None  # graf networkx - tworzony przy pierwszym użyciu
         self.warstwy = {}  # warstwa -> lista wierzchołków
         self.pozycje = {}  # pozycje wierzchołków do wizualizacji
+        self.csr = None  # sieć z trybu wektorowego (generuj_siec_csr)
+        self.dziennik = Dziennik(verbosity, sink)
+        self.seed = seed
+        self.cache = cache
+        if rng is not None:
+            self.rng = rng
+        elif seed is not None:
+            self.rng = random.Random(seed)
+        else:
+            self.rng = random
+        
+    @property
+    def graph(self) -> 'nx.DiGraph':
+        """Graf networkx sieci (networkx jest importowany dopiero tutaj)."""
+        if self._graph is None:
+            import networkx as nx
+            self._graph = nx.DiGraph()
+        return self._graph
+    
+    @graph.setter
+    def graph(self, graph: 'nx.DiGraph'):
+        self._graph = graph
         
-    def generuj_siec(self) -> nx.DiGraph:
+    def generuj_siec(self) -> 'nx.DiGraph':
         """Generuje losową sieć przepływową zgodnie z procedurą."""
-        print(f"Generuję sieć przepływową z N={self.N} warstwami pośrednimi...")
+        self.dziennik(PODSUMOWANIE, f"Generuję sieć przepływową z N={self.N} warstwami pośrednimi...")
+        
+        self._nowe_losowanie()
+        self._graph = None
+        self.warstwy, self.pozycje = {}, {}
+        klucz = self._klucz_pamieci('graf')
+        if klucz is not None and self._wczytaj_z_pamieci(klucz):
+            self.graph = self.csr.do_grafu()
+            self.csr = None
+            return self.graph
         
         # Krok 1: Definiowanie warstw i rozmieszczanie wierzchołków
         self._utworz_warstwy()
@@ -59,8 +119,152 @@ class SiecPrzeplywowa:
         # Oblicz pozycje do wizualizacji
         self._oblicz_pozycje()
         
-        print(f"Wygenerowano sieć z {self.graph.number_of_nodes()} wierzchołkami "
-              f"i {self.graph.number_of_edges()} krawędziami")
+        self.dziennik(PODSUMOWANIE, f"Wygenerowano sieć z {self.graph.number_of_nodes()} wierzchołkami "
+                                    f"i {self.graph.number_of_edges()} krawędziami")
+        
+        if klucz is not None:
+            self._zapisz_w_pamieci(klucz, SiecCSR.z_grafu(self.graph), self.pozycje)
+        
+        return self.graph
+    
+    def generuj_siec_csr(self) -> SiecCSR:
+        """
+        Generuje sieć tą samą procedurą co generuj_siec, ale wsadowymi
+        operacjami NumPy - bez grafu networkx i pętli po wierzchołkach.
+        
+        Wierzchołki są numerowane warstwami: s = 0, potem kolejne warstwy
+        pośrednie, t jako ostatni. Graf networkx (oraz warstwy i pozycje do
+        wizualizacji) można potem zbudować metodą zbuduj_graf().
+        
+        Returns:
+            Sieć w postaci SiecCSR (zapisana również w self.csr)
+        """
+        self.dziennik(PODSUMOWANIE, f"Generuję wektorowo sieć przepływową z N={self.N} warstwami pośrednimi...")
+        
+        self._nowe_losowanie()
+        klucz = self._klucz_pamieci('csr')
+        if klucz is not None and self._wczytaj_z_pamieci(klucz):
+            return self.csr
+        
+        # Generator NumPy ziarnowany z self.rng, więc seed (lub random.seed) steruje oboma trybami
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        
+        # Krok 1: Rozmiary warstw (s i t mają po jednym wierzchołku)
+        rozmiary = np.concatenate(([1], rng.integers(2, self.N + 1, size=self.N), [1]))
+        poczatki = np.concatenate(([0], np.cumsum(rozmiary)))
+        warstwa = np.repeat(np.arange(self.N + 2), rozmiary)
+        n = int(poczatki[-1])
+        
+        if self.dziennik.wlaczony(ITERACJE):
+            self.dziennik(ITERACJE, "Utworzone warstwy:")
+            for i, rozmiar in enumerate(rozmiary.tolist()):
+                self.dziennik(ITERACJE, f"  Warstwa {i}: {rozmiar} wierzchołków")
+        
+        # Krok 2: Łuk wychodzący z każdego wierzchołka (poza t) do losowego
+        # wierzchołka następnej warstwy ...
+        zrodla_wyj = np.arange(n - 1)
+        nastepna = warstwa[zrodla_wyj] + 1
+        cele_wyj = poczatki[nastepna] + (rng.random(n - 1) * rozmiary[nastepna]).astype(np.int64)
+        
+        # ... oraz łuk z losowego wierzchołka poprzedniej warstwy do każdego
+        # wierzchołka, do którego nic jeszcze nie wchodzi (poza s)
+        bez_wejscia = np.flatnonzero(np.bincount(cele_wyj, minlength=n) == 0)
+        cele_wej = bez_wejscia[bez_wejscia != 0]
+        poprzednia = warstwa[cele_wej] - 1
+        zrodla_wej = poczatki[poprzednia] + (rng.random(len(cele_wej)) * rozmiary[poprzednia]).astype(np.int64)
+        
+        zrodla = np.concatenate((zrodla_wyj, zrodla_wej))
+        cele = np.concatenate((cele_wyj, cele_wej))
+        self.dziennik(PODSUMOWANIE, f"Dodano {len(zrodla)} krawędzi podstawowych między warstwami")
+        
+        # Krok 3: 2N dodatkowych łuków - z 20N losowych prób (jak w generuj_siec)
+        # brane są pierwsze poprawne: u != v, v != s, u != t, bez powtórzeń
+        cel_luki = 2 * self.N
+        u = rng.integers(0, n, size=cel_luki * 10)
+        v = rng.integers(0, n, size=cel_luki * 10)
+        klucze = u * n + v
+        poprawne = (u != v) & (v != 0) & (u != n - 1) & ~np.isin(klucze, zrodla * n + cele)
+        _, pierwsze = np.unique(klucze, return_index=True)
+        unikalne = np.zeros(len(klucze), dtype=bool)
+        unikalne[pierwsze] = True
+        wybrane = np.flatnonzero(poprawne & unikalne)[:cel_luki]
+        
+        zrodla = np.concatenate((zrodla, u[wybrane]))
+        cele = np.concatenate((cele, v[wybrane]))
+        self.dziennik(PODSUMOWANIE, f"Dodano {len(wybrane)} dodatkowych losowych łuków (cel: {cel_luki})")
+        
+        # Krok 4: Przepustowości
+        przepustowosci = rng.integers(self.min_capacity, self.max_capacity + 1, size=len(zrodla))
+        self.dziennik(PODSUMOWANIE, f"Przypisano przepustowości z zakresu [{self.min_capacity}, {self.max_capacity}]")
+        
+        # Nazwy wierzchołków takie jak w generuj_siec: s, v{warstwa}_{j}, t
+        pozycja_w_warstwie = np.arange(n) - poczatki[warstwa]
+        wezly = ['s'] + [f'v{w}_{j}' for w, j in zip(warstwa[1:-1].tolist(),
+                                                    pozycja_w_warstwie[1:-1].tolist())] + ['t']
+        
+        self.csr = SiecCSR(wezly, zrodla, cele, przepustowosci, warstwy=warstwa)
+        self.dziennik(PODSUMOWANIE, f"Wygenerowano sieć z {n} wierzchołkami i {len(zrodla)} krawędziami")
+        
+        if klucz is not None:
+            self._zapisz_w_pamieci(klucz, self.csr)
+        
+        return self.csr
+    
+    def _nowe_losowanie(self):
+        """Przy podanym seed każde wywołanie generatora losuje od początku (jak odczyt z pamięci)."""
+        if self.seed is not None:
+            self.rng = random.Random(self.seed)
+    
+    def _klucz_pamieci(self, tryb: str) -> Optional[str]:
+        """Klucz sieci w pamięci podręcznej (None, gdy wynik nie jest powtarzalny)."""
+        if self.cache is None or self.seed is None:
+            return None
+        return PamiecSieci.klucz(self.N, self.min_capacity, self.max_capacity, self.seed,
+                                 WERSJA_GENERATORA, tryb)
+    
+    def _wczytaj_z_pamieci(self, klucz: str) -> bool:
+        """Odtwarza self.csr, self.warstwy i self.pozycje z pamięci podręcznej."""
+        dane = self.cache.wczytaj(klucz)
+        if dane is None:
+            return False
+        
+        wezly = dane['wezly'].tolist()
+        warstwy = dane['warstwy']
+        self.csr = SiecCSR(wezly, dane['zrodla'], dane['cele'], dane['przepustowosci'], warstwy=warstwy)
+        self.warstwy = {}
+        for v, w in zip(wezly, warstwy.tolist()):
+            self.warstwy.setdefault(w, []).append(v)
+        self.pozycje = {v: (x, y) for v, (x, y) in zip(wezly, dane['pozycje'].tolist())}
+        
+        self.dziennik(PODSUMOWANIE, f"Wczytano sieć z pamięci podręcznej: {self.csr.n} wierzchołków, "
+                                    f"{self.csr.m} krawędzi")
+        return True
+    
+    def _zapisz_w_pamieci(self, klucz: str, siec: SiecCSR, pozycje: Optional[Dict] = None):
+        """Zapisuje tablice krawędzi, warstwy i pozycje (jeśli są policzone) sieci."""
+        if pozycje:
+            pozycje = np.array([pozycje[v] for v in siec.wezly], dtype=np.float64)
+        else:
+            pozycje = np.empty((0, 2))
+        self.cache.zapisz(klucz, {
+            'wezly': np.array(siec.wezly),
+            'zrodla': siec.zrodla,
+            'cele': siec.cele,
+            'przepustowosci': siec.przepustowosci,
+            'warstwy': siec.warstwy,
+            'pozycje': pozycje,
+        })
+    
+    def zbuduj_graf(self) -> 'nx.DiGraph':
+        """Buduje graf networkx, warstwy i pozycje z sieci wygenerowanej przez generuj_siec_csr."""
+        if self.csr is None:
+            raise ValueError("Brak sieci CSR - najpierw wywołaj generuj_siec_csr()")
+        
+        self.graph = self.csr.do_grafu()
+        self.warstwy = {}
+        for v, w in zip(self.csr.wezly, self.csr.warstwy.tolist()):
+            self.warstwy.setdefault(w, []).append(v)
+        self._oblicz_pozycje()
         
         return self.graph
     
@@ -72,7 +276,7 @@ class SiecPrzeplywowa:
         
         # Warstwy pośrednie 1 do N
         for i in range(1, self.N + 1):
-            liczba_wierzcholkow = random.randint(2, self.N)
+            liczba_wierzcholkow = self.rng.randint(2, self.N)
             wierzcholki = [f'v{i}_{j}' for j in range(liczba_wierzcholkow)]
             self.warstwy[i] = wierzcholki
             
@@ -83,9 +287,10 @@ class SiecPrzeplywowa:
         self.warstwy[self.N + 1] = ['t']
         self.graph.add_node('t', warstwa=self.N + 1)
         
-        print("Utworzone warstwy:")
-        for warstwa, wierzcholki in self.warstwy.items():
-            print(f"  Warstwa {warstwa}: {len(wierzcholki)} wierzchołków - {wierzcholki}")
+        if self.dziennik.wlaczony(ITERACJE):
+            self.dziennik(ITERACJE, "Utworzone warstwy:")
+            for warstwa, wierzcholki in self.warstwy.items():
+                self.dziennik(ITERACJE, f"  Warstwa {warstwa}: {len(wierzcholki)} wierzchołków - {wierzcholki}")
     
     def _polacz_warstwy(self):
         """Łączy wierzchołki między kolejnymi warstwami zapewniając spójność."""
@@ -95,16 +300,16 @@ class SiecPrzeplywowa:
             
             # Zapewnienie, że z każdego wierzchołka wychodzi co najmniej jeden łuk
             for v in warstwa_aktualna:
-                cel = random.choice(warstwa_nastepna)
+                cel = self.rng.choice(warstwa_nastepna)
                 self.graph.add_edge(v, cel)
             
             # Zapewnienie, że do każdego wierzchołka wchodzi co najmniej jeden łuk
             for v in warstwa_nastepna:
                 if self.graph.in_degree(v) == 0:
-                    zrodlo = random.choice(warstwa_aktualna)
+                    zrodlo = self.rng.choice(warstwa_aktualna)
                     self.graph.add_edge(zrodlo, v)
         
-        print(f"Dodano {self.graph.number_of_edges()} krawędzi podstawowych między warstwami")
+        self.dziennik(PODSUMOWANIE, f"Dodano {self.graph.number_of_edges()} krawędzi podstawowych między warstwami")
     
     def _dodaj_losowe_luki(self):
         """Dodaje 2N dodatkowych losowych łuków."""
@@ -120,8 +325,8 @@ class SiecPrzeplywowa:
             prob += 1
             
             # Losuj dwa różne wierzchołki
-            u = random.choice(wszystkie_wierzcholki)
-            v = random.choice(wszystkie_wierzcholki)
+            u = self.rng.choice(wszystkie_wierzcholki)
+            v = self.rng.choice(wszystkie_wierzcholki)
             
             # Sprawdź warunki:
             # - różne wierzchołki
@@ -136,15 +341,15 @@ class SiecPrzeplywowa:
                 self.graph.add_edge(u, v)
                 dodane_luki += 1
         
-        print(f"Dodano {dodane_luki} dodatkowych losowych łuków (cel: {cel_luki})")
+        self.dziennik(PODSUMOWANIE, f"Dodano {dodane_luki} dodatkowych losowych łuków (cel: {cel_luki})")
     
     def _przypisz_przepustowosci(self):
         """Przypisuje losowe przepustowości wszystkim krawędziom."""
         for u, v in self.graph.edges():
-            capacity = random.randint(self.min_capacity, self.max_capacity)
+            capacity = self.rng.randint(self.min_capacity, self.max_capacity)
             self.graph[u][v]['capacity'] = capacity
         
-        print(f"Przypisano przepustowości z zakresu [{self.min_capacity}, {self.max_capacity}]")
+        self.dziennik(PODSUMOWANIE, f"Przypisano przepustowości z zakresu [{self.min_capacity}, {self.max_capacity}]")
     
     def _oblicz_pozycje(self):
         """Oblicza pozycje wierzchołków do wizualizacji w warstwach."""
@@ -163,8 +368,76 @@ class SiecPrzeplywowa:
             for i, v in enumerate(wierzcholki):
                 self.pozycje[v] = (x, y_positions[i])
     
-    def wizualizuj(self, figsize: Tuple[int, int] = (12, 8), save_file: str = None):
-        """Wizualizuje wygenerowaną sieć przepływową."""
+    def do_csr(self) -> SiecCSR:
+        """
+        Zwraca wygenerowaną sieć w zwartej postaci CSR.
+        
+        Wierzchołki są numerowane warstwami (s ma numer 0, t ostatni), a numer
+        warstwy każdego wierzchołka trafia do tablicy SiecCSR.warstwy.
+        """
+        wezly = [v for warstwa in sorted(self.warstwy) for v in self.warstwy[warstwa]]
+        warstwy = [warstwa for warstwa in sorted(self.warstwy) for _ in self.warstwy[warstwa]]
+        indeks = {v: i for i, v in enumerate(wezly)}
+        
+        krawedzie = list(self.graph.edges(data='capacity'))
+        zrodla = [indeks[u] for u, _, _ in krawedzie]
+        cele = [indeks[v] for _, v, _ in krawedzie]
+        przepustowosci = [c for _, _, c in krawedzie]
+        
+        return SiecCSR(wezly, zrodla, cele, przepustowosci, warstwy=warstwy)
+    
+    def zapisz(self, sciezka: str):
+        """
+        Zapisuje wygenerowaną sieć w binarnym formacie odwzorowywanym w pamięci.
+        
+        Plik wczytuje format_binarny.wczytaj_siec, a wynik można przekazać
+        bezpośrednio do FordFulkerson.
+        """
+        siec = self.csr if self.csr is not None else self.do_csr()
+        zapisz_siec(siec, sciezka)
+    
+    def wizualizuj(self, figsize: Tuple[int, int] = (12, 8), save_file: str = None,
+                   tryb: str = 'auto', pokaz: Optional[bool] = None, dpi: Optional[int] = None):
+        """
+        Wizualizuje wygenerowaną sieć przepływową.
+        
+        Args:
+            figsize: Rozmiar rysunku w calach
+            save_file: Plik, do którego zapisać rysunek (opcjonalnie)
+            tryb: 'networkx' (strzałki i etykiety każdej krawędzi), 'szybki'
+                (moduł rysowanie - krawędzie hurtowo, etykiety tylko w małych
+                sieciach) lub 'auto' - szybki dla sieci ponad PROG_RYSOWANIA_NX krawędzi
+            pokaz: Czy pokazać okno; domyślnie tylko bez save_file (rysunek
+                zapisywany do pliku jest potem zamykany)
+            dpi: Rozdzielczość zapisu (domyślnie 300 w trybie networkx, 150 w szybkim)
+        """
+        # Moduły rysowania są ładowane dopiero tutaj - sam generator potrzebuje tylko NumPy
+        from rysowanie import czy_szybki, rysuj_siec, tablica_pozycji
+        if pokaz is None:
+            pokaz = not save_file
+        
+        siec = self.csr
+        liczba_krawedzi = siec.m if siec is not None else self.graph.number_of_edges()
+        if czy_szybki(tryb, liczba_krawedzi):
+            siec = siec if siec is not None else self.do_csr()
+            if len(self.pozycje) == siec.n:
+                pozycje = tablica_pozycji(siec.wezly, self.pozycje)
+            else:
+                pozycje = uklad_warstwowy(siec)
+            rysuj_siec(siec, pozycje, tytul=f'Losowa sieć przepływowa (N={self.N})\n'
+                                           f'Wierzchołki: {siec.n}, Krawędzie: {siec.m}',
+                       save_file=save_file, pokaz=pokaz,
+                       figsize=figsize, dpi=dpi or 150)
+            if save_file:
+                self.dziennik(PODSUMOWANIE, f"Wykres zapisano do pliku: {save_file}")
+            return
+        
+        import networkx as nx
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+        
+        if self.graph.number_of_nodes() == 0 and self.csr is not None:
+            self.zbuduj_graf()
         plt.figure(figsize=figsize)
         
         # Rysuj wierzchołki
@@ -217,10 +490,13 @@ class SiecPrzeplywowa:
         plt.tight_layout()
         
         if save_file:
-            plt.savefig(save_file, dpi=300, bbox_inches='tight')
-            print(f"Wykres zapisano do pliku: {save_file}")
+            plt.savefig(save_file, dpi=dpi or 300, bbox_inches='tight')
+            self.dziennik(PODSUMOWANIE, f"Wykres zapisano do pliku: {save_file}")
         
-        plt.show()
+        if pokaz:
+            plt.show()
+        else:
+            plt.close()
     
     def wypisz_statystyki(self):
         """Wypisuje statystyki wygenerowanej sieci."""
@@ -250,6 +526,7 @@ class SiecPrzeplywowa:
         
         # Sprawdź spójność
         try:
+            import networkx as nx
             path_exists = nx.has_path(self.graph, 's', 't')
             print(f"Istnieje ścieżka od s do t: {'TAK' if path_exists else 'NIE'}")
         except:
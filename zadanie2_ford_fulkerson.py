@@ -7,89 +7,465 @@ Program implementuje algorytm Edmondsa-Karpa do znajdowania maksymalnego przepł
 w sieci przepływowej wygenerowanej w zadaniu 1.
 
 Algorytm używa BFS do znajdowania najkrótszych ścieżek powiększających w sieci rezydualnej.
+Jako alternatywne silniki dostępne są algorytm Dinica (przepływy blokujące w grafie poziomów)
+oraz push-relabel z heurystykami luki i globalnego przeetykietowania.
 """
 
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import math
 from collections import deque
-from typing import List, Tuple, Dict, Optional, Set
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, List, Tuple, Dict, Optional, Set, Union
 import numpy as np
 from zadanie1_siec_przeplywowa import SiecPrzeplywowa
+from siec_csr import SiecCSR
+from format_binarny import zapisz_siec
+from statystyki import Statystyki
+from uklad_warstwowy import uklad_warstwowy
+from przeplyw_warstwowy import przeplyw_warstwowy
+from weryfikacja import sprawdz_przeplyw, podsumowanie_wykorzystania, zapisz_raport_csv, bilans_wierzcholkow
+from dziennik import Dziennik, Ujscie, SZCZEGOLY, ITERACJE, PODSUMOWANIE
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+PROG_WYPISYWANIA_KRAWEDZI = 100  # wypisz_statystyki: do tylu krawędzi (wierzchołków) wiersz na każdą
 
 
 class FordFulkerson:
-    def __init__(self, graph: nx.DiGraph):
+    # Dostępne algorytmy (silniki) wyznaczania maksymalnego przepływu
+    ALGORYTMY = ('edmonds-karp', 'capacity-scaling', 'dinic', 'push-relabel', 'push-relabel-fifo')
+    domyslny_algorytm = 'edmonds-karp'
+    # Przeszukiwanie ścieżek powiększających silników edmonds-karp i capacity-scaling
+    TRYBY_BFS = ('jednokierunkowy', 'dwukierunkowy', 'wektorowy')
+    domyslny_bfs = 'jednokierunkowy'
+    # Przepływ, od którego startują obliczenia
+    TRYBY_STARTU = ('biezacy', 'zero', 'warstwowy')
+    domyslny_start = 'biezacy'
+    # Tryby zapisu historii iteracji
+    TRYBY_HISTORII = ('full', 'delta', 'checkpoints', 'off')
+    
+    def __init__(self, graph: Union['nx.DiGraph', SiecCSR], history: str = 'full', checkpoint_interval: int = 100,
+                 verbosity: int = SZCZEGOLY, sink: Optional[Ujscie] = None):
         """
         Inicjalizuje algorytm Forda-Fulkersona.
         
         Args:
-            graph: Graf skierowany z przepustowościami (atrybut 'capacity')
+            graph: Graf skierowany z przepustowościami (atrybut 'capacity') albo
+                gotowa SiecCSR (używana bez kopiowania - przepływ jest zapisywany w niej)
+            history: Tryb historii iteracji:
+                'full' - pełna kopia przepływu po każdej iteracji (O(E) na iterację),
+                'delta' - tylko ścieżka i przepustowość rezydualna (O(długość ścieżki)),
+                'checkpoints' - jak 'delta' plus kopia przepływu co checkpoint_interval iteracji,
+                'off' - brak historii (liczona jest tylko liczba iteracji)
+            checkpoint_interval: Co ile iteracji zapisywać punkt kontrolny w trybie 'checkpoints'
+            verbosity: Minimalny poziom zgłaszanych zdarzeń z modułu dziennik
+                (SZCZEGOLY, ITERACJE, PODSUMOWANIE lub CISZA)
+            sink: Odbiorca zdarzeń (poziom, komunikat); domyślnie stdout
         """
-        self.original_graph = graph.copy()
-        self.flow = {}  # f(u,v) - przepływ na krawędzi (u,v)
+        if history not in self.TRYBY_HISTORII:
+            raise ValueError(f"Nieznany tryb historii: {history} (dostępne: {', '.join(self.TRYBY_HISTORII)})")
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval musi być >= 1")
+        
+        # Obliczenia działają na zwartej reprezentacji CSR; graf networkx
+        # i słownik przepływów powstają dopiero przy odczycie
+        self.siec = graph if isinstance(graph, SiecCSR) else SiecCSR.z_grafu(graph)
+        self._original_graph = None
+        self._flow_dict = None
+        self._rezydualna = None  # przepustowości rezydualne łuków podczas obliczeń
+        self._rezydualna_np = None  # kopia _rezydualna w NumPy dla BFS 'wektorowy'
+        self._przeplyw_aktualny = True  # czy siec.przeplyw odpowiada _rezydualna
         self.max_flow_value = 0
+        self.history = history
+        self.checkpoint_interval = checkpoint_interval
         self.iterations = []  # Historia iteracji dla wizualizacji
+        self.liczba_iteracji = 0  # Liczba powiększeń niezależnie od trybu historii
+        self.odwiedzone_wierzcholki = 0  # Wierzchołki odwiedzone przez wszystkie przeszukiwania BFS
+        self._punkty_kontrolne = {}  # iteracja -> przepływy krawędzi w kolejności krawędzi sieci
+        self._sciezki_w_historii = True  # czy silnik zapisuje ścieżki (push-relabel - nie)
+        self.dziennik = Dziennik(verbosity, sink)
+        self.fazy_skalowania = []  # Fazy trybu 'capacity-scaling': delta i liczba powiększeń
+        self._konce = ('s', 't')  # źródło i ujście ostatnich obliczeń (do naprawy przepływu po zmianach)
+        self._osiagalne = None  # (s, odwiedzone) z ostatniego nieudanego BFS - strona źródła przekroju
+        self.statystyki = Statystyki()  # czasy faz i liczniki operacji ostatnich obliczeń
+        self._obserwatorzy: List[Callable[[Dict], None]] = []
+    
+    def dodaj_obserwatora(self, obserwator: Callable[[Dict], None]) -> Callable[[Dict], None]:
+        """
+        Rejestruje funkcję wywoływaną dla zdarzeń obliczeń (można użyć jako dekoratora).
         
-        # Inicjalizuj przepływy na 0
-        for u, v in self.original_graph.edges():
-            self.flow[(u, v)] = 0
+        Obserwator dostaje słownik z kluczem 'zdarzenie':
+            'powiekszenie' - po każdej ścieżce: iteration, arcs, bottleneck
+            'faza' - początek fazy Dinica lub skalowania: faza albo delta
+            'globalne-przeetykietowanie' - w push-relabel: numer
+        oraz 'statystyki' (bieżący obiekt Statystyki). Bez obserwatorów
+        zdarzenia nie są tworzone.
+        """
+        self._obserwatorzy.append(obserwator)
+        return obserwator
+    
+    def usun_obserwatora(self, obserwator: Callable[[Dict], None]):
+        """Wyrejestrowuje obserwatora dodanego przez dodaj_obserwatora."""
+        self._obserwatorzy.remove(obserwator)
+    
+    def _powiadom(self, zdarzenie: str, **dane):
+        dane['zdarzenie'] = zdarzenie
+        dane['statystyki'] = self.statystyki
+        for obserwator in self._obserwatorzy:
+            obserwator(dane)
+    
+    @property
+    def original_graph(self) -> 'nx.DiGraph':
+        """Graf networkx sieci (odtwarzany z CSR przy pierwszym użyciu)."""
+        if self._original_graph is None:
+            self._original_graph = self.siec.do_grafu()
+        return self._original_graph
+    
+    @property
+    def flow(self) -> Dict[Tuple[str, str], int]:
+        """f(u,v) - przepływ na krawędzi (u,v); słownik budowany z tablic przy pierwszym odczycie."""
+        if self._flow_dict is None:
+            self._synchronizuj_przeplyw()
+            self._flow_dict = self.siec.slownik_przeplywu()
+        return self._flow_dict
+    
+    @flow.setter
+    def flow(self, przeplyw: Dict[Tuple[str, str], int]):
+        self.siec.przeplyw = np.array([przeplyw.get(e, 0) for e in self.siec.nazwy_krawedzi()],
+                                      dtype=self.siec.przepustowosci.dtype)
+        self._rezydualna = None
+        self._przeplyw_aktualny = True
+        self._flow_dict = None
+    
+    def _synchronizuj_przeplyw(self):
+        """Przepisuje przepływ z przepustowości rezydualnych do tablicy siec.przeplyw."""
+        if not self._przeplyw_aktualny:
+            self.siec.ustaw_przeplyw_z_rezydualnej(self._rezydualna)
+            self._przeplyw_aktualny = True
+    
+    def _ustaw_przeplyw_poczatkowy(self, source: str, sink: str, start: str):
+        """Zastępuje bieżący przepływ zerowym ('zero') albo zachłannym warstwowym ('warstwowy')."""
+        siec = self.siec
+        if start == 'zero':
+            siec.przeplyw = np.zeros(siec.m, dtype=siec.przepustowosci.dtype)
+        else:
+            siec.przeplyw = przeplyw_warstwowy(siec, source, sink)
+        self._rezydualna = None
+        self._przeplyw_aktualny = True
+        self._flow_dict = None
+        self._osiagalne = None
+        self._wyczysc_historie()
     
-    def znajdz_maksymalny_przeplyw(self, source: str = 's', sink: str = 't') -> int:
+    def _po_zmianie_przeplywu(self):
+        """Unieważnia słownik przepływów, tablicę siec.przeplyw i zapamiętaną stronę źródła."""
+        self._przeplyw_aktualny = False
+        self._flow_dict = None
+        self._osiagalne = None
+    
+    def znajdz_maksymalny_przeplyw(self, source: str = 's', sink: str = 't',
+                                   algorithm: Optional[str] = None, bfs: Optional[str] = None,
+                                   start: Optional[str] = None) -> int:
         """
-        Znajduje maksymalny przepływ używając algorytmu Edmondsa-Karpa.
+        Znajduje maksymalny przepływ wybranym algorytmem.
         
         Args:
             source: Wierzchołek źródłowy
             sink: Wierzchołek ujściowy
+            algorithm: Jeden z ALGORYTMY (domyślnie domyslny_algorytm klasy);
+                'capacity-scaling' powiększa najpierw wzdłuż ścieżek o dużej
+                przepustowości rezydualnej, 'push-relabel' wybiera wierzchołek
+                o najwyższej etykiecie, 'push-relabel-fifo' przetwarza aktywne
+                wierzchołki w kolejce FIFO
+            bfs: Jeden z TRYBY_BFS (domyślnie domyslny_bfs) - wyszukiwanie ścieżek
+                w edmonds-karp i capacity-scaling; 'dwukierunkowy' przeszukuje
+                jednocześnie od źródła i (łukami odwrotnymi) od ujścia, zawsze
+                rozszerzając mniejszy front, i kończy przy ich spotkaniu - ścieżka
+                nadal jest najkrótsza; 'wektorowy' przetwarza cały poziom BFS
+                naraz operacjami NumPy (dla szerokich warstw)
+            start: Jeden z TRYBY_STARTU (domyślnie domyslny_start): 'biezacy'
+                kontynuuje od bieżącego przepływu, 'zero' zaczyna od zera,
+                a 'warstwowy' od zachłannego przepływu wyznaczonego warstwami
+                sieci (przeplyw_warstwowy) - silnik szuka tylko reszty
             
         Returns:
             Wartość maksymalnego przepływu
         """
-        print(f"Rozpoczynam algorytm Edmondsa-Karpa...")
-        print(f"Źródło: {source}, Ujście: {sink}")
+        algorithm = algorithm or self.domyslny_algorytm
+        if algorithm not in self.ALGORYTMY:
+            raise ValueError(f"Nieznany algorytm: {algorithm} (dostępne: {', '.join(self.ALGORYTMY)})")
+        bfs = bfs or self.domyslny_bfs
+        if bfs not in self.TRYBY_BFS:
+            raise ValueError(f"Nieznany tryb BFS: {bfs} (dostępne: {', '.join(self.TRYBY_BFS)})")
+        start = start or self.domyslny_start
+        if start not in self.TRYBY_STARTU:
+            raise ValueError(f"Nieznany tryb startu: {start} (dostępne: {', '.join(self.TRYBY_STARTU)})")
+        self._znajdz_sciezke = {'jednokierunkowy': self._znajdz_sciezke_bfs,
+                                'dwukierunkowy': self._znajdz_sciezke_dwukierunkowo,
+                                'wektorowy': self._znajdz_sciezke_wektorowo}[bfs]
+        
+        statystyki = self.statystyki = Statystyki(algorithm)
+        self._sciezki_w_historii = not algorithm.startswith('push-relabel')
+        poczatek = perf_counter()
+        if start != 'biezacy':
+            self._ustaw_przeplyw_poczatkowy(source, sink, start)
+        statystyki.czas_startu = perf_counter() - poczatek
+        
+        # Sieć rezydualna budowana jest raz i aktualizowana w miejscu; obliczenia
+        # startują od bieżącego przepływu (np. po zmianach sieci - ciepły start)
+        self._konce = (source, sink)
+        start_budowy = perf_counter()
+        self._inicjalizuj_siec_rezydualna()
+        statystyki.czas_budowy = perf_counter() - start_budowy
+        statystyki.wartosc_startowa = self._oblicz_wartosc_przeplywu(source)
+        if start == 'warstwowy':
+            self.dziennik(PODSUMOWANIE, f"Przepływ początkowy (warstwowy): {statystyki.wartosc_startowa}")
+        
+        # Punkt wyjścia do odtwarzania przepływu z historii przyrostowej
+        if self.history in ('delta', 'checkpoints'):
+            self._zapisz_punkt_kontrolny()
         
-        iteration = 0
+        if algorithm == 'dinic':
+            self.dziennik(PODSUMOWANIE, "Rozpoczynam algorytm Dinica...")
+            self.dziennik(PODSUMOWANIE, f"Źródło: {source}, Ujście: {sink}")
+            self._dinic(source, sink)
+        elif algorithm.startswith('push-relabel'):
+            wybor = 'fifo' if algorithm == 'push-relabel-fifo' else 'highest'
+            self.dziennik(PODSUMOWANIE, f"Rozpoczynam algorytm push-relabel (wybór: {wybor})...")
+            self.dziennik(PODSUMOWANIE, f"Źródło: {source}, Ujście: {sink}")
+            self._push_relabel(source, sink, wybor)
+        elif algorithm == 'capacity-scaling':
+            self.dziennik(PODSUMOWANIE, "Rozpoczynam algorytm Edmondsa-Karpa ze skalowaniem przepustowości...")
+            self.dziennik(PODSUMOWANIE, f"Źródło: {source}, Ujście: {sink}")
+            self._skalowanie_przepustowosci(source, sink)
+        else:
+            self.dziennik(PODSUMOWANIE, "Rozpoczynam algorytm Edmondsa-Karpa...")
+            self.dziennik(PODSUMOWANIE, f"Źródło: {source}, Ujście: {sink}")
+            self._edmonds_karp(source, sink)
+        
+        koniec_obliczen = perf_counter()
+        self.max_flow_value = self._oblicz_wartosc_przeplywu(source)
+        koniec = perf_counter()
+        statystyki.czas_wartosci = koniec - koniec_obliczen
+        statystyki.czas_calkowity = koniec - poczatek
+        self.dziennik(PODSUMOWANIE, f"\nMaksymalny przepływ: {self.max_flow_value}")
+        
+        return self.max_flow_value
+    
+    def _edmonds_karp(self, source: str, sink: str):
+        """Powiększa przepływ wzdłuż najkrótszych ścieżek znajdowanych przez BFS."""
+        iteracje = self.dziennik.wlaczony(ITERACJE)
         
         while True:
-            iteration += 1
-            print(f"\n--- Iteracja {iteration} ---")
-            
-            # Krok 1: Zbuduj sieć rezydualną
-            residual_graph = self._zbuduj_siec_rezydualna()
+            if iteracje:
+                self.dziennik(ITERACJE, f"\n--- Iteracja {self.liczba_iteracji + 1} ---")
             
-            # Krok 2: Znajdź ścieżkę powiększającą używając BFS
-            path, bottleneck = self._znajdz_sciezke_bfs(residual_graph, source, sink)
+            # Krok 1: Znajdź ścieżkę powiększającą używając BFS
+            start = perf_counter()
+            path_arcs, bottleneck = self._znajdz_sciezke(source, sink)
+            self.statystyki.czas_bfs += perf_counter() - start
             
-            if path is None:
-                print("Brak ścieżki powiększającej - algorytm zakończony")
+            if path_arcs is None:
+                self.dziennik(ITERACJE, "Brak ścieżki powiększającej - algorytm zakończony")
                 break
             
-            print(f"Znaleziona ścieżka: {' -> '.join(path)}")
-            print(f"Przepustowość rezydualna ścieżki: {bottleneck}")
+            # Krok 2: Powiększ przepływ wzdłuż ścieżki i zapisz iterację
+            self._powieksz_i_zapisz(source, path_arcs, bottleneck)
+    
+    def _skalowanie_przepustowosci(self, source: str, sink: str):
+        """
+        Edmonds-Karp ze skalowaniem przepustowości: w fazie z progiem delta
+        rozważane są tylko łuki o przepustowości rezydualnej >= delta, a po
+        wyczerpaniu takich ścieżek delta jest połowiona. Każda faza wykonuje
+        O(E) powiększeń, więc ich łączna liczba rośnie z log(U), a nie z U.
+        """
+        self.fazy_skalowania = []
+        max_capacity = max(self._rezydualna, default=0)
+        if max_capacity <= 0:
+            return
+        
+        # Największa potęga dwójki nie większa od maksymalnej przepustowości;
+        # przy przepustowościach poniżej 1 zostaje jedna faza - zwykły Edmonds-Karp
+        # (2 ** floor(log2(U)) liczone na liczbach całkowitych, dokładnie także dla dużych U)
+        delta = 1 << (int(max_capacity).bit_length() - 1) if max_capacity >= 1 else 1
+        calkowite = self.siec.przepustowosci.dtype.kind != 'f'
+        
+        while delta >= 1:
+            self.dziennik(ITERACJE, f"\n=== Faza delta={delta} ===")
+            if self._obserwatorzy:
+                self._powiadom('faza', delta=delta)
+            powiekszenia = 0
             
-            # Krok 3: Powiększ przepływ wzdłuż ścieżki
-            self._powieksz_przeplyw(path, bottleneck)
+            # Łuki o przepustowości >= delta to łuki > prog, gdzie prog jest największą
+            # liczbą mniejszą od delta; ostatnia faza (delta = 1) to zwykły Edmonds-Karp
+            # z progiem 0, który dla przepustowości ułamkowych kończy obliczenia
+            if delta == 1:
+                prog = 0
+            else:
+                prog = delta - 1 if calkowite else math.nextafter(delta, 0)
+            while True:
+                start = perf_counter()
+                path_arcs, bottleneck = self._znajdz_sciezke(source, sink, prog=prog)
+                self.statystyki.czas_bfs += perf_counter() - start
+                if path_arcs is None:
+                    break
+                self._powieksz_i_zapisz(source, path_arcs, bottleneck, naglowek=True)
+                powiekszenia += 1
             
-            # Zapisz iterację do historii
+            self.fazy_skalowania.append({'delta': delta, 'augmentations': powiekszenia})
+            delta //= 2
+        
+        self.dziennik(PODSUMOWANIE, f"\nLiczba faz skalowania: {len(self.fazy_skalowania)}")
+        for faza in self.fazy_skalowania:
+            self.dziennik(PODSUMOWANIE, f"  delta={faza['delta']}: {faza['augmentations']} powiększeń")
+    
+    def _dinic(self, source: str, sink: str):
+        """
+        Algorytm Dinica: w każdej fazie BFS wyznacza graf poziomów, a DFS
+        z wskaźnikami bieżącego łuku znajduje w nim przepływ blokujący.
+        """
+        if source not in self._indeks or sink not in self._indeks:
+            return
+        
+        s, t = self._indeks[source], self._indeks[sink]
+        statystyki = self.statystyki
+        faza = 0
+        
+        while True:
+            start = perf_counter()
+            poziom = self._oblicz_poziomy(s, t)
+            statystyki.czas_bfs += perf_counter() - start
+            if poziom[t] < 0:
+                self._osiagalne = (s, poziom)  # pełny BFS bez ujścia - strona źródła przekroju
+                self.dziennik(ITERACJE, "\nUjście nieosiągalne w sieci rezydualnej - algorytm zakończony")
+                break
+            
+            faza += 1
+            self.dziennik(ITERACJE, f"\n=== Faza {faza} (odległość s-t: {poziom[t]}) ===")
+            if self._obserwatorzy:
+                self._powiadom('faza', faza=faza)
+            
+            # Wskaźnik bieżącego łuku - łuki przed nim są już wyczerpane w tej fazie
+            biezacy = list(self._poczatki[:-1])
+            while True:
+                start = perf_counter()
+                path_arcs, bottleneck = self._znajdz_sciezke_dfs(s, t, poziom, biezacy)
+                statystyki.czas_bfs += perf_counter() - start
+                if path_arcs is None:
+                    break
+                self._powieksz_i_zapisz(source, path_arcs, bottleneck, naglowek=True)
+    
+    def _powieksz_i_zapisz(self, source: str, path_arcs: List[int], bottleneck: int,
+                           naglowek: bool = False):
+        """
+        Powiększa przepływ wzdłuż ścieżki i zapisuje iterację do historii.
+        
+        Komunikaty (i liczenie bieżącej wartości przepływu, które kosztuje O(E))
+        powstają tylko wtedy, gdy dziennik zgłasza poziom ITERACJE.
+        """
+        start = perf_counter()
+        iteracje = self.dziennik.wlaczony(ITERACJE)
+        path = None
+        if iteracje:
+            path = self._sciezka_wierzcholkow(source, path_arcs)
+            if naglowek:
+                self.dziennik(ITERACJE, f"\n--- Iteracja {self.liczba_iteracji + 1} ---")
+            self.dziennik(ITERACJE, f"Znaleziona ścieżka: {' -> '.join(map(str, path))}")
+            self.dziennik(ITERACJE, f"Przepustowość rezydualna ścieżki: {bottleneck}")
+        
+        self._powieksz_przeplyw(path_arcs, bottleneck)
+        self.liczba_iteracji += 1
+        statystyki = self.statystyki
+        statystyki.sciezki += 1
+        w_przod = self._w_przod
+        statystyki.cofniecia += sum(1 for arc in path_arcs if not w_przod[arc])
+        
+        # Zapisz iterację do historii
+        if self.history != 'off' and path is None:
+            path = self._sciezka_wierzcholkow(source, path_arcs)
+        if self.history == 'full':
             self.iterations.append({
-                'iteration': iteration,
-                'path': path.copy(),
+                'iteration': self.liczba_iteracji,
+                'path': path,
+                'arcs': path_arcs,
                 'bottleneck': bottleneck,
-                'flow': self.flow.copy()
+                'flow': dict(zip(self.siec.nazwy_krawedzi(), self._przeplyw_krawedzi()))
             })
-            
-            # Oblicz aktualną wartość przepływu
+        elif self.history != 'off':
+            # Delta: przepływ zmienia się tylko na łukach ścieżki o bottleneck
+            self.iterations.append({
+                'iteration': self.liczba_iteracji,
+                'path': path,
+                'arcs': path_arcs,
+                'bottleneck': bottleneck
+            })
+            if self.history == 'checkpoints' and self.liczba_iteracji % self.checkpoint_interval == 0:
+                self._zapisz_punkt_kontrolny()
+        
+        # Oblicz aktualną wartość przepływu
+        if iteracje:
             current_flow = self._oblicz_wartosc_przeplywu(source)
-            print(f"Aktualna wartość przepływu: {current_flow}")
+            self.dziennik(ITERACJE, f"Aktualna wartość przepływu: {current_flow}")
         
-        self.max_flow_value = self._oblicz_wartosc_przeplywu(source)
-        print(f"\nMaksymalny przepływ: {self.max_flow_value}")
+        statystyki.czas_powiekszania += perf_counter() - start
+        if self._obserwatorzy:
+            self._powiadom('powiekszenie', iteration=self.liczba_iteracji, arcs=path_arcs, bottleneck=bottleneck)
+    
+    def _zapisz_punkt_kontrolny(self):
+        """Zapisuje przepływy wszystkich krawędzi po bieżącej iteracji."""
+        self._punkty_kontrolne[self.liczba_iteracji] = self._przeplyw_krawedzi()
+    
+    def _przeplyw_krawedzi(self) -> List[int]:
+        """Bieżący przepływ krawędzi (w kolejności krawędzi sieci) odczytany z łuków wstecznych."""
+        rezydualna = self._rezydualna
+        return [rezydualna[arc] for arc in self._luk_tyl]
+    
+    def przeplyw_w_iteracji(self, k: int) -> Dict[Tuple[str, str], int]:
+        """
+        Odtwarza przepływ po k-tej iteracji (k=0 to przepływ początkowy).
         
-        return self.max_flow_value
+        W trybach 'delta' i 'checkpoints' startuje od najbliższego punktu
+        kontrolnego nie późniejszego niż k i nakłada zapisane ścieżki.
+        
+        Returns:
+            Słownik (u, v) -> przepływ
+            
+        Raises:
+            ValueError: Gdy historia jest wyłączona, silnik nie zapisuje ścieżek
+                (push-relabel) albo k jest spoza zakresu
+        """
+        if self.history == 'off':
+            raise ValueError("Historia iteracji jest wyłączona (history='off')")
+        if not self._sciezki_w_historii:
+            raise ValueError(f"Silnik {self.statystyki.algorithm} nie zapisuje historii ścieżek")
+        if not 0 <= k <= self.liczba_iteracji:
+            raise ValueError(f"Iteracja {k} poza zakresem 0..{self.liczba_iteracji}")
+        if k == self.liczba_iteracji:
+            return self.flow.copy()
+        
+        if self.history == 'full':
+            if k > 0:
+                return self.iterations[k - 1]['flow'].copy()
+            # Przepływ początkowy: przepływ po 1. iteracji z cofniętą ścieżką
+            przeplywy = [self.iterations[0]['flow'][e] for e in self.siec.nazwy_krawedzi()]
+            zapisy, znak = self.iterations[:1], -1
+        else:
+            start = max(i for i in self._punkty_kontrolne if i <= k)
+            przeplywy = list(self._punkty_kontrolne[start])
+            zapisy = self.iterations[start:k]
+            znak = 1
+        
+        for zapis in zapisy:
+            for arc in zapis['arcs']:
+                # Łuk w przód zwiększa przepływ swojej krawędzi, łuk wsteczny go cofa
+                zmiana = zapis['bottleneck'] if self._w_przod[arc] else -zapis['bottleneck']
+                przeplywy[self._krawedz_luku[arc]] += znak * zmiana
+        
+        return dict(zip(self.siec.nazwy_krawedzi(), przeplywy))
     
-    def _zbuduj_siec_rezydualna(self) -> nx.DiGraph:
+    def _zbuduj_siec_rezydualna(self) -> 'nx.DiGraph':
         """Buduje sieć rezydualną na podstawie aktualnego przepływu."""
+        import networkx as nx
         residual = nx.DiGraph()
         
         # Dodaj wszystkie wierzchołki
@@ -111,82 +487,916 @@ class FordFulkerson:
         
         return residual
     
-    def _znajdz_sciezke_bfs(self, residual_graph: nx.DiGraph, source: str, sink: str) -> Tuple[Optional[List[str]], int]:
+    def _inicjalizuj_siec_rezydualna(self):
+        """
+        Przygotowuje sieć rezydualną z tablic CSR na czas obliczeń.
+        
+        Łuki wierzchołka v to zakres poczatki[v]:poczatki[v + 1], a łuk
+        przeciwny do a to odwrotny[a]; przepływ krawędzi e jest równy
+        przepustowości rezydualnej jej łuku wstecznego. Gorące pętle
+        silników używają list Pythona, bo odczyt pojedynczych elementów
+        tablic NumPy jest kilkukrotnie wolniejszy.
+        
+        Dla sieci odwzorowanej z pliku (format_binarny) tablice nie są
+        kopiowane do list - silniki czytają je przez memoryview wprost
+        z odwzorowanego bufora (wolniej, ale bez kopii w pamięci procesu).
+        """
+        siec = self.siec
+        self._synchronizuj_przeplyw()
+        widok = memoryview if siec.zmapowana else np.ndarray.tolist
+        
+        self._wezly = siec.wezly
+        self._indeks = siec.indeks
+        self._poczatki = widok(siec.poczatki)
+        self._glowa = widok(siec.glowy)          # wierzchołek docelowy łuku
+        self._odwrotny = widok(siec.odwrotny)    # łuk przeciwny
+        self._krawedz_luku = widok(siec.krawedz_luku)
+        self._w_przod = widok(siec.w_przod)
+        self._luk_tyl = widok(siec.luk_tyl)
+        self._rezydualna = widok(siec.rezydualna())  # przepustowość rezydualna łuku
+        self._rezydualna_np = None
+        self._osiagalne = None
+    
+    def _nazwa_krawedzi(self, e: int) -> Tuple[str, str]:
+        """Zwraca krawędź e jako parę nazw wierzchołków."""
+        return self._wezly[int(self.siec.zrodla[e])], self._wezly[int(self.siec.cele[e])]
+    
+    def _znajdz_sciezke_bfs(self, source: str, sink: str,
+                            prog: int = 0) -> Tuple[Optional[List[int]], int]:
         """
         Znajduje najkrótszą ścieżkę powiększającą używając BFS.
         
+        Args:
+            source: Wierzchołek źródłowy
+            sink: Wierzchołek ujściowy
+            prog: Rozważane są tylko łuki o przepustowości rezydualnej > prog
+            
         Returns:
-            Tuple (ścieżka, przepustowość_rezydualna_ścieżki) lub (None, 0)
+            Tuple (łuki_ścieżki, przepustowość_rezydualna_ścieżki) lub (None, 0)
         """
-        if source not in residual_graph or sink not in residual_graph:
+        if source not in self._indeks or sink not in self._indeks:
             return None, 0
         
-        # BFS
-        queue = deque([source])
-        visited = {source}
-        parent = {source: None}
+        s, t = self._indeks[source], self._indeks[sink]
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwrotny = self._odwrotny
+        
+        # BFS - parent_arc[v] to łuk, którym dotarto do v
+        queue = deque([s])
+        parent_arc = {s: None}
+        luki = 0
         
         while queue:
             current = queue.popleft()
             
-            if current == sink:
+            if current == t:
                 # Znaleziono ścieżkę - rekonstruuj ją
-                path = []
-                node = sink
-                while node is not None:
-                    path.append(node)
-                    node = parent[node]
-                path.reverse()
+                path_arcs = []
+                arc = parent_arc[t]
+                while arc is not None:
+                    path_arcs.append(arc)
+                    arc = parent_arc[glowa[odwrotny[arc]]]
+                path_arcs.reverse()
                 
                 # Oblicz przepustowość rezydualną ścieżki (bottleneck)
-                bottleneck = float('inf')
-                for i in range(len(path) - 1):
-                    u, v = path[i], path[i + 1]
-                    edge_capacity = residual_graph[u][v]['capacity']
-                    bottleneck = min(bottleneck, edge_capacity)
+                bottleneck = min(rezydualna[arc] for arc in path_arcs)
                 
-                return path, bottleneck
+                self._policz_bfs(len(parent_arc), len(parent_arc) - len(queue), luki)
+                return path_arcs, bottleneck
             
-            # Sprawdź wszystkich sąsiadów
-            for neighbor in residual_graph.neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    parent[neighbor] = current
+            # Sprawdź wszystkie łuki o przepustowości rezydualnej powyżej progu
+            poczatek, koniec = poczatki[current], poczatki[current + 1]
+            luki += koniec - poczatek
+            for arc in range(poczatek, koniec):
+                neighbor = glowa[arc]
+                if rezydualna[arc] > prog and neighbor not in parent_arc:
+                    parent_arc[neighbor] = arc
                     queue.append(neighbor)
         
+        self._policz_bfs(len(parent_arc), len(parent_arc), luki)
+        if prog == 0:
+            # Odwiedzone wierzchołki to strona źródła minimalnego przekroju (dla minimalny_przekroj)
+            self._osiagalne = (s, parent_arc)
         return None, 0
     
-    def _powieksz_przeplyw(self, path: List[str], bottleneck: int):
-        """Powiększa przepływ wzdłuż znalezionej ścieżki."""
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i + 1]
+    def _znajdz_sciezke_dwukierunkowo(self, source: str, sink: str,
+                                      prog: int = 0) -> Tuple[Optional[List[int]], int]:
+        """
+        Znajduje najkrótszą ścieżkę powiększającą BFS-em dwukierunkowym.
+        
+        Jeden front rośnie od źródła łukami rezydualnymi, drugi od ujścia
+        łukami odwrotnymi (x -> v, gdy łuk x -> v ma przepustowość > prog).
+        Rozszerzany jest zawsze cały poziom mniejszego frontu. Przy pierwszym
+        spotkaniu oba fronty są pełnymi poziomami d_s i d_t, więc każde
+        spotkanie daje ścieżkę długości d_s + d_t + 1, a krótszej nie ma
+        (zostałaby znaleziona w poprzednim poziomie) - ograniczenia
+        Edmondsa-Karpa pozostają w mocy.
+        
+        Args i Returns jak w _znajdz_sciezke_bfs.
+        """
+        if source not in self._indeks or sink not in self._indeks:
+            return None, 0
+        
+        s, t = self._indeks[source], self._indeks[sink]
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwrotny = self._odwrotny
+        
+        # przod[v] - łuk, którym dotarto do v od źródła; tyl[v] - łuk z v w stronę ujścia
+        przod, tyl = {s: None}, {t: None}
+        front_przod, front_tyl = [s], [t]
+        zdjete = luki = 0
+        spotkanie = None  # (łuk u -> w, u z frontu źródła, w z frontu ujścia)
+        
+        while spotkanie is None and front_przod and front_tyl:
+            nastepny = []
+            if len(front_przod) <= len(front_tyl):
+                for current in front_przod:
+                    zdjete += 1
+                    poczatek, koniec = poczatki[current], poczatki[current + 1]
+                    luki += koniec - poczatek
+                    for arc in range(poczatek, koniec):
+                        if rezydualna[arc] > prog:
+                            neighbor = glowa[arc]
+                            if neighbor in tyl:
+                                spotkanie = arc
+                                break
+                            if neighbor not in przod:
+                                przod[neighbor] = arc
+                                nastepny.append(neighbor)
+                    if spotkanie is not None:
+                        break
+                front_przod = nastepny
+            else:
+                for current in front_tyl:
+                    zdjete += 1
+                    poczatek, koniec = poczatki[current], poczatki[current + 1]
+                    luki += koniec - poczatek
+                    for arc in range(poczatek, koniec):
+                        wstecz = odwrotny[arc]  # łuk neighbor -> current
+                        if rezydualna[wstecz] > prog:
+                            neighbor = glowa[arc]
+                            if neighbor in przod:
+                                spotkanie = wstecz
+                                break
+                            if neighbor not in tyl:
+                                tyl[neighbor] = wstecz
+                                nastepny.append(neighbor)
+                    if spotkanie is not None:
+                        break
+                front_tyl = nastepny
+        
+        self._policz_bfs(len(przod) + len(tyl), zdjete, luki)
+        if spotkanie is None:
+            if prog == 0:
+                # Wyczerpany front źródła to strona źródła minimalnego przekroju; przy
+                # wyczerpanym froncie ujścia minimalny_przekroj policzy ją sam
+                self._osiagalne = None if front_przod else (s, przod)
+            return None, 0
+        
+        # Ścieżka: s ... u (łuki przod), łuk spotkania u -> w, w ... t (łuki tyl)
+        path_arcs = []
+        arc = przod[glowa[odwrotny[spotkanie]]]
+        while arc is not None:
+            path_arcs.append(arc)
+            arc = przod[glowa[odwrotny[arc]]]
+        path_arcs.reverse()
+        path_arcs.append(spotkanie)
+        arc = tyl[glowa[spotkanie]]
+        while arc is not None:
+            path_arcs.append(arc)
+            arc = tyl[glowa[arc]]
+        
+        bottleneck = min(rezydualna[arc] for arc in path_arcs)
+        return path_arcs, bottleneck
+    
+    def _znajdz_sciezke_wektorowo(self, source: str, sink: str,
+                                  prog: int = 0) -> Tuple[Optional[List[int]], int]:
+        """
+        Znajduje najkrótszą ścieżkę powiększającą BFS-em poziomami w NumPy.
+        
+        Łuki wszystkich wierzchołków granicy są zbierane z zakresów CSR
+        w jeden wektor, odfiltrowywane maską (przepustowość rezydualna > prog,
+        koniec nieodwiedzony), a łuki rodziców nowych wierzchołków są
+        ustawiane hurtowo. Koszt Pythona jest na poziom, nie na wierzchołek,
+        co opłaca się w szerokich sieciach warstwowych. Przepustowości
+        rezydualne są czytane z kopii _rezydualna_np, którą _powieksz_przeplyw
+        aktualizuje razem z listą.
+        
+        Args i Returns jak w _znajdz_sciezke_bfs.
+        """
+        if source not in self._indeks or sink not in self._indeks:
+            return None, 0
+        
+        siec = self.siec
+        if self._rezydualna_np is None:
+            self._rezydualna_np = np.array(self._rezydualna)
+        rezydualna = self._rezydualna_np
+        poczatki, glowy = np.asarray(siec.poczatki), np.asarray(siec.glowy)
+        
+        s, t = self._indeks[source], self._indeks[sink]
+        poziom = np.full(len(self._wezly), -1, dtype=np.int64)
+        luk_rodzica = np.empty(len(self._wezly), dtype=np.int64)
+        poziom[s] = 0
+        granica = np.array([s], dtype=np.int64)
+        glebokosc, odwiedzone, zdjete, przejrzane = 0, 1, 0, 0
+        
+        while len(granica) and poziom[t] < 0:
+            starty = poczatki[granica]
+            liczby = poczatki[granica + 1] - starty
+            luki = np.arange(liczby.sum()) - np.repeat(np.cumsum(liczby) - liczby - starty, liczby)
+            zdjete += len(granica)
+            przejrzane += len(luki)
+            
+            luki = luki[rezydualna[luki] > prog]
+            cele = glowy[luki]
+            nowe = poziom[cele] < 0
+            # Pierwszy łuk do każdego nowego wierzchołka zostaje łukiem rodzica
+            granica, pierwsze = np.unique(cele[nowe], return_index=True)
+            luk_rodzica[granica] = luki[nowe][pierwsze]
+            glebokosc += 1
+            poziom[granica] = glebokosc
+            odwiedzone += len(granica)
+        
+        self._policz_bfs(odwiedzone, zdjete, przejrzane)
+        if poziom[t] < 0:
+            if prog == 0:
+                # Odwiedzone wierzchołki to strona źródła minimalnego przekroju
+                self._osiagalne = (s, poziom)
+            return None, 0
+        
+        path_arcs = []
+        glowa, odwrotny = self._glowa, self._odwrotny
+        v = t
+        while v != s:
+            arc = int(luk_rodzica[v])
+            path_arcs.append(arc)
+            v = glowa[odwrotny[arc]]
+        path_arcs.reverse()
+        
+        bottleneck = rezydualna[path_arcs].min().item()
+        return path_arcs, bottleneck
+    
+    def _policz_bfs(self, odwiedzone: int, zdjete: int, luki: int):
+        """Dopisuje liczniki jednego przeszukania (raz na BFS, nie na wierzchołek)."""
+        self.odwiedzone_wierzcholki += odwiedzone
+        self.statystyki.zdjete_z_kolejki += zdjete
+        self.statystyki.przejrzane_luki += luki
+    
+    def _oblicz_poziomy(self, s: int, t: int) -> List[int]:
+        """Wyznacza odległości BFS od s w sieci rezydualnej (-1 dla nieosiągalnych)."""
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        poziom = [-1] * len(self._wezly)
+        poziom[s] = 0
+        queue = deque([s])
+        odwiedzone = 1
+        luki = 0
+        
+        while queue:
+            current = queue.popleft()
+            # Wierzchołki dalsze od s niż ujście nie leżą na najkrótszych ścieżkach
+            if current == t:
+                break
+            poczatek, koniec = poczatki[current], poczatki[current + 1]
+            luki += koniec - poczatek
+            for arc in range(poczatek, koniec):
+                neighbor = glowa[arc]
+                if rezydualna[arc] > 0 and poziom[neighbor] < 0:
+                    poziom[neighbor] = poziom[current] + 1
+                    queue.append(neighbor)
+                    odwiedzone += 1
+        
+        self._policz_bfs(odwiedzone, odwiedzone - len(queue), luki)
+        return poziom
+    
+    def _znajdz_sciezke_dfs(self, s: int, t: int, poziom: List[int],
+                            biezacy: List[int]) -> Tuple[Optional[List[int]], int]:
+        """
+        Znajduje ścieżkę s-t w grafie poziomów (iteracyjny DFS).
+        
+        biezacy[v] to pierwszy niesprawdzony łuk wierzchołka v. Łuki nasycone
+        lub prowadzące w ślepy zaułek są pomijane na stałe przez przesunięcie
+        tego wskaźnika, więc cała faza wykonuje O(VE) kroków niezależnie od
+        liczby znalezionych ścieżek.
+        
+        Returns:
+            Tuple (łuki_ścieżki, przepustowość_rezydualna_ścieżki) lub (None, 0)
+        """
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwrotny = self._odwrotny
+        path_arcs = []
+        v = s
+        luki = 0
+        
+        while v != t:
+            arc = biezacy[v]
+            koniec = poczatki[v + 1]
+            luki -= arc
+            while arc < koniec:
+                if rezydualna[arc] > 0 and poziom[glowa[arc]] == poziom[v] + 1:
+                    break
+                arc += 1
+            biezacy[v] = arc
+            luki += arc
             
-            # Sprawdź czy krawędź (u,v) istnieje w oryginalnym grafie
-            if self.original_graph.has_edge(u, v):
-                # Krawędź w kierunku oryginalnym - zwiększ przepływ
-                self.flow[(u, v)] = self.flow.get((u, v), 0) + bottleneck
-                print(f"  Zwiększam przepływ {u} -> {v} o {bottleneck}")
+            if arc < koniec:
+                # Idź dalej łukiem dopuszczalnym
+                luki += 1
+                path_arcs.append(arc)
+                v = glowa[arc]
+            elif v == s:
+                self.statystyki.przejrzane_luki += luki
+                return None, 0
             else:
-                # Krawędź przeciwna - zmniejsz przepływ na krawędzi (v,u)
-                self.flow[(v, u)] = self.flow.get((v, u), 0) - bottleneck
-                print(f"  Cofam przepływ {v} -> {u} o {bottleneck}")
+                # Ślepy zaułek - cofnij się i porzuć łuk prowadzący do v
+                poziom[v] = -1
+                arc = path_arcs.pop()
+                v = glowa[odwrotny[arc]]
+                biezacy[v] += 1
+        
+        self.statystyki.przejrzane_luki += luki
+        bottleneck = min(rezydualna[arc] for arc in path_arcs)
+        return path_arcs, bottleneck
+    
+    def _push_relabel(self, source: str, sink: str, wybor: str = 'highest'):
+        """
+        Algorytm push-relabel (przepychania i przeetykietowania).
+        
+        Aktywne wierzchołki (z nadmiarem) wybierane są według najwyższej
+        etykiety ('highest') lub w kolejności FIFO ('fifo'). Heurystyka luki
+        podnosi wierzchołki odcięte od ujścia ponad n, a co n przeetykietowań
+        wykonywane jest globalne przeetykietowanie odwrotnym BFS od ujścia.
+        Nadmiar, który nie może dotrzeć do ujścia, wraca do źródła, więc na
+        końcu powstaje poprawny przepływ.
+        """
+        if source not in self._indeks or sink not in self._indeks:
+            return
+        
+        s, t = self._indeks[source], self._indeks[sink]
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwrotny = self._odwrotny
+        n = len(self._wezly)
+        statystyki = self.statystyki
+        czas_bfs_przed = statystyki.czas_bfs
+        start = perf_counter()
+        
+        nadmiar = [0] * n
+        biezacy = list(poczatki[:-1])  # bieżący łuk wierzchołka
+        
+        # Przedprzepływ: nasyć wszystkie łuki wychodzące ze źródła
+        for arc in range(poczatki[s], poczatki[s + 1]):
+            c = rezydualna[arc]
+            if c > 0:
+                rezydualna[arc] = 0
+                rezydualna[odwrotny[arc]] += c
+                nadmiar[glowa[arc]] += c
+                nadmiar[s] -= c
+        
+        wysokosc = self._globalne_przeetykietowanie(s, t)
+        liczba = self._policz_wysokosci(wysokosc, n)
+        
+        aktywne = [v for v in range(n) if nadmiar[v] > 0 and v != s and v != t]
+        if wybor == 'fifo':
+            kolejka = deque(aktywne)
+        else:
+            kubelki = [[] for _ in range(2 * n + 1)]
+            for v in aktywne:
+                kubelki[wysokosc[v]].append(v)
+            najwyzszy = 2 * n
+        
+        pchniecia = przeetykietowania = globalne = luki_heur = 0
+        od_globalnego = 0
+        przesuniecia = luki_przeetykietowan = 0  # łuki sprawdzone przy rozładowaniach
+        
+        while True:
+            # Wybierz aktywny wierzchołek (wpisy nieaktualne są pomijane)
+            if wybor == 'fifo':
+                if not kolejka:
+                    break
+                v = kolejka.popleft()
+                if nadmiar[v] <= 0:
+                    continue
+            else:
+                while najwyzszy >= 0 and not kubelki[najwyzszy]:
+                    najwyzszy -= 1
+                if najwyzszy < 0:
+                    break
+                v = kubelki[najwyzszy].pop()
+                if nadmiar[v] <= 0 or wysokosc[v] != najwyzszy:
+                    continue
+            
+            # Rozładowanie: przepychaj nadmiar, a gdy brak łuków dopuszczalnych - przeetykietuj
+            poczatek_v, koniec_v = poczatki[v], poczatki[v + 1]
+            while nadmiar[v] > 0:
+                if biezacy[v] == koniec_v:
+                    stara = wysokosc[v]
+                    nowa = 2 * n
+                    luki_przeetykietowan += koniec_v - poczatek_v
+                    for arc in range(poczatek_v, koniec_v):
+                        if rezydualna[arc] > 0 and wysokosc[glowa[arc]] + 1 < nowa:
+                            nowa = wysokosc[glowa[arc]] + 1
+                    wysokosc[v] = nowa
+                    biezacy[v] = poczatek_v
+                    przeetykietowania += 1
+                    od_globalnego += 1
+                    
+                    if stara < n:
+                        liczba[stara] -= 1
+                    if nowa < n:
+                        liczba[nowa] += 1
+                    
+                    # Heurystyka luki: nikt nie ma etykiety 'stara', więc wierzchołki
+                    # powyżej niej nie mają już ścieżki rezydualnej do ujścia
+                    if stara < n and liczba[stara] == 0:
+                        luki_heur += 1
+                        for u in range(n):
+                            if stara < wysokosc[u] < n and u != s:
+                                liczba[wysokosc[u]] -= 1
+                                wysokosc[u] = n + 1
+                                biezacy[u] = poczatki[u]
+                                if wybor != 'fifo' and nadmiar[u] > 0 and u != v and u != t:
+                                    kubelki[n + 1].append(u)
+                                    najwyzszy = max(najwyzszy, n + 1)
+                    continue
+                
+                arc = biezacy[v]
+                w = glowa[arc]
+                if rezydualna[arc] > 0 and wysokosc[v] == wysokosc[w] + 1:
+                    delta = min(nadmiar[v], rezydualna[arc])
+                    if nadmiar[w] == 0 and w != s and w != t:
+                        if wybor == 'fifo':
+                            kolejka.append(w)
+                        else:
+                            kubelki[wysokosc[w]].append(w)
+                    rezydualna[arc] -= delta
+                    rezydualna[odwrotny[arc]] += delta
+                    nadmiar[v] -= delta
+                    nadmiar[w] += delta
+                    pchniecia += 1
+                else:
+                    biezacy[v] += 1
+                    przesuniecia += 1
+            
+            if wybor != 'fifo':
+                najwyzszy = max(najwyzszy, wysokosc[v])
+            
+            # Okresowe globalne przeetykietowanie przywraca dokładne odległości
+            if od_globalnego >= n:
+                od_globalnego = 0
+                globalne += 1
+                if self._obserwatorzy:
+                    self._powiadom('globalne-przeetykietowanie', numer=globalne)
+                wysokosc = self._globalne_przeetykietowanie(s, t)
+                liczba = self._policz_wysokosci(wysokosc, n)
+                biezacy = list(poczatki[:-1])
+                aktywne = [u for u in range(n) if nadmiar[u] > 0 and u != s and u != t]
+                if wybor == 'fifo':
+                    kolejka = deque(aktywne)
+                else:
+                    kubelki = [[] for _ in range(2 * n + 1)]
+                    for u in aktywne:
+                        kubelki[wysokosc[u]].append(u)
+                    najwyzszy = 2 * n
+        
+        self._po_zmianie_przeplywu()
+        
+        # Czas globalnych przeetykietowań jest już w czas_bfs
+        statystyki.czas_powiekszania += perf_counter() - start - (statystyki.czas_bfs - czas_bfs_przed)
+        statystyki.pchniecia += pchniecia
+        statystyki.przeetykietowania += przeetykietowania
+        statystyki.przejrzane_luki += pchniecia + przesuniecia + luki_przeetykietowan
+        
+        self.dziennik(PODSUMOWANIE, f"Przepchnięcia: {pchniecia}, przeetykietowania: {przeetykietowania}, "
+                                    f"globalne przeetykietowania: {globalne}, użycia heurystyki luki: {luki_heur}")
+    
+    def _globalne_przeetykietowanie(self, s: int, t: int) -> List[int]:
+        """
+        Wyznacza etykiety jako dokładne odległości rezydualne: do ujścia
+        (odwrotny BFS od t), a dla wierzchołków odciętych od t - n plus
+        odległość do źródła. Źródło ma zawsze etykietę n.
+        """
+        start_bfs = perf_counter()
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwrotny = self._odwrotny
+        n = len(self._wezly)
+        wysokosc = [2 * n] * n
+        zdjete = luki = 0
+        
+        for start, baza in ((t, 0), (s, n)):
+            if wysokosc[start] < 2 * n:
+                continue
+            wysokosc[start] = baza
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                zdjete += 1
+                poczatek, koniec = poczatki[current], poczatki[current + 1]
+                luki += koniec - poczatek
+                for arc in range(poczatek, koniec):
+                    # Łuk odwrotny[arc] prowadzi od sąsiada do current
+                    neighbor = glowa[arc]
+                    if rezydualna[odwrotny[arc]] > 0 and wysokosc[neighbor] == 2 * n and neighbor != s:
+                        wysokosc[neighbor] = wysokosc[current] + 1
+                        queue.append(neighbor)
+        
+        wysokosc[s] = n
+        self._policz_bfs(zdjete, zdjete, luki)
+        self.statystyki.czas_bfs += perf_counter() - start_bfs
+        return wysokosc
+    
+    @staticmethod
+    def _policz_wysokosci(wysokosc: List[int], n: int) -> List[int]:
+        """Liczy wierzchołki o każdej etykiecie mniejszej od n (dla heurystyki luki)."""
+        liczba = [0] * n
+        for h in wysokosc:
+            if h < n:
+                liczba[h] += 1
+        return liczba
+    
+    def _sciezka_wierzcholkow(self, source: str, path_arcs: List[int]) -> List[str]:
+        """Zamienia listę łuków ścieżki na listę nazw wierzchołków."""
+        return [source] + [self._wezly[self._glowa[arc]] for arc in path_arcs]
+    
+    def _powieksz_przeplyw(self, path_arcs: List[int], bottleneck: int):
+        """Powiększa przepływ wzdłuż znalezionej ścieżki, aktualizując sieć rezydualną w miejscu."""
+        rezydualna, odwrotny = self._rezydualna, self._odwrotny
+        for arc in path_arcs:
+            # Łuk w przód zwiększa przepływ krawędzi, łuk wsteczny go cofa
+            rezydualna[arc] -= bottleneck
+            rezydualna[odwrotny[arc]] += bottleneck
+        if self._rezydualna_np is not None:
+            # Łuki prostej ścieżki (i ich przeciwne) są różne - wystarczy zwykłe indeksowanie
+            luki = np.array(path_arcs, dtype=np.int64)
+            self._rezydualna_np[luki] -= bottleneck
+            self._rezydualna_np[self.siec.odwrotny[luki]] += bottleneck
+        self._po_zmianie_przeplywu()
+        
+        if self.dziennik.wlaczony(SZCZEGOLY):
+            for arc in path_arcs:
+                u, v = self._nazwa_krawedzi(self._krawedz_luku[arc])
+                if self._w_przod[arc]:
+                    self.dziennik(SZCZEGOLY, f"  Zwiększam przepływ {u} -> {v} o {bottleneck}")
+                else:
+                    self.dziennik(SZCZEGOLY, f"  Cofam przepływ {u} -> {v} o {bottleneck}")
     
     def _oblicz_wartosc_przeplywu(self, source: str) -> int:
-        """Oblicza wartość przepływu jako sumę przepływów wychodzących ze źródła."""
+        """
+        Oblicza wartość przepływu jako sumę przepływów wychodzących ze źródła
+        pomniejszoną o przepływy do niego wracające (np. nadmiar odesłany
+        z powrotem przez push-relabel).
+        """
+        if self._rezydualna is None:
+            return self.siec.wartosc_przeplywu(source)
+        
+        s = self._indeks.get(source)
+        if s is None:
+            return 0
+        
+        # Wystarczą łuki źródła: przepływ krawędzi to przepustowość jej łuku wstecznego
+        rezydualna, odwrotny = self._rezydualna, self._odwrotny
         total_flow = 0
-        for u, v in self.original_graph.edges():
-            if u == source:
-                total_flow += self.flow.get((u, v), 0)
+        for arc in range(self._poczatki[s], self._poczatki[s + 1]):
+            if self._w_przod[arc]:
+                total_flow += rezydualna[odwrotny[arc]]
+            else:
+                total_flow -= rezydualna[arc]
         return total_flow
     
+    def strona_zrodla(self, source: str = 's') -> Set[str]:
+        """
+        Zwraca wierzchołki osiągalne ze źródła w sieci rezydualnej.
+        
+        Po wyznaczeniu maksymalnego przepływu jest to strona źródła
+        minimalnego przekroju (source, sink).
+        """
+        if self._rezydualna is None:
+            self._inicjalizuj_siec_rezydualna()
+        maska = self._maska_strony_zrodla(self._indeks[source])
+        return {v for v, osiagalny in zip(self._wezly, maska.tolist()) if osiagalny}
+    
+    def _maska_strony_zrodla(self, s: int) -> np.ndarray:
+        """
+        Maska wierzchołków osiągalnych z s w sieci rezydualnej.
+        
+        Ostatni, nieudany BFS silników Edmondsa-Karpa i Dinica odwiedził
+        dokładnie te wierzchołki, więc jego wynik jest używany bez ponownego
+        przeszukiwania; w pozostałych przypadkach wykonywane jest DFS.
+        """
+        n = len(self._wezly)
+        if self._osiagalne is not None and self._osiagalne[0] == s:
+            odwiedzone = self._osiagalne[1]
+            if isinstance(odwiedzone, dict):
+                maska = np.zeros(n, dtype=bool)
+                maska[list(odwiedzone)] = True
+                return maska
+            return np.asarray(odwiedzone) >= 0
+        
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwiedzony = [False] * n
+        odwiedzony[s] = True
+        stos = [s]
+        while stos:
+            u = stos.pop()
+            for arc in range(poczatki[u], poczatki[u + 1]):
+                v = glowa[arc]
+                if rezydualna[arc] > 0 and not odwiedzony[v]:
+                    odwiedzony[v] = True
+                    stos.append(v)
+        self._osiagalne = (s, {v: None for v in range(n) if odwiedzony[v]})
+        return np.array(odwiedzony, dtype=bool)
+    
+    def minimalny_przekroj(self) -> Dict:
+        """
+        Zwraca minimalny przekrój (S, T) dla źródła i ujścia ostatnich obliczeń.
+        
+        Strona S to wierzchołki osiągalne ze źródła w sieci rezydualnej
+        maksymalnego przepływu. Przepustowość przekroju jest porównywana
+        z wartością przepływu (certyfikat optymalności: max-flow = min-cut).
+        
+        Returns:
+            Słownik: 'strona_zrodla' i 'strona_ujscia' (zbiory wierzchołków),
+            'krawedzie' (lista (u, v) krawędzi z S do T) i 'przepustowosc'
+        """
+        if self._rezydualna is None:
+            raise ValueError("Najpierw wyznacz maksymalny przepływ (znajdz_maksymalny_przeplyw)")
+        source, sink = self._konce
+        maska = self._maska_strony_zrodla(self._indeks[source])
+        if maska[self._indeks[sink]]:
+            raise ValueError("Przepływ nie jest maksymalny - ujście jest osiągalne w sieci rezydualnej "
+                             "(np. po zmianie sieci)")
+        
+        siec = self.siec
+        przekroj = maska[siec.zrodla] & ~maska[siec.cele]
+        przepustowosc = siec.przepustowosci[przekroj].sum().item()
+        wartosc = self._oblicz_wartosc_przeplywu(source)
+        if przepustowosc != wartosc:
+            raise AssertionError(f"Przepustowość przekroju {przepustowosc} różna od przepływu {wartosc}")
+        
+        nazwy = siec.nazwy_krawedzi()
+        strona = maska.tolist()
+        return {
+            'strona_zrodla': {v for v, w_s in zip(self._wezly, strona) if w_s},
+            'strona_ujscia': {v for v, w_s in zip(self._wezly, strona) if not w_s},
+            'krawedzie': [nazwy[e] for e in np.flatnonzero(przekroj).tolist()],
+            'przepustowosc': przepustowosc,
+        }
+    
+    def sprawdz_przeplyw(self, tolerancja: Optional[float] = None) -> Dict:
+        """
+        Sprawdza ograniczenia przepustowości i zachowanie przepływu dla całej sieci naraz.
+        
+        Returns:
+            Słownik z weryfikacja.sprawdz_przeplyw ('poprawny', 'wartosc' i naruszenia)
+        """
+        self._synchronizuj_przeplyw()
+        source, sink = self._konce
+        return sprawdz_przeplyw(self.siec, source=source, sink=sink, tolerancja=tolerancja)
+    
+    def zapisz_raport(self, sciezka: str) -> Dict:
+        """
+        Zapisuje przepływ i wykorzystanie każdej krawędzi do CSV (porcjami).
+        
+        Returns:
+            Podsumowanie: histogram wykorzystania, liczby krawędzi nasyconych i niewykorzystanych
+        """
+        self._synchronizuj_przeplyw()
+        return zapisz_raport_csv(self.siec, sciezka)
+    
+    def zmien_przepustowosc(self, u: str, v: str, capacity: int):
+        """
+        Zmienia przepustowość krawędzi (u, v), zachowując bieżący przepływ.
+        
+        Gdy nowa przepustowość jest mniejsza od przepływu, nadmiar jest
+        przekierowywany ścieżkami rezydualnymi z u do v, a jeśli się nie da -
+        odsyłany do źródła (i odpowiednio odbierany z v). Przepływ pozostaje
+        dopuszczalny, więc kolejne znajdz_maksymalny_przeplyw() startuje od niego
+        zamiast od zera. Historia i licznik iteracji dotyczą obliczeń od
+        ostatniej zmiany sieci.
+        """
+        if capacity < 0:
+            raise ValueError("Przepustowość nie może być ujemna")
+        e = self._krawedz(u, v)
+        if self._rezydualna is None:
+            self._inicjalizuj_siec_rezydualna()
+        self._wyczysc_historie()
+        
+        siec = self.siec
+        if not siec.przepustowosci.flags.writeable:
+            siec.przepustowosci = siec.przepustowosci.copy()  # np. tablica odwzorowana z pliku
+        siec.przepustowosci[e] = capacity
+        self._original_graph = None
+        
+        przod, tyl = int(siec.luk_przod[e]), int(siec.luk_tyl[e])
+        przeplyw = self._rezydualna[tyl]
+        if capacity >= przeplyw:
+            self._rezydualna[przod] = capacity - przeplyw
+            self._po_zmianie_przeplywu()
+            return
+        
+        # Przepływ przekracza przepustowość: u zostaje z nadmiarem, v z niedoborem
+        self._rezydualna[przod] = 0
+        self._rezydualna[tyl] = capacity
+        self._po_zmianie_przeplywu()
+        self.dziennik(ITERACJE, f"Przepływ {u} -> {v} obniżony z {przeplyw} do {capacity} - naprawiam przepływ")
+        self._napraw_przeplyw(self._indeks[u], self._indeks[v], przeplyw - capacity)
+    
+    def dodaj_krawedz(self, u: str, v: str, capacity: int):
+        """
+        Dodaje krawędź (u, v) (także z nowymi wierzchołkami) z zerowym przepływem.
+        
+        Bieżący przepływ pozostaje dopuszczalny; kolejne znajdz_maksymalny_przeplyw()
+        jedynie go powiększa.
+        
+        Raises:
+            ValueError: Gdy przepustowość jest ujemna albo krawędź (u, v) już
+                istnieje (jej przepustowość zmienia zmien_przepustowosc)
+        """
+        if capacity < 0:
+            raise ValueError("Przepustowość nie może być ujemna")
+        if self.siec.numer_krawedzi(u, v) is not None:
+            raise ValueError(f"Krawędź {u} -> {v} już istnieje - użyj zmien_przepustowosc")
+        self._synchronizuj_przeplyw()
+        siec = self.siec
+        
+        wezly = list(siec.wezly)
+        warstwy = siec.warstwy
+        for w in (u, v):
+            if w not in siec.indeks:
+                wezly.append(w)
+                warstwy = None  # nowy wierzchołek nie ma warstwy
+        indeks = siec.indeks if len(wezly) == siec.n else {w: i for i, w in enumerate(wezly)}
+        
+        self._przebuduj_siec(SiecCSR(
+            wezly,
+            np.append(siec.zrodla, indeks[u]),
+            np.append(siec.cele, indeks[v]),
+            np.append(siec.przepustowosci, capacity),
+            warstwy=warstwy,
+            przeplyw=np.append(siec.przeplyw, 0)))
+    
+    def usun_krawedz(self, u: str, v: str):
+        """Usuwa krawędź (u, v); płynący nią przepływ jest najpierw naprawiany jak przy przepustowości 0."""
+        e = self._krawedz(u, v)
+        self.zmien_przepustowosc(u, v, 0)
+        self._synchronizuj_przeplyw()
+        siec = self.siec
+        
+        zostaja = np.arange(siec.m) != e
+        self._przebuduj_siec(SiecCSR(
+            siec.wezly,
+            siec.zrodla[zostaja],
+            siec.cele[zostaja],
+            siec.przepustowosci[zostaja],
+            warstwy=siec.warstwy,
+            przeplyw=siec.przeplyw[zostaja]))
+    
+    def _krawedz(self, u: str, v: str) -> int:
+        """Numer krawędzi (u, v) w sieci."""
+        e = self.siec.numer_krawedzi(u, v)
+        if e is None:
+            raise ValueError(f"Brak krawędzi {u} -> {v}")
+        return e
+    
+    def _przebuduj_siec(self, siec: SiecCSR):
+        """Podmienia sieć po zmianie topologii (przepływ jest już zapisany w nowej sieci)."""
+        self.siec = siec
+        self._rezydualna = None
+        self._przeplyw_aktualny = True
+        self._flow_dict = None
+        self._original_graph = None
+        self._wyczysc_historie()
+    
+    def _wyczysc_historie(self):
+        """Zmiana sieci unieważnia zapisane ścieżki - historia zaczyna się od nowa."""
+        self.iterations = []
+        self._punkty_kontrolne = {}
+        self.liczba_iteracji = 0
+        self.odwiedzone_wierzcholki = 0
+        self.fazy_skalowania = []
+        self._sciezki_w_historii = True
+    
+    def _napraw_przeplyw(self, u: int, v: int, ilosc):
+        """
+        Usuwa nadmiar ilosc z u i niedobór ilosc z v (po obniżeniu przepustowości u -> v).
+        
+        Nadmiar u płynie ścieżkami rezydualnymi do v (przekierowanie bez zmiany
+        wartości przepływu), a reszta do źródła lub ujścia; pozostały niedobór v
+        jest pokrywany ścieżką rezydualną ze źródła lub ujścia. Rozkład
+        poprzedniego przepływu na ścieżki i cykle gwarantuje, że takie ścieżki
+        istnieją.
+        """
+        s, t = (self._indeks[w] for w in self._konce)
+        nadmiar = 0 if u in (s, t) else ilosc
+        niedobor = 0 if v in (s, t) else ilosc
+        
+        while nadmiar > 0:
+            cele = {s, t} | ({v} if niedobor > 0 else set())
+            path_arcs, koniec = self._sciezka_rezydualna(u, cele, wstecz=False)
+            if path_arcs is None:
+                raise RuntimeError("Nie można odprowadzić nadmiaru przepływu z wierzchołka "
+                                   f"{self._wezly[u]}")
+            bottleneck = min(nadmiar, min(self._rezydualna[arc] for arc in path_arcs))
+            self._powieksz_przeplyw(path_arcs, bottleneck)
+            nadmiar -= bottleneck
+            if koniec == v:
+                niedobor -= bottleneck
+        
+        while niedobor > 0:
+            path_arcs, _ = self._sciezka_rezydualna(v, {s, t}, wstecz=True)
+            if path_arcs is None:
+                raise RuntimeError(f"Nie można pokryć niedoboru przepływu w wierzchołku {self._wezly[v]}")
+            bottleneck = min(niedobor, min(self._rezydualna[arc] for arc in path_arcs))
+            self._powieksz_przeplyw(path_arcs, bottleneck)
+            niedobor -= bottleneck
+    
+    def _sciezka_rezydualna(self, start: int, cele: Set[int],
+                            wstecz: bool) -> Tuple[Optional[List[int]], Optional[int]]:
+        """
+        BFS w sieci rezydualnej: ścieżka ze start do najbliższego z cele, a dla
+        wstecz=True - ścieżka z najbliższego z cele do start.
+        
+        Returns:
+            (łuki ścieżki w kierunku przepływu, osiągnięty wierzchołek) lub (None, None)
+        """
+        glowa, rezydualna, poczatki = self._glowa, self._rezydualna, self._poczatki
+        odwrotny = self._odwrotny
+        queue = deque([start])
+        parent_arc = {start: None}
+        
+        while queue:
+            current = queue.popleft()
+            if current in cele and current != start:
+                path_arcs = []
+                w = current
+                while parent_arc[w] is not None:
+                    arc = parent_arc[w]
+                    path_arcs.append(arc)
+                    # Łuk prowadzi od rodzica do w (wstecz: od w do rodzica)
+                    w = glowa[arc] if wstecz else glowa[odwrotny[arc]]
+                if not wstecz:
+                    path_arcs.reverse()
+                return path_arcs, current
+            
+            for arc in range(poczatki[current], poczatki[current + 1]):
+                neighbor = glowa[arc]
+                # Wstecz szukamy łuków wchodzących do current, czyli łuków odwrotnych do wychodzących
+                luk = odwrotny[arc] if wstecz else arc
+                if rezydualna[luk] > 0 and neighbor not in parent_arc:
+                    parent_arc[neighbor] = luk
+                    queue.append(neighbor)
+        
+        return None, None
+    
+    def zapisz_siec(self, sciezka: str):
+        """Zapisuje sieć wraz z obliczonym przepływem w formacie binarnym (format_binarny)."""
+        self._synchronizuj_przeplyw()
+        zapisz_siec(self.siec, sciezka, z_przeplywem=True)
+    
     def wizualizuj_wynik(self, pozycje: Dict = None, figsize: Tuple[int, int] = (14, 10), 
-                        save_file: str = None):
-        """Wizualizuje sieć z maksymalnym przepływem."""
+                        save_file: str = None, tryb: str = 'auto', pokaz: Optional[bool] = None,
+                        dpi: Optional[int] = None):
+        """
+        Wizualizuje sieć z maksymalnym przepływem.
+        
+        Args:
+            pozycje: Pozycje wierzchołków (domyślnie układ warstwowy z modułu
+                uklad_warstwowy - warstwy generatora albo odległości BFS od źródła)
+            figsize: Rozmiar rysunku w calach
+            save_file: Plik, do którego zapisać rysunek (opcjonalnie)
+            tryb: 'networkx' (strzałki i etykiety f/c każdej krawędzi), 'szybki'
+                (moduł rysowanie - krawędzie hurtowo według nasycenia, w dużych
+                sieciach etykiety tylko krawędzi nasyconych) lub 'auto' - szybki
+                dla sieci ponad PROG_RYSOWANIA_NX krawędzi
+            pokaz: Czy pokazać okno; domyślnie tylko bez save_file (rysunek
+                zapisywany do pliku jest potem zamykany)
+            dpi: Rozdzielczość zapisu (domyślnie 300 w trybie networkx, 150 w szybkim)
+        """
+        # Moduły rysowania są ładowane dopiero tutaj - same obliczenia potrzebują tylko NumPy
+        from rysowanie import czy_szybki, rysuj_siec
+        if pokaz is None:
+            pokaz = not save_file
+        
+        # Układ warstwowy jest zapamiętywany dla sieci - kolejne rysunki go nie liczą
+        source, sink = self._konce
+        if czy_szybki(tryb, self.siec.m):
+            self._synchronizuj_przeplyw()
+            if pozycje is None:
+                pozycje = uklad_warstwowy(self.siec, source, sink)
+            rysuj_siec(self.siec, pozycje, przeplyw=self.siec.przeplyw,
+                       tytul=f'Maksymalny przepływ w sieci\n|f_max| = {self.max_flow_value}',
+                       save_file=save_file, pokaz=pokaz,
+                       figsize=figsize, dpi=dpi or 150)
+            if save_file:
+                self.dziennik(PODSUMOWANIE, f"Wykres zapisano do pliku: {save_file}")
+            return
+        
+        import networkx as nx
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+        
         plt.figure(figsize=figsize)
         
-        # Jeśli nie podano pozycji, użyj układu spring
         if pozycje is None:
-            pozycje = nx.spring_layout(self.original_graph, seed=42)
+            pozycje = dict(zip(self.siec.wezly, uklad_warstwowy(self.siec, source, sink).tolist()))
         
         # Rysuj wierzchołki
         node_colors = []
@@ -263,10 +1473,13 @@ class FordFulkerson:
         plt.tight_layout()
         
         if save_file:
-            plt.savefig(save_file, dpi=300, bbox_inches='tight')
-            print(f"Wykres zapisano do pliku: {save_file}")
+            plt.savefig(save_file, dpi=dpi or 300, bbox_inches='tight')
+            self.dziennik(PODSUMOWANIE, f"Wykres zapisano do pliku: {save_file}")
         
-        plt.show()
+        if pokaz:
+            plt.show()
+        else:
+            plt.close()
     
     def wypisz_statystyki(self):
         """Wypisuje szczegółowe statystyki przepływu."""
@@ -275,44 +1488,66 @@ class FordFulkerson:
         print("="*60)
         
         print(f"Wartość maksymalnego przepływu: {self.max_flow_value}")
-        print(f"Liczba iteracji algorytmu: {len(self.iterations)}")
+        print(f"Liczba iteracji algorytmu: {self.liczba_iteracji}")
         
-        print("\nPrzepływy na krawędziach:")
-        total_capacity = 0
-        used_capacity = 0
+        if self.fazy_skalowania:
+            print(f"Liczba faz skalowania przepustowości: {len(self.fazy_skalowania)}")
+            for faza in self.fazy_skalowania:
+                print(f"  delta={faza['delta']}: {faza['augmentations']} powiększeń")
         
-        for u, v in self.original_graph.edges():
-            capacity = self.original_graph[u][v]['capacity']
-            flow = self.flow.get((u, v), 0)
-            utilization = (flow / capacity * 100) if capacity > 0 else 0
-            
-            total_capacity += capacity
-            used_capacity += flow
-            
-            status = ""
-            if flow == 0:
-                status = " (niewykorzystana)"
-            elif flow == capacity:
-                status = " (NASYCONA)"
-            
-            print(f"  {u} -> {v}: {flow}/{capacity} ({utilization:.1f}%){status}")
+        print("\nCzasy faz i liczniki operacji:")
+        print(self.statystyki)
         
-        overall_utilization = (used_capacity / total_capacity * 100) if total_capacity > 0 else 0
-        print(f"\nOgólne wykorzystanie sieci: {used_capacity}/{total_capacity} ({overall_utilization:.1f}%)")
+        self._synchronizuj_przeplyw()
+        siec = self.siec
+        podsumowanie = podsumowanie_wykorzystania(siec)
+        if siec.m <= PROG_WYPISYWANIA_KRAWEDZI:
+            print("\nPrzepływy na krawędziach:")
+            przeplyw = siec.przeplyw.tolist()
+            przepustowosci = siec.przepustowosci.tolist()
+            for (u, v), flow, capacity in zip(siec.nazwy_krawedzi(), przeplyw, przepustowosci):
+                utilization = (flow / capacity * 100) if capacity > 0 else 0
+                
+                status = ""
+                if flow == 0:
+                    status = " (niewykorzystana)"
+                elif flow == capacity:
+                    status = " (NASYCONA)"
+                
+                print(f"  {u} -> {v}: {flow}/{capacity} ({utilization:.1f}%){status}")
+        else:
+            print(f"\nKrawędzie ({siec.m}): nasycone {podsumowanie['nasycone']}, "
+                  f"częściowo wykorzystane {podsumowanie['czesciowo']}, "
+                  f"niewykorzystane {podsumowanie['niewykorzystane']} (szczegóły: zapisz_raport)")
+            granice = podsumowanie['granice_histogramu']
+            for i, liczba in enumerate(podsumowanie['histogram']):
+                print(f"  wykorzystanie {granice[i] * 100:3.0f}-{granice[i + 1] * 100:3.0f}%: {liczba}")
         
-        # Sprawdź warunek zachowania przepływu
+        used_capacity, total_capacity = podsumowanie['suma_przeplywow'], podsumowanie['suma_przepustowosci']
+        print(f"\nOgólne wykorzystanie sieci: {used_capacity}/{total_capacity} "
+              f"({podsumowanie['wykorzystanie'] * 100:.1f}%)")
+        
+        # Sprawdź warunek zachowania przepływu (wszystkie wierzchołki naraz)
         print("\nSprawdzenie warunku zachowania przepływu:")
-        for node in self.original_graph.nodes():
-            if node in ['s', 't']:
-                continue
-            
-            inflow = sum(self.flow.get((u, node), 0) for u in self.original_graph.predecessors(node))
-            outflow = sum(self.flow.get((node, v), 0) for v in self.original_graph.successors(node))
-            
-            if inflow == outflow:
-                print(f"  {node}: ✓ wpływ={inflow}, wypływ={outflow}")
+        source, sink = self._konce
+        if siec.n <= PROG_WYPISYWANIA_KRAWEDZI:
+            wplyw, wyplyw = bilans_wierzcholkow(siec)
+            for node, inflow, outflow in zip(siec.wezly, wplyw.tolist(), wyplyw.tolist()):
+                if node in (source, sink):
+                    continue
+                if inflow == outflow:
+                    print(f"  {node}: ✓ wpływ={inflow}, wypływ={outflow}")
+                else:
+                    print(f"  {node}: ✗ wpływ={inflow}, wypływ={outflow} (BŁĄD!)")
+        else:
+            wynik = self.sprawdz_przeplyw()
+            if wynik['poprawny']:
+                print(f"  ✓ wszystkie {siec.n - 2} wierzchołki pośrednie i {siec.m} krawędzi poprawne")
             else:
-                print(f"  {node}: ✗ wpływ={inflow}, wypływ={outflow} (BŁĄD!)")
+                print(f"  ✗ naruszenia przepustowości: {wynik['liczba_naruszen_przepustowosci']}, "
+                      f"naruszenia bilansu: {wynik['liczba_naruszen_bilansu']} (BŁĄD!)")
+                for node, inflow, outflow in wynik['naruszenia_bilansu'][:10]:
+                    print(f"  {node}: ✗ wpływ={inflow}, wypływ={outflow}")
     
     def wypisz_historie_iteracji(self):
         """Wypisuje historię iteracji algorytmu."""
@@ -320,20 +1555,28 @@ class FordFulkerson:
         print("HISTORIA ITERACJI ALGORYTMU")
         print("="*60)
         
+        if self.history == 'off':
+            print(f"Historia iteracji wyłączona (wykonano {self.liczba_iteracji} iteracji)")
+            return
+        
         for iter_data in self.iterations:
             print(f"\nIteracja {iter_data['iteration']}:")
-            print(f"  Ścieżka powiększająca: {' -> '.join(iter_data['path'])}")
+            print(f"  Ścieżka powiększająca: {' -> '.join(map(str, iter_data['path']))}")
             print(f"  Przepustowość rezydualna: {iter_data['bottleneck']}")
             
-            # Pokaż zmiany w przepływie
+            # Pokaż zmiany w przepływie (łuki wsteczne cofają przepływ krawędzi)
             print("  Zmiany w przepływie:")
-            path = iter_data['path']
-            for i in range(len(path) - 1):
-                u, v = path[i], path[i + 1]
-                if self.original_graph.has_edge(u, v):
+            for arc in iter_data['arcs']:
+                u, v = self._nazwa_krawedzi(self._krawedz_luku[arc])
+                if self._w_przod[arc]:
                     print(f"    {u} -> {v}: +{iter_data['bottleneck']}")
                 else:
-                    print(f"    {v} -> {u}: -{iter_data['bottleneck']} (cofanie)")
+                    print(f"    {u} -> {v}: -{iter_data['bottleneck']} (cofanie)")
+
+
+class Dinic(FordFulkerson):
+    """Algorytm Dinica z tym samym interfejsem wyników co FordFulkerson."""
+    domyslny_algorytm = 'dinic'
 
 
 def demonstracja_algorytmu():
@@ -380,6 +1623,7 @@ def test_na_prostej_sieci():
     print("="*60)
     
     # Utwórz prostą sieć testową
+    import networkx as nx
     G = nx.DiGraph()
     G.add_edge('s', 'a', capacity=10)
     G.add_edge('s', 'b', capacity=8)